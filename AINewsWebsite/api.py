@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+News API - JSON API for the published report and the article archive
+
+A WSGI application with three read-only endpoints:
+
+    GET /api/report      the latest published report (report_data layout)
+    GET /api/articles    archived articles filtered by day, date range,
+                         category and source, newest first
+    GET /api/search      full-text search over the archive, best matches first
+
+Responses are JSON with a strong ETag, Cache-Control and, when the client
+accepts it, gzip. Each response is built once and kept in memory until the
+generator writes a new report or updates the article store.
+
+Run it with `python api.py`, or with any WSGI server as `api:application`.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from datetime import date
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qsl, urlencode
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from article_archive import ARCHIVE_DIR, ARCHIVE_STORE_PATH, readable_store_path
+from article_store import CATEGORIES, DEFAULT_ARTICLE_DB, ReopeningStore
+from report_data import REPORT_DATA_PATH, load_report, report_version
+
+logger = logging.getLogger("ai_news_api")
+
+REPORT_PATH = "daily_ai_news_report.md"
+API_HOST = "127.0.0.1"
+API_PORT = 8000
+# Seconds a client or proxy may reuse a response before revalidating its ETag
+API_MAX_AGE = 300
+# Responses kept in memory, least recently used dropped first
+API_CACHE_ENTRIES = 512
+# Articles per page for /api/articles and /api/search
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+# Bodies shorter than this are sent uncompressed
+GZIP_MIN_SIZE = 512
+
+STATUS_TEXT = {
+    200: "200 OK",
+    304: "304 Not Modified",
+    400: "400 Bad Request",
+    404: "404 Not Found",
+    405: "405 Method Not Allowed",
+    500: "500 Internal Server Error",
+}
+
+# A JSON body with its ETag and optional gzip copy, ready to send
+Response = namedtuple("Response", ["status", "etag", "body", "gzip_body"])
+
+def json_response(data, status=200):
+    """
+    Serialize a response body once, with its ETag and gzip copy
+
+    Args:
+        data: JSON-serializable body
+        status: HTTP status code
+
+    Returns:
+        Response
+    """
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = hashlib.sha256(body).hexdigest()[:32]
+    gzip_body = gzip.compress(body, compresslevel=6, mtime=0) if len(body) >= GZIP_MIN_SIZE else None
+    return Response(status, etag, body, gzip_body)
+
+def accepts_gzip(header):
+    """Whether an Accept-Encoding header allows a gzip response"""
+    for part in header.split(","):
+        name, _, params = part.partition(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().lower()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+def etag_matches(header, etag):
+    """Whether an If-None-Match header lists the ETag, compared weakly as RFC 9110 requires"""
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+class NewsAPI:
+    """
+    WSGI application serving the report and the article archive as JSON
+
+    Before each request the report and article store files are checked with
+    stat(); when either has changed since the last request, every cached
+    response is dropped and the store is reopened if its file was replaced.
+    Without the daily job's database the store is rebuilt from the published
+    archive (article_archive.readable_store_path).
+    """
+
+    def __init__(self, report_path=REPORT_DATA_PATH, markdown_path=REPORT_PATH, db_path=DEFAULT_ARTICLE_DB,
+                 archive_dir=ARCHIVE_DIR, archive_store_path=ARCHIVE_STORE_PATH,
+                 cache_entries=API_CACHE_ENTRIES, max_age=API_MAX_AGE):
+        """
+        Create the application; nothing is read until the first request
+
+        Args:
+            report_path: Report artifact written by the generator
+            markdown_path: Markdown report used when the artifact does not exist
+            db_path: Article store database
+            archive_dir: Published article archive, used where db_path does not exist
+            archive_store_path: Database rebuilt from the published archive
+            cache_entries: Responses kept in memory, 0 to build every response
+            max_age: Cache-Control max-age of successful responses, in seconds
+        """
+        self.report_path = report_path
+        self.markdown_path = markdown_path
+        self.db_path = db_path
+        self.archive_dir = archive_dir
+        self.archive_store_path = archive_store_path
+        self.cache_entries = cache_entries
+        self.max_age = max_age
+        self._routes = {
+            "/api/report": self._report,
+            "/api/articles": self._articles,
+            "/api/search": self._search,
+        }
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._version = None
+        self._store = ReopeningStore()
+
+    def __call__(self, environ, start_response):
+        method = environ["REQUEST_METHOD"]
+        handler = self._routes.get(environ.get("PATH_INFO", "").rstrip("/"))
+        if handler is None:
+            response = json_response({"error": "Not found"}, 404)
+        elif method not in ("GET", "HEAD"):
+            response = json_response({"error": "Only GET and HEAD are supported"}, 405)
+        else:
+            response = self._get(handler, environ)
+        return self._send(response, environ, start_response)
+
+    def _get(self, handler, environ):
+        """Return the cached response for a request, building it on a miss"""
+        params = sorted(parse_qsl(environ.get("QUERY_STRING", "")))
+        key = (environ["PATH_INFO"].rstrip("/"), urlencode(params))
+        version = self._published_version()
+        with self._lock:
+            if version != self._version:
+                self._cache.clear()
+                self._version = version
+            response = self._cache.get(key)
+            if response is not None:
+                self._cache.move_to_end(key)
+                return response
+
+        try:
+            response = json_response(handler(params))
+        except ValueError as e:
+            return json_response({"error": str(e)}, 400)
+        except FileNotFoundError as e:
+            return json_response({"error": str(e)}, 404)
+        except Exception as e:
+            logger.error(f"Error serving {key[0]}?{key[1]}: {e}")
+            return json_response({"error": "Internal error"}, 500)
+
+        if self.cache_entries > 0:
+            with self._lock:
+                # Only keep it if nothing was published while it was built
+                if version == self._version:
+                    self._cache[key] = response
+                    while len(self._cache) > self.cache_entries:
+                        self._cache.popitem(last=False)
+        return response
+
+    def _send(self, response, environ, start_response):
+        """Send a response, compressed or as 304 Not Modified when the client allows it"""
+        body, etag = response.body, response.etag
+        headers = [("Content-Type", "application/json; charset=utf-8"), ("Vary", "Accept-Encoding")]
+        if response.gzip_body is not None and accepts_gzip(environ.get("HTTP_ACCEPT_ENCODING", "")):
+            # Each encoding is a different representation with its own strong ETag
+            body, etag = response.gzip_body, f"{etag}-gz"
+            headers.append(("Content-Encoding", "gzip"))
+        etag = f'"{etag}"'
+
+        if response.status != 200:
+            headers.append(("Cache-Control", "no-store"))
+            status = response.status
+        else:
+            headers += [("ETag", etag), ("Cache-Control", f"public, max-age={self.max_age}")]
+            status = 200
+            if etag_matches(environ.get("HTTP_IF_NONE_MATCH", ""), etag):
+                status, body = 304, b""
+                headers = [header for header in headers if header[0] != "Content-Type"]
+
+        if status != 304:
+            headers.append(("Content-Length", str(len(body))))
+        start_response(STATUS_TEXT[status], headers)
+        return [] if environ["REQUEST_METHOD"] == "HEAD" or status == 304 else [body]
+
+    def _published_version(self):
+        """Identify the published report and article store; changes when the generator writes either"""
+        try:
+            report = report_version(self.report_path, markdown_path=self.markdown_path)
+        except FileNotFoundError:
+            report = None
+        store = None
+        path = self._store_path()
+        if path is not None:
+            try:
+                stat = os.stat(path)
+                store = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                pass
+        return report, store
+
+    def _store_path(self):
+        """The article store database, or one rebuilt from the published archive; None without either"""
+        return readable_store_path(self.db_path, self.archive_dir, self.archive_store_path)
+
+    def _open_store(self):
+        """Return the article store, reopened and the old one closed when the database file has been replaced"""
+        path = self._store_path()
+        try:
+            if path is None:
+                raise FileNotFoundError()
+            return self._store.get(path)
+        except FileNotFoundError:
+            raise FileNotFoundError("No article archive has been published")
+
+    def _report(self, params):
+        try:
+            return load_report(self.report_path, markdown_path=self.markdown_path)
+        except FileNotFoundError:
+            raise FileNotFoundError("No report has been published")
+
+    def _articles(self, params):
+        filters = archive_filters(params)
+        day = single(params, "day")
+        if day:
+            filters["scraped_on"] = parse_date(day, "day")
+        limit, offset = page(params)
+        store = self._open_store()
+        return {
+            "total": store.count(**filters),
+            "limit": limit,
+            "offset": offset,
+            "articles": store.query(limit=limit, offset=offset, **filters),
+        }
+
+    def _search(self, params):
+        text = single(params, "q")
+        if not text or not text.strip():
+            raise ValueError("The q parameter is required")
+        limit, offset = page(params)
+        results = self._open_store().search(text, limit=limit, offset=offset, **archive_filters(params))
+        return {"query": text, "limit": limit, "offset": offset, "results": results}
+
+def single(params, name):
+    """Value of a query parameter that may be given once, or None"""
+    values = [value for key, value in params if key == name]
+    if len(values) > 1:
+        raise ValueError(f"The {name} parameter may only be given once")
+    return values[0] if values else None
+
+def multiple(params, name):
+    """Values of a repeatable query parameter, also split on commas"""
+    return [item.strip() for key, value in params if key == name for item in value.split(",") if item.strip()]
+
+def parse_date(value, name):
+    """Check a YYYY-MM-DD query parameter"""
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise ValueError(f"The {name} parameter must be a date like 2025-01-31")
+
+def archive_filters(params):
+    """Date range, category and source filters shared by /api/articles and /api/search"""
+    filters = {}
+    for name, argument in (("start", "start_date"), ("end", "end_date")):
+        value = single(params, name)
+        if value:
+            filters[argument] = parse_date(value, name)
+    categories = multiple(params, "category")
+    unknown = [category for category in categories if category not in CATEGORIES]
+    if unknown:
+        raise ValueError(f"Unknown category {unknown[0]}; expected one of {', '.join(CATEGORIES)}")
+    if categories:
+        filters["categories"] = categories
+    sources = multiple(params, "source")
+    if sources:
+        filters["sources"] = sources
+    return filters
+
+def page(params):
+    """Check the limit and offset query parameters"""
+    try:
+        limit = int(single(params, "limit") or DEFAULT_LIMIT)
+        offset = int(single(params, "offset") or 0)
+    except ValueError:
+        raise ValueError("The limit and offset parameters must be integers")
+    if not 1 <= limit <= MAX_LIMIT or offset < 0:
+        raise ValueError(f"The limit must be between 1 and {MAX_LIMIT} and the offset at least 0")
+    return limit, offset
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    """WSGI server handling each request in its own thread"""
+    daemon_threads = True
+
+class QuietRequestHandler(WSGIRequestHandler):
+    """Request handler logging requests at debug level instead of to stderr"""
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+def serve(api, host=API_HOST, port=API_PORT):
+    """
+    Create a threaded HTTP server for the API
+
+    Args:
+        api: NewsAPI application
+        host: Interface to listen on
+        port: Port to listen on, 0 for any free port
+
+    Returns:
+        The server; call serve_forever() on it
+    """
+    return make_server(host, port, api, server_class=ThreadingWSGIServer, handler_class=QuietRequestHandler)
+
+# Entry point for WSGI servers, e.g. gunicorn api:application
+application = NewsAPI()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the AI news JSON API")
+    parser.add_argument("--host", default=API_HOST, help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=API_PORT, help="Port to listen on")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    server = serve(application, args.host, args.port)
+    logger.info(f"Serving the news API on http://{args.host}:{server.server_port}/api/report")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Article Archive - Git-friendly copy of the article store, one JSON Lines file per day
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+
+from article_store import DEFAULT_ARTICLE_DB, ArticleStore
+
+logger = logging.getLogger("ai_news_generator.archive")
+
+# Directory published with the report: one YYYY-MM-DD.jsonl shard per day the
+# articles were scraped on, and an index of the shards
+ARCHIVE_DIR = "archive"
+ARCHIVE_INDEX = "index.json"
+ARCHIVE_VERSION = 1
+# Store rebuilt from the archive where the daily job's database does not
+# exist, e.g. on the deployed website
+ARCHIVE_STORE_PATH = ".archive_store.sqlite3"
+
+_rebuild_lock = threading.Lock()
+
+def shard_path(directory, day):
+    """Path of the shard holding the articles first scraped on a day"""
+    return os.path.join(directory, f"{day}.jsonl")
+
+def read_index(directory=ARCHIVE_DIR):
+    """
+    Read the archive index
+
+    Args:
+        directory: Archive directory
+
+    Returns:
+        Dictionary with the archive version and, under "days", the article
+        count and SHA-256 of each shard; None if no archive has been published
+    """
+    try:
+        with open(os.path.join(directory, ARCHIVE_INDEX), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def _write_atomic(path, data):
+    """Write bytes to a file through a temporary file, so readers never see it half written"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+def export_archive(store, directory=ARCHIVE_DIR, run_id=None):
+    """
+    Write the store's articles to the archive, rewriting only the shards that changed
+
+    The days of the latest run are exported, since its articles may have
+    moved from older days' runs, along with every day whose article count
+    differs from the index. A shard is only written when its content hash
+    changed, so unchanged days are never touched and git sees no change.
+    Shards of days no longer in the store are removed.
+
+    Args:
+        store: ArticleStore to export
+        directory: Archive directory, created if needed
+        run_id: Run whose days are exported, defaults to the latest run
+
+    Returns:
+        List of the shard files written or removed
+    """
+    os.makedirs(directory, exist_ok=True)
+    index = read_index(directory) or {"version": ARCHIVE_VERSION, "days": {}}
+    days = index["days"]
+    counts = store.day_counts()
+    stale = {day for day, count in counts.items() if days.get(day, {}).get("articles") != count}
+    run_id = run_id or store.latest_run_id()
+    if run_id is not None:
+        stale.update(store.run_days(run_id))
+
+    changed = []
+    for day in sorted(stale):
+        records = store.day_records(day)
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records).encode("utf-8")
+        entry = {"articles": len(records), "sha256": hashlib.sha256(data).hexdigest()}
+        path = shard_path(directory, day)
+        if days.get(day) != entry or not os.path.exists(path):
+            _write_atomic(path, data)
+            changed.append(path)
+        days[day] = entry
+    for day in sorted(set(days) - set(counts)):
+        path = shard_path(directory, day)
+        if os.path.exists(path):
+            os.remove(path)
+        changed.append(path)
+        del days[day]
+
+    if changed or not os.path.exists(os.path.join(directory, ARCHIVE_INDEX)):
+        index = {"version": ARCHIVE_VERSION, "days": dict(sorted(days.items()))}
+        _write_atomic(os.path.join(directory, ARCHIVE_INDEX), (json.dumps(index, indent=1) + "\n").encode("utf-8"))
+    logger.info(f"Archive: {len(changed)} of {len(days)} day shards changed in {directory}")
+    return changed
+
+def import_archive(store, directory=ARCHIVE_DIR):
+    """
+    Restore the articles of a published archive into a store
+
+    Args:
+        store: ArticleStore to restore into; articles already stored are updated
+        directory: Archive directory
+
+    Returns:
+        Number of articles restored, 0 if no archive has been published
+    """
+    index = read_index(directory)
+    if index is None:
+        return 0
+    restored = 0
+    for day in sorted(index["days"]):
+        with open(shard_path(directory, day), "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        restored += store.restore_articles(records)
+    logger.info(f"Restored {restored} articles from {len(index['days'])} day shards in {directory}")
+    return restored
+
+def readable_store_path(db_path=DEFAULT_ARTICLE_DB, directory=ARCHIVE_DIR, store_path=ARCHIVE_STORE_PATH):
+    """
+    Return the article database readers should open, or None if no archive has been published
+
+    The daily job's database is used where it exists. Elsewhere, e.g. on the
+    deployed website, a database is rebuilt from the published archive into
+    store_path, again whenever the archive index is newer than it; the
+    rebuilt file replaces the old one, so ReopeningStore picks it up.
+
+    Args:
+        db_path: Article store database written by the daily job
+        directory: Published archive directory
+        store_path: Database rebuilt from the archive
+
+    Returns:
+        Path of the database to open read-only, or None
+    """
+    if os.path.exists(db_path):
+        return db_path
+    try:
+        index_mtime = os.stat(os.path.join(directory, ARCHIVE_INDEX)).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    with _rebuild_lock:
+        try:
+            current = os.stat(store_path).st_mtime_ns >= index_mtime
+        except FileNotFoundError:
+            current = False
+        if not current:
+            # A unique temporary file, in case another process rebuilds at the same time
+            fd, temp_path = tempfile.mkstemp(suffix=".sqlite3", dir=os.path.dirname(os.path.abspath(store_path)))
+            os.close(fd)
+            try:
+                store = ArticleStore(temp_path)
+                try:
+                    import_archive(store, directory)
+                finally:
+                    store.close()
+                os.replace(temp_path, store_path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+    return store_path
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+Article Store - SQLite history of every scraped article, queryable by date, source and category
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger("ai_news_scraper.store")
+
+DEFAULT_ARTICLE_DB = "ai_news_articles.sqlite3"
+
+# Report sections in display order
+CATEGORIES = ("general", "defense_security", "tools_innovations")
+CATEGORY_TITLES = {
+    "general": "General AI News",
+    "defense_security": "AI in Defense and Security",
+    "tools_innovations": "Important Tools and Innovations",
+}
+
+ARTICLE_COLUMNS = ("title", "content", "url", "source", "date", "category", "scraped_on", "run_id")
+
+# PRAGMA user_version of the current schema; 1 indexes full article texts
+# instead of the stored excerpts
+SCHEMA_VERSION = 1
+
+# Search ranking weights for the title and full text columns; a match in the
+# title counts for more than one in the body
+TITLE_WEIGHT = 5.0
+CONTENT_WEIGHT = 1.0
+# Tokens of context around the matches in a search snippet
+SNIPPET_TOKENS = 24
+# Default markers around matched terms in snippets
+SNIPPET_MARKERS = ("[", "]")
+
+_SEARCH_TERM_RE = re.compile(r"\w+\*?")
+
+def fts_query(text):
+    """
+    Turn free text into an FTS5 query matching articles that contain every word
+
+    Punctuation is ignored, so user input never causes an FTS5 syntax error;
+    a trailing * on a word matches it as a prefix.
+
+    Args:
+        text: Search text, e.g. "drone swarm*"
+
+    Returns:
+        FTS5 query string, empty if the text has no words
+    """
+    terms = []
+    for term in _SEARCH_TERM_RE.findall(text):
+        prefix = term.endswith("*")
+        terms.append(f'"{term.rstrip("*")}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+class ArticleStore:
+    """
+    SQLite-backed store of scraped articles
+
+    Every run is recorded with the articles it produced, in report order, so
+    the latest report can be rebuilt from the store and older articles can be
+    queried by date range, source and category. The articles table keeps the
+    excerpt shown on the website; the full text of each article is indexed
+    for search in articles_fts as the article is upserted.
+    """
+
+    def __init__(self, path=DEFAULT_ARTICLE_DB, readonly=False):
+        """
+        Open or create a store
+
+        Args:
+            path: SQLite database file, or ":memory:" for a throwaway store
+            readonly: Open an existing database without ever writing to it,
+                for readers such as the website and the API; the schema is
+                not created or migrated
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        if readonly:
+            self._conn = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True,
+                                         check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            return
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        schema_version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if schema_version < SCHEMA_VERSION:
+            # The first index held only the excerpts, fed by triggers
+            self._conn.executescript("""
+                DROP TRIGGER IF EXISTS articles_fts_insert;
+                DROP TRIGGER IF EXISTS articles_fts_update;
+                DROP TRIGGER IF EXISTS articles_fts_delete;
+                DROP TABLE IF EXISTS articles_fts;
+            """)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                finished_at TEXT NOT NULL,
+                article_count INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY,
+                url TEXT NOT NULL UNIQUE,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                source TEXT NOT NULL,
+                date TEXT NOT NULL,
+                category TEXT NOT NULL,
+                scraped_on TEXT NOT NULL,
+                run_id TEXT NOT NULL,
+                position INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS articles_date ON articles (date);
+            CREATE INDEX IF NOT EXISTS articles_source ON articles (source, date);
+            CREATE INDEX IF NOT EXISTS articles_category ON articles (category, date);
+            CREATE INDEX IF NOT EXISTS articles_run ON articles (run_id, position);
+            CREATE INDEX IF NOT EXISTS articles_scraped_on ON articles (scraped_on, date, run_id, position);
+
+            -- Title and full text of each article, by articles.id; the full
+            -- text is only kept here, for search and its snippets
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (
+                title, body, tokenize = 'porter unicode61 remove_diacritics 2'
+            );
+            CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+                DELETE FROM articles_fts WHERE rowid = old.id;
+            END;
+        """)
+        if schema_version < SCHEMA_VERSION:
+            # Articles stored before full texts were indexed only have their excerpt
+            with self._conn:
+                self._conn.execute("INSERT INTO articles_fts (rowid, title, body) SELECT id, title, content FROM articles")
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def upsert_articles(self, articles, run_id=None):
+        """
+        Insert or update the articles of one run in a single transaction
+
+        An article whose URL is already stored is updated and moved to this run.
+        A run without articles is not recorded, so the latest run stays the
+        last one that found something. The full text of each article, read
+        from its TextSpool through ArticleInfo.full_text() or from a "text"
+        key, is indexed for search; only the excerpt is stored as content.
+
+        Args:
+            articles: ArticleInfo objects or article dictionaries, in report order
+            run_id: Run identifier, defaults to the current time
+
+        Returns:
+            The run identifier, or None if there were no articles
+        """
+        run_id = run_id or datetime.now().isoformat(timespec="seconds")
+        scraped_on = datetime.now().strftime("%Y-%m-%d")
+        rows, texts = [], []
+        for position, article in enumerate(articles):
+            if isinstance(article, dict):
+                text = article.get("text") or article["content"]
+            else:
+                text = article.full_text()
+                article = article.to_dict()
+            rows.append((
+                article["url"], article["title"], article["content"], article["source"],
+                article["date"], article["category"], scraped_on, run_id, position
+            ))
+            texts.append((article["url"], article["title"], text))
+        if not rows:
+            logger.info(f"No articles to store for run {run_id}")
+            return None
+
+        with self._lock, self._conn:
+            self._conn.executemany("""
+                INSERT INTO articles (url, title, content, source, date, category, scraped_on, run_id, position)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (url) DO UPDATE SET
+                    title = excluded.title, content = excluded.content, source = excluded.source,
+                    date = excluded.date, category = excluded.category,
+                    run_id = excluded.run_id, position = excluded.position
+            """, rows)
+            self._index_texts(texts)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO runs (run_id, finished_at, article_count) VALUES (?, ?, ?)",
+                (run_id, datetime.now().isoformat(timespec="seconds"), len(rows))
+            )
+        logger.info(f"Stored {len(rows)} articles for run {run_id} in {self.path}")
+        return run_id
+
+    def _index_texts(self, texts):
+        """Replace the search index entries of stored articles; callers hold the lock in a transaction"""
+        for url, title, text in texts:
+            article_id = self._conn.execute("SELECT id FROM articles WHERE url = ?", (url,)).fetchone()[0]
+            self._conn.execute("DELETE FROM articles_fts WHERE rowid = ?", (article_id,))
+            self._conn.execute("INSERT INTO articles_fts (rowid, title, body) VALUES (?, ?, ?)",
+                               (article_id, title, text))
+
+    def latest_run_id(self):
+        """Return the identifier of the most recent run with articles, or None if there is none"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT run_id FROM runs WHERE article_count > 0 ORDER BY run_id DESC LIMIT 1"
+            ).fetchone()
+        return row["run_id"] if row else None
+
+    def query(self, start_date=None, end_date=None, categories=None, sources=None, run_id=None,
+              scraped_on=None, limit=None, offset=0):
+        """
+        Find stored articles, newest first
+
+        Args:
+            start_date: Optional first publication date (YYYY-MM-DD), inclusive
+            end_date: Optional last publication date (YYYY-MM-DD), inclusive
+            categories: Optional list of categories to include
+            sources: Optional list of source names to include
+            run_id: Optional run identifier; articles of that run are returned
+                in report order
+            scraped_on: Optional day (YYYY-MM-DD) the articles were first scraped
+            limit: Optional maximum number of articles
+            offset: Number of matching articles to skip, for pagination
+
+        Returns:
+            List of article dictionaries
+        """
+        sql, params = self._where(start_date, end_date, categories, sources, run_id, scraped_on)
+        order = "position" if run_id is not None else "date DESC, run_id DESC, position"
+        sql = f"SELECT {', '.join(ARTICLE_COLUMNS)} FROM articles{sql} ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def search(self, text, start_date=None, end_date=None, categories=None, sources=None, limit=20,
+               offset=0, markers=SNIPPET_MARKERS):
+        """
+        Full-text search over article titles and full texts, best matches first
+
+        Every word of the search text must appear in the article; words are
+        stemmed, so "model" also finds "models". Results are ranked by BM25
+        with title matches weighted above matches in the text.
+
+        Args:
+            text: Search text, see fts_query()
+            start_date: Optional first publication date (YYYY-MM-DD), inclusive
+            end_date: Optional last publication date (YYYY-MM-DD), inclusive
+            categories: Optional list of categories to include
+            sources: Optional list of source names to include
+            limit: Maximum number of results
+            offset: Number of results to skip, for pagination
+            markers: Strings placed before and after each matched term in the snippet
+
+        Returns:
+            List of article dictionaries with an added "snippet" (full text
+            around the matches) and "rank" (lower is better)
+        """
+        match = fts_query(text)
+        if not match:
+            return []
+        where, params = self._where(start_date, end_date, categories, sources, None, None)
+        where = where.replace(" WHERE ", " AND ", 1)
+        columns = ", ".join(f"a.{column}" for column in ARTICLE_COLUMNS)
+        sql = f"""
+            SELECT {columns},
+                   snippet(articles_fts, 1, ?, ?, '…', {SNIPPET_TOKENS}) AS snippet,
+                   bm25(articles_fts, {TITLE_WEIGHT}, {CONTENT_WEIGHT}) AS rank
+            FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid
+            WHERE articles_fts MATCH ?{where}
+            ORDER BY rank
+            LIMIT ? OFFSET ?
+        """
+        with self._lock:
+            rows = self._conn.execute(sql, [*markers, match, *params, limit, offset]).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self, start_date=None, end_date=None, categories=None, sources=None, run_id=None,
+              scraped_on=None):
+        """Return the number of stored articles matching the same filters as query()"""
+        sql, params = self._where(start_date, end_date, categories, sources, run_id, scraped_on)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM articles{sql}", params).fetchone()[0]
+
+    @staticmethod
+    def _where(start_date, end_date, categories, sources, run_id, scraped_on):
+        """Build the WHERE clause and parameters shared by query() and count()"""
+        clauses, params = [], []
+        if start_date:
+            clauses.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            clauses.append("date <= ?")
+            params.append(end_date)
+        if categories:
+            clauses.append(f"category IN ({', '.join('?' * len(categories))})")
+            params.extend(categories)
+        if sources:
+            clauses.append(f"source IN ({', '.join('?' * len(sources))})")
+            params.extend(sources)
+        if run_id is not None:
+            clauses.append("run_id = ?")
+            params.append(run_id)
+        if scraped_on:
+            clauses.append("scraped_on = ?")
+            params.append(scraped_on)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def categorized(self, run_id=None):
+        """
+        Return the articles of a run grouped by category, like categorize_articles
+
+        Args:
+            run_id: Run identifier, defaults to the latest run with articles
+
+        Returns:
+            Dictionary mapping each category to its article dictionaries in report order
+        """
+        run_id = run_id or self.latest_run_id()
+        categorized = {category: [] for category in CATEGORIES}
+        if run_id is None:
+            return categorized
+        for article in self.query(run_id=run_id):
+            categorized.setdefault(article["category"], []).append(article)
+        return categorized
+
+    def sources(self):
+        """Return the names of all sources with stored articles"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT DISTINCT source FROM articles ORDER BY source")]
+
+    def day_range(self):
+        """
+        Return the first and last days (YYYY-MM-DD) articles were scraped on
+
+        Both ends are read from the scraped_on index, so the cost does not
+        grow with the archive.
+
+        Returns:
+            Tuple of the first and last day, or (None, None) for an empty store
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT (SELECT MIN(scraped_on) FROM articles), (SELECT MAX(scraped_on) FROM articles)"
+            ).fetchone()
+        return row[0], row[1]
+
+    def day_counts(self):
+        """Return the number of stored articles for each day (YYYY-MM-DD) they were scraped on"""
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT scraped_on, COUNT(*) FROM articles GROUP BY scraped_on ORDER BY scraped_on"
+            ).fetchall())
+
+    def run_days(self, run_id):
+        """Return the days (YYYY-MM-DD) the articles of a run were first scraped on"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT DISTINCT scraped_on FROM articles WHERE run_id = ? ORDER BY scraped_on", (run_id,)
+            )]
+
+    def day_records(self, day):
+        """
+        Return every article first scraped on a day, as complete records for export
+
+        Args:
+            day: Day (YYYY-MM-DD) the articles were first scraped on
+
+        Returns:
+            List of article dictionaries with their report position and, when
+            it is longer than the excerpt, the indexed full text as "text",
+            ordered by run and position
+        """
+        columns = ", ".join(f"a.{column}" for column in ARTICLE_COLUMNS)
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT {columns}, a.position, f.body AS text
+                FROM articles a LEFT JOIN articles_fts f ON f.rowid = a.id
+                WHERE a.scraped_on = ?
+                ORDER BY a.run_id, a.position, a.url
+            """, (day,)).fetchall()
+        records = []
+        for row in rows:
+            record = dict(row)
+            if record["text"] is None or record["text"] == record["content"]:
+                del record["text"]
+            records.append(record)
+        return records
+
+    def restore_articles(self, records):
+        """
+        Insert or update exported article records in a single transaction
+
+        Unlike upsert_articles(), each record keeps the day it was scraped on,
+        its run and its position, and the runs are recounted from the stored
+        articles, so restoring every record of an export rebuilds the store
+        it came from.
+
+        Args:
+            records: Article dictionaries as returned by day_records()
+
+        Returns:
+            Number of records restored
+        """
+        rows = [tuple(record[column] for column in (*ARTICLE_COLUMNS, "position")) for record in records]
+        texts = [(record["url"], record["title"], record.get("text") or record["content"]) for record in records]
+        run_ids = sorted({record["run_id"] for record in records})
+        with self._lock, self._conn:
+            self._conn.executemany("""
+                INSERT INTO articles (title, content, url, source, date, category, scraped_on, run_id, position)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (url) DO UPDATE SET
+                    title = excluded.title, content = excluded.content, source = excluded.source,
+                    date = excluded.date, category = excluded.category, scraped_on = excluded.scraped_on,
+                    run_id = excluded.run_id, position = excluded.position
+            """, rows)
+            self._index_texts(texts)
+            # Exports do not carry finish times; default run identifiers are those times
+            self._conn.executemany("""
+                INSERT OR REPLACE INTO runs (run_id, finished_at, article_count)
+                VALUES (?, ?, (SELECT COUNT(*) FROM articles WHERE run_id = ?))
+            """, [(run_id, run_id, run_id) for run_id in run_ids])
+        return len(rows)
+
+    def close(self):
+        """Close the store database"""
+        with self._lock:
+            self._conn.close()
+
+class ReopeningStore:
+    """
+    Read-only ArticleStore shared by readers, reopened when its database file is replaced
+
+    The daily job and the archive rebuild replace the database file rather
+    than writing to the open one, so readers compare the file's inode on each
+    use and close the old connection when it changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._store = None
+        self._key = None
+
+    def get(self, path):
+        """
+        Return the store for a database file, opening it read-only on first use or after a replacement
+
+        Args:
+            path: SQLite database file
+
+        Returns:
+            ArticleStore
+
+        Raises:
+            FileNotFoundError: If the database file does not exist
+        """
+        key = (os.path.abspath(path), os.stat(path).st_ino)
+        with self._lock:
+            if self._store is None or self._key != key:
+                if self._store is not None:
+                    self._store.close()
+                self._store = ArticleStore(path, readonly=True)
+                self._key = key
+            return self._store
+
+    def close(self):
+        """Close the current store, if one is open"""
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+                self._store, self._key = None, None
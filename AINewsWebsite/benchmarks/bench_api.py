@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+API Load Test - Requests per second for the JSON API endpoints
+
+Publishes a synthetic report and a year of archived articles in a temporary
+directory, serves them with api.NewsAPI on a local threaded server and
+load-tests each endpoint with concurrent clients:
+
+    uncached      every response built from the report or article store
+                  (cache_entries=0)
+    cached        responses served from the in-memory cache
+    cached gzip   the cached gzip copy, for clients sending Accept-Encoding
+    revalidate    conditional requests with the ETag, answered 304
+
+Usage:
+    python benchmarks/bench_api.py [--clients 8] [--requests 200] [--days 365]
+"""
+
+import argparse
+import http.client
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import NewsAPI, serve
+from article_store import ArticleStore
+from bench_archive import set_days
+from bench_report_load import make_articles
+from bench_search import fill
+from report_data import build_report_data, save_report_data
+
+MODES = [
+    ("uncached", 0, {}),
+    ("cached", None, {}),
+    ("cached gzip", None, {"Accept-Encoding": "gzip"}),
+    ("revalidate", None, {"Accept-Encoding": "gzip"}),
+]
+
+def endpoints(days):
+    day = (date(2025, 1, 1) + timedelta(days=days // 2)).isoformat()
+    return [
+        ("report", "/api/report"),
+        ("articles", f"/api/articles?day={day}&category=defense_security"),
+        ("search", "/api/search?q=drone+security&limit=20"),
+    ]
+
+def load_test(port, path, clients, requests_per_client, headers):
+    """Return (requests/sec, bytes per response, statuses seen)"""
+    sizes = []
+    statuses = set()
+
+    def client():
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        for _ in range(requests_per_client):
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            sizes.append(len(response.read()))
+            statuses.add(response.status)
+        connection.close()
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return len(sizes) / elapsed, sum(sizes) / len(sizes), statuses
+
+def etag_of(port, path, headers):
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    connection.request("GET", path, headers=headers)
+    response = connection.getresponse()
+    response.read()
+    connection.close()
+    return response.getheader("ETag")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per client")
+    parser.add_argument("--days", type=int, default=365, help="Days of archived articles")
+    parser.add_argument("--items", type=int, default=15, help="Items per report section")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report_path = os.path.join(tmp, "daily_ai_news_report.json")
+        db_path = os.path.join(tmp, "ai_news_articles.sqlite3")
+        save_report_data(build_report_data(make_articles(args.items), items_per_section=args.items), report_path)
+        store = ArticleStore(db_path)
+        fill(store, args.days, 45)
+        store.close()
+        set_days(db_path)
+
+        print(f"{'Endpoint':<10}{'Mode':<13}{'req/s':>9}{'KiB/response':>14}  status")
+        for name, path in endpoints(args.days):
+            for mode, cache_entries, headers in MODES:
+                options = {} if cache_entries is None else {"cache_entries": cache_entries}
+                api = NewsAPI(report_path, markdown_path=None, db_path=db_path, **options)
+                server = serve(api, port=0)
+                thread = threading.Thread(target=server.serve_forever, daemon=True)
+                thread.start()
+                port = server.server_port
+                request_headers = dict(headers)
+                if mode == "revalidate":
+                    request_headers["If-None-Match"] = etag_of(port, path, headers)
+                elif cache_entries is None:
+                    etag_of(port, path, headers)
+                rate, size, statuses = load_test(port, path, args.clients, args.requests, request_headers)
+                print(f"{name:<10}{mode:<13}{rate:>9.0f}{size / 1024:>14.1f}  {','.join(map(str, sorted(statuses)))}")
+                server.shutdown()
+                server.server_close()
+
+if __name__ == "__main__":
+    main()
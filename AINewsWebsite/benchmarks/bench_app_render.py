@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+App Render Benchmark - Streamlit deltas, payload and first paint for the report
+
+Runs the report part of app.py under Streamlit's AppTest for a full report,
+rendered two ways:
+
+    per-item     one st.markdown call per news item, per reference and per
+                 section open or close (what the website did before)
+    batched      one st.markdown call per section and one for the references,
+                 rendered by static_site.report_blocks and memoized with
+                 st.cache_data per report version
+
+It prints the markdown deltas sent per rerun, their serialized size, the
+script time until the first news item is sent (time to first paint on the
+server side) and the time of a whole rerun, for the first and later reruns.
+
+Usage:
+    python benchmarks/bench_app_render.py [--items 15] [--reruns 20]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from streamlit.testing.v1 import AppTest
+
+from bench_report_load import make_articles
+from report_data import build_report_data, save_report_data
+
+SCRIPT_HEADER = f"""
+import sys, time
+sys.path.insert(0, {APP_DIR!r})
+import streamlit as st
+from report_data import load_report, report_version
+start = time.perf_counter()
+"""
+
+PER_ITEM_SCRIPT = SCRIPT_HEADER + '''
+report = load_report(PATH)
+first = None
+for section in report["sections"]:
+    st.markdown(f"""
+    <div class="news-container">
+        <div class="section-header">
+            <h2 class="section-title">{section['title']}</h2>
+        </div>
+    """, unsafe_allow_html=True)
+    for item in section["items"]:
+        st.markdown(f"""
+        <a href="{item['url']}" target="_blank" class="news-item">
+            <div class="news-number">{item['number']}</div>
+            <div class="news-title">{item['title']}</div>
+            <div class="news-content">{item['summary']}</div>
+            <div class="news-source">(Source: {item['source']}) [Ref{item['ref']}]</div>
+            <div class="click-hint">🔗 Click to read full article</div>
+        </a>
+        """, unsafe_allow_html=True)
+        if first is None:
+            first = time.perf_counter()
+    st.markdown('</div>', unsafe_allow_html=True)
+st.markdown('<div class="news-container"><div class="references-section">', unsafe_allow_html=True)
+for reference in report["references"]:
+    st.markdown(f'<a href="{reference["url"]}" target="_blank" class="reference-link"><strong>[Ref{reference["ref"]}]</strong> {reference["url"]}</a>', unsafe_allow_html=True)
+st.markdown('</div></div>', unsafe_allow_html=True)
+st.session_state["timings"] = (first - start, time.perf_counter() - start)
+'''
+
+BATCHED_SCRIPT = SCRIPT_HEADER + '''
+from static_site import report_blocks
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def report_html_blocks(version):
+    return report_blocks(load_report(PATH))
+
+first = None
+for block in report_html_blocks(report_version(PATH)):
+    st.markdown(block, unsafe_allow_html=True)
+    if first is None:
+        first = time.perf_counter()
+st.session_state["timings"] = (first - start, time.perf_counter() - start)
+'''
+
+def measure(script, reruns):
+    """Return (deltas, payload bytes, first run timings, mean later run timings)"""
+    app = AppTest.from_string(script, default_timeout=60)
+    app.run()
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+    deltas = len(app.markdown)
+    payload = sum(element.proto.ByteSize() for element in app.markdown)
+    first_run = app.session_state["timings"]
+    later = [0.0, 0.0]
+    for _ in range(reruns):
+        app.run()
+        paint, total = app.session_state["timings"]
+        later[0] += paint / reruns
+        later[1] += total / reruns
+    return deltas, payload, first_run, later
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=15, help="Items per report section")
+    parser.add_argument("--reruns", type=int, default=20, help="Reruns timed after the first run")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "daily_ai_news_report.json")
+        save_report_data(build_report_data(make_articles(args.items), items_per_section=args.items), path)
+
+        print(f"{'Renderer':<10}{'deltas':>7}{'payload KiB':>13}{'first paint ms':>16}{'rerun ms':>10}"
+              f"{'later first paint ms':>22}{'later rerun ms':>16}")
+        for name, script in (("per-item", PER_ITEM_SCRIPT), ("batched", BATCHED_SCRIPT)):
+            deltas, payload, first_run, later = measure(f"PATH = {path!r}\n" + script, args.reruns)
+            print(f"{name:<10}{deltas:>7}{payload / 1024:>13.1f}{first_run[0] * 1000:>16.2f}{first_run[1] * 1000:>10.2f}"
+                  f"{later[0] * 1000:>22.2f}{later[1] * 1000:>16.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Archive Benchmark - Time and memory to load one archive page as the archive grows
+
+Fills an ArticleStore with one run per day (about 45 articles a day, as the
+daily job keeps) for a month, a year and three years of history, and times
+what the website's archive browser does for one page: read the first and last
+days, count the selected day's articles and read a page of them, unfiltered and
+filtered by section and source. Each page is timed with the scraped_on index
+and with it dropped, and the peak memory of a page load is measured with
+tracemalloc.
+
+Usage:
+    python benchmarks/bench_archive.py [--years 3] [--per-day 45] [--rounds 50]
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from article_store import ArticleStore
+from bench_search import SOURCES, fill
+
+FILTERS = [
+    ("whole day", {}),
+    ("section", {"categories": ["defense_security"]}),
+    ("source", {"sources": SOURCES[:3]}),
+]
+PAGE_SIZE = 20
+
+def set_days(path):
+    """Give every run its own day; bench_search.fill stores them all as scraped today"""
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("UPDATE articles SET scraped_on = substr(run_id, 1, 10)")
+    conn.close()
+
+def load_page(store, day, filters):
+    """What app.display_archive reads for one page"""
+    store.day_range()
+    total = store.count(scraped_on=day, **filters)
+    return total, store.query(scraped_on=day, limit=PAGE_SIZE, offset=0, **filters)
+
+def time_page(path, day, filters, rounds, indexed=True):
+    """Return (mean ms per page, peak KiB of one page load)"""
+    store = ArticleStore(path)
+    if not indexed:
+        # After opening, which creates the index when it is missing
+        store._conn.execute("DROP INDEX articles_scraped_on")
+    load_page(store, day, filters)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        load_page(store, day, filters)
+    elapsed = (time.perf_counter() - start) / rounds
+    tracemalloc.start()
+    load_page(store, day, filters)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    store.close()
+    return elapsed * 1000, peak / 1024
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=3, help="Years of daily runs in the largest archive")
+    parser.add_argument("--per-day", type=int, default=45, help="Articles per daily run")
+    parser.add_argument("--rounds", type=int, default=50, help="Page loads timed per measurement")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    start = date(2025, 1, 1)
+    checkpoints = sorted({30, 365, 365 * args.years})
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "archive.sqlite3")
+        print(f"{'Days':>6}{'MiB':>7}  {'Page':<11}{'indexed ms':>11}{'peak KiB':>10}{'unindexed ms':>14}")
+        for days in checkpoints:
+            if os.path.exists(path):
+                os.remove(path)
+            store = ArticleStore(path)
+            fill(store, days, args.per_day)
+            store.close()
+            set_days(path)
+
+            day = (start + timedelta(days=days // 2)).isoformat()
+            size = os.path.getsize(path) / 2**20
+            for name, filters in FILTERS:
+                indexed_ms, peak = time_page(path, day, filters, args.rounds)
+                unindexed_ms, _ = time_page(path, day, filters, args.rounds, indexed=False)
+                print(f"{days:>6}{size:>7.1f}  {name:<11}{indexed_ms:>11.3f}{peak:>10.1f}{unindexed_ms:>14.3f}")
+
+if __name__ == "__main__":
+    main()
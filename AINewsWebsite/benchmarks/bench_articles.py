@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Article Memory Benchmark - Memory held by scraped article records
+
+Builds a few hundred articles with long bodies and measures, with tracemalloc,
+the memory retained by the records plus the categorized dictionaries
+categorize_articles produces from them, for:
+
+    before    the original ArticleInfo (instance __dict__, full cleaned body,
+              categorized on construction)
+    excerpt   the slotted ArticleInfo keeping an EXCERPT_LENGTH excerpt
+    spooled   the slotted ArticleInfo with full texts in a TextSpool on disk
+
+Usage:
+    python benchmarks/bench_articles.py [--articles 500] [--words 1500]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper import ArticleInfo, EXCERPT_LENGTH, categorize_article, categorize_articles, clean_text
+from text_spool import TextSpool
+
+WORDS = (
+    "the new model improves reasoning on benchmarks while researchers report open weights and a "
+    "safety evaluation covering security threats deployment costs and developer tools for the api"
+).split()
+
+class LegacyArticleInfo:
+    """The ArticleInfo implementation before slots, excerpts and lazy categories"""
+    def __init__(self, title, content, url, source, date=None, category=None):
+        self.title = clean_text(title)
+        self.content = clean_text(content)
+        self.url = url
+        self.source = source
+        self.date = date if date else "2025-07-23"
+        if category is None:
+            self.category = categorize_article(self.title, self.content)
+        else:
+            self.category = category
+
+    def to_dict(self):
+        return {
+            "title": self.title,
+            "content": self.content,
+            "url": self.url,
+            "source": self.source,
+            "date": self.date,
+            "category": self.category
+        }
+
+def raw_articles(count, words, seed=0):
+    """Generate (title, content, url, source) tuples with uneven whitespace, like scraped text"""
+    rng = random.Random(seed)
+    for n in range(count):
+        body = "  \n".join(" ".join(rng.choice(WORDS) for _ in range(25)) for _ in range(words // 25))
+        yield f"AI story {n}: model release", body, f"https://example.com/articles/{n}", f"Source {n % 14}"
+
+def measure(build, count, words):
+    """Return (retained bytes, peak bytes, seconds) for building and categorizing articles"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    articles = [build(*raw) for raw in raw_articles(count, words)]
+    categorized = categorize_articles(articles)
+    seconds = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del articles, categorized
+    return retained, peak, seconds
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=500, help="Articles per run")
+    parser.add_argument("--words", type=int, default=1500, help="Words per article body")
+    args = parser.parse_args()
+
+    spool = TextSpool()
+    variants = [
+        ("before", lambda title, content, url, source: LegacyArticleInfo(title, content, url, source)),
+        ("excerpt", lambda title, content, url, source: ArticleInfo(title, content, url, source)),
+        ("spooled", lambda title, content, url, source: ArticleInfo(title, content, url, source, spool=spool)),
+    ]
+
+    print(f"{args.articles} articles of {args.words} words, excerpt {EXCERPT_LENGTH} characters")
+    print(f"{'Variant':<10}{'retained KiB':>14}{'peak KiB':>11}{'ms':>8}")
+    for name, build in variants:
+        retained, peak, seconds = measure(build, args.articles, args.words)
+        print(f"{name:<10}{retained / 1024:>14.0f}{peak / 1024:>11.0f}{seconds * 1000:>8.0f}")
+    print(f"Spooled to disk: {len(spool) / 1024:.0f} KiB")
+    spool.close()
+
+if __name__ == "__main__":
+    main()
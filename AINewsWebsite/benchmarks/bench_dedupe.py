@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Dedupe Benchmark - Scaling and accuracy of near-duplicate detection
+
+Builds runs of synthetic articles in which a share of the stories is
+syndicated: copied to other sources with a different title and lightly edited
+text. It then times deduplicate_articles and reports how many of the planted
+copies were dropped and how many distinct stories were dropped by mistake.
+
+Usage:
+    python benchmarks/bench_dedupe.py [--sizes 250 1000 4000] [--edit-rate 0.05]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dedupe import SignatureStore, deduplicate_articles
+from scraper import ArticleInfo
+
+VOCABULARY = (
+    "model release research lab safety benchmark training inference chip cloud startup funding "
+    "agency defense security drone policy regulation europe open weights developer platform users "
+    "results evaluation dataset reasoning agents robotics vision speech language company partnership"
+).split()
+
+def build_run(size, syndicated_share, edit_rate, seed=0):
+    """Return (articles, story id per article) with planted syndicated copies"""
+    rng = random.Random(seed)
+    articles, story_ids = [], []
+    originals = []
+    for n in range(size):
+        if originals and rng.random() < syndicated_share:
+            story, words = rng.choice(originals)
+            # Syndicated copy: same story, a few words edited
+            words = [rng.choice(VOCABULARY) if rng.random() < edit_rate else word for word in words]
+        else:
+            story = n
+            words = [rng.choice(VOCABULARY) for _ in range(rng.randrange(80, 200))]
+            originals.append((story, words))
+        articles.append(ArticleInfo(
+            title=f"Story {n}", content=" ".join(words), url=f"https://source{n % 14}.example/{n}",
+            source=f"Source {n % 14}", category="general"
+        ))
+        story_ids.append(story)
+    return articles, story_ids
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 1000, 4000], help="Articles per run")
+    parser.add_argument("--syndicated-share", type=float, default=0.3, help="Share of syndicated copies")
+    parser.add_argument("--edit-rate", type=float, default=0.05, help="Share of words changed in a copy")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"{'Articles':>9}{'stories':>9}{'kept':>7}{'copies missed':>15}{'stories lost':>14}{'ms':>9}{'us/article':>12}")
+    for size in args.sizes:
+        articles, story_ids = build_run(size, args.syndicated_share, args.edit_rate)
+        story_of = {id(article): story for article, story in zip(articles, story_ids)}
+
+        start = time.perf_counter()
+        kept = deduplicate_articles(articles, store=SignatureStore(":memory:"))
+        seconds = time.perf_counter() - start
+
+        stories = set(story_ids)
+        kept_stories = [story_of[id(article)] for article in kept]
+        missed = len(kept_stories) - len(set(kept_stories))
+        lost = len(stories - set(kept_stories))
+        print(f"{size:>9}{len(stories):>9}{len(kept):>7}{missed:>15}{lost:>14}"
+              f"{seconds * 1000:>9.0f}{seconds / size * 1e6:>12.0f}")
+
+if __name__ == "__main__":
+    main()
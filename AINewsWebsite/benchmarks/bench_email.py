@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Email Benchmark - Rendering the report as an email, chained replaces versus a single pass
+
+Builds markdown reports of growing size and times:
+
+    replace      the original generate_email_content: chained str.replace
+                 calls, then for every [RefN] marker a regex search of the
+                 whole document and a full-string replace
+    single-pass  email_renderer.render_email, producing both the HTML and
+                 the plain-text part
+
+and checks that the HTML is well-formed: every <strong>, <a>, <p> and heading
+tag is closed in order.
+
+Usage:
+    python benchmarks/bench_email.py [--items 45 150 500] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from html.parser import HTMLParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from email_renderer import render_email
+
+WORDS = (
+    "model release research lab safety benchmark training inference chip cloud startup funding "
+    "agency defense security drone policy regulation europe open weights developer platform users"
+).split()
+SECTIONS = ("General AI News", "AI in Defense and Security", "Important Tools and Innovations")
+CHECKED_TAGS = {"strong", "a", "p", "h1", "h2", "h3", "div"}
+
+def make_report(items, seed=0):
+    """Markdown report with items spread over the three sections"""
+    rng = random.Random(seed)
+    lines = ["# Daily AI News Report", "", "## Date: July 01, 2025", ""]
+    ref = 0
+    for section_index, section in enumerate(SECTIONS):
+        lines += [f"### {section}", ""]
+        count = items // len(SECTIONS) + (1 if section_index < items % len(SECTIONS) else 0)
+        for number in range(1, count + 1):
+            ref += 1
+            title = " ".join(rng.choices(WORDS, k=8)).capitalize()
+            content = " ".join(rng.choices(WORDS, k=30))[:200]
+            lines += [f"{number}. **{title}** - {content}... (Source: Source {ref % 25}) [Ref{ref}]", ""]
+    lines += ["## References", ""]
+    lines += [f"[Ref{n}] https://example.com/articles/{n}" for n in range(1, ref + 1)]
+    return "\n".join(lines) + "\n"
+
+def replace_email_html(markdown_content):
+    """The original conversion, without the surrounding document template"""
+    html_content = markdown_content.replace("# ", "<h1>").replace("## ", "<h2>").replace("### ", "<h3>")
+    html_content = html_content.replace("**", "<strong>").replace("**", "</strong>")
+    html_content = html_content.replace("\n\n", "</p><p>").replace("\n", "<br>")
+    ref_pattern = r'\[Ref(\d+)\]'
+    for match in re.finditer(ref_pattern, html_content):
+        ref_num = match.group(1)
+        ref_link_pattern = f"\\[Ref{ref_num}\\] (https?://[^\\s]+)"
+        ref_link_match = re.search(ref_link_pattern, html_content)
+        if ref_link_match:
+            link_url = ref_link_match.group(1)
+            html_content = html_content.replace(f"[Ref{ref_num}]", f'<a href="{link_url}">[Ref{ref_num}]</a>')
+    return html_content
+
+class TagBalance(HTMLParser):
+    """Counts tags that are closed out of order or never closed"""
+
+    def __init__(self):
+        super().__init__()
+        self.stack = []
+        self.errors = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in CHECKED_TAGS:
+            self.stack.append(tag)
+
+    def handle_endtag(self, tag):
+        if tag not in CHECKED_TAGS:
+            return
+        if self.stack and self.stack[-1] == tag:
+            self.stack.pop()
+        else:
+            self.errors += 1
+
+def tag_errors(html):
+    checker = TagBalance()
+    checker.feed(html)
+    checker.close()
+    return checker.errors + len(checker.stack)
+
+def best_time(func, report, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(report)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, nargs="+", default=[45, 150, 500], help="Report items")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    args = parser.parse_args()
+
+    print(f"{'items':>6}{'KiB':>6}{'replace ms':>12}{'single-pass ms':>16}{'speedup':>9}"
+          f"{'replace tag errors':>20}{'single-pass tag errors':>24}")
+    for items in args.items:
+        report = make_report(items)
+        before = best_time(replace_email_html, report, args.repeat)
+        after = best_time(render_email, report, args.repeat)
+        print(f"{items:>6}{len(report) / 1024:>6.0f}{before * 1000:>12.1f}{after * 1000:>16.2f}{before / after:>8.0f}x"
+              f"{tag_errors(replace_email_html(report)):>20}{tag_errors(render_email(report).html):>24}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Feed Benchmark - Streaming feed parsing versus feedparser
+
+Times and measures peak memory of turning a large feed into plain-text
+entries, the way RSSFeedScraper does, with:
+
+    feedparser   feedparser.parse on the whole feed and a BeautifulSoup
+                 html.parser tree per entry to strip HTML (the original path)
+    stream       feed_parser.iter_feed with strip_html, stopping after the
+                 entries needed
+
+for RSS 2.0 and Atom feeds, reading every entry and stopping at a limit.
+
+Usage:
+    python benchmarks/bench_feeds.py [--entries 100] [--limit 5] [--feed FILE]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from email.utils import formatdate
+from html import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feedparser
+from bs4 import BeautifulSoup
+from feed_parser import iter_feed, strip_html
+from scraper import clean_text
+
+def entry_html(n, paragraphs):
+    """HTML body of entry n, like the content:encoded of a blog feed"""
+    return "".join(
+        f"<p>Paragraph {i} of post {n} on <strong>machine learning</strong> systems, with "
+        f"<a href=\"https://example.com/ref/{i}\">a reference</a> &amp; a figure.</p>"
+        f"<figure><img src=\"/img/{n}-{i}.png\"><figcaption>Figure {i}</figcaption></figure>"
+        for i in range(paragraphs)
+    )
+
+def rss_feed(entries, paragraphs):
+    items = "".join(
+        f"<item><title>Post {n}: model training at scale</title>"
+        f"<link>https://example.com/posts/{n}</link>"
+        f"<description>{escape(entry_html(n, 1))}</description>"
+        f"<content:encoded>{escape(entry_html(n, paragraphs))}</content:encoded>"
+        f"<pubDate>{formatdate(1750000000 + n * 3600, usegmt=True)}</pubDate></item>"
+        for n in range(entries)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel>'
+        f"<title>Benchmark feed</title><link>https://example.com/</link>{items}</channel></rss>"
+    ).encode("utf-8")
+
+def atom_feed(entries, paragraphs):
+    items = "".join(
+        f"<entry><title>Post {n}: model training at scale</title>"
+        f'<link rel="alternate" href="https://example.com/posts/{n}"/>'
+        f"<id>https://example.com/posts/{n}</id>"
+        f"<published>2025-07-{1 + n % 28:02d}T09:00:00Z</published>"
+        f'<content type="html">{escape(entry_html(n, paragraphs))}</content></entry>'
+        for n in range(entries)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>Benchmark feed</title>{items}</feed>"
+    ).encode("utf-8")
+
+def feedparser_path(data, limit):
+    """The original RSSFeedScraper parsing: whole feed, one soup per entry"""
+    entries = []
+    for entry in feedparser.parse(data).entries:
+        if len(entries) >= limit:
+            break
+        content = ""
+        if 'content' in entry:
+            content = " ".join([c.value for c in entry.content])
+        elif 'summary' in entry:
+            content = entry.summary
+        content = BeautifulSoup(content, 'html.parser').get_text()
+        entries.append((entry.title, entry.link, clean_text(content)))
+    return entries
+
+def stream_path(data, limit):
+    """The streaming parser with the lightweight stripper, stopping at the limit"""
+    entries = []
+    for entry in iter_feed(data):
+        entries.append((entry.title, entry.link, clean_text(strip_html(entry.content))))
+        if len(entries) >= limit:
+            break
+    return entries
+
+def comparable(entries):
+    """
+    Entries with whitespace removed from the text
+
+    strip_html puts a space between block elements where get_text() runs
+    paragraphs together, so only the non-whitespace text must match.
+    """
+    return [(title, link, "".join(text.split())) for title, link, text in entries]
+
+def measure(func, data, limit, repeat):
+    """Return (best seconds, peak bytes)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data, limit)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func(data, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=100, help="Entries per synthetic feed")
+    parser.add_argument("--paragraphs", type=int, default=10, help="Paragraphs per entry")
+    parser.add_argument("--limit", type=int, default=5, help="Entries needed when stopping early")
+    parser.add_argument("--feed", help="Saved feed file to use instead of the synthetic feeds")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions")
+    args = parser.parse_args()
+
+    if args.feed:
+        with open(args.feed, "rb") as f:
+            feeds = {os.path.basename(args.feed): f.read()}
+    else:
+        feeds = {"rss": rss_feed(args.entries, args.paragraphs), "atom": atom_feed(args.entries, args.paragraphs)}
+
+    print(f"{'Feed':<12}{'KiB':>7}{'entries':>9}{'feedparser ms':>15}{'stream ms':>11}{'speedup':>9}"
+          f"{'feedparser KiB':>16}{'stream KiB':>12}")
+    for name, data in feeds.items():
+        for limit in (args.limit, sys.maxsize):
+            if comparable(feedparser_path(data, limit)) != comparable(stream_path(data, limit)):
+                print(f"WARNING: {name} entries differ between the two parsers")
+            before_time, before_peak = measure(feedparser_path, data, limit, args.repeat)
+            after_time, after_peak = measure(stream_path, data, limit, args.repeat)
+            shown = "all" if limit == sys.maxsize else limit
+            print(f"{name:<12}{len(data) / 1024:>7.0f}{shown:>9}{before_time * 1000:>15.1f}{after_time * 1000:>11.1f}"
+                  f"{before_time / after_time:>8.1f}x{before_peak / 1024:>16.0f}{after_peak / 1024:>12.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Keyword Benchmark - Compares substring keyword scans with the single-pass matcher
+
+Times the original is_relevant + categorize_article implementation (one
+substring search per keyword, on a lowercased copy of the text built twice)
+against classify_article, which finds every keyword in one regular expression
+pass, on synthetic articles of increasing length. Also lists sample articles
+whose result changes because keywords now match whole words only, and checks
+that classify_article still finds the matches the substring scan was relied
+on for (stems like "cyber*", hyphenated phrases); the script exits with an
+error if one of those checks fails.
+
+Usage:
+    python benchmarks/bench_keywords.py [--repeat N] [--check]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper import RELEVANCE_KEYWORDS, DEFENSE_KEYWORDS, TOOLS_KEYWORDS, classify_article
+
+# Filler vocabularies without keywords. In "neutral" text no keyword occurs even
+# as a substring, so the substring scan has to search for every keyword; in
+# "everyday" text words like "said", "maintain" and "happen" contain short
+# keywords, so the substring scan stops early on a false positive.
+FILLERS = {
+    "neutral": (
+        "the report notes that officials hold their position while markets move as money flows "
+        "shift across regions and analysts expect further changes next quarter during winter months"
+    ).split(),
+    "everyday": (
+        "the report said that officials maintain their position while markets happen to move "
+        "as capital flows shift across regions and analysts expect further changes next quarter"
+    ).split(),
+}
+
+# (title, content, expected (relevant, category)) that classify_article must keep
+EXPECTED = [
+    ("Gen AI", "cyberattack on apps", (True, "defense_security")),
+    ("Gen AI", "a rise in cybercrime", (True, "defense_security")),
+    ("Gen AI", "a new cyberweapon", (True, "defense_security")),
+    ("Cybersecurity firms adopt AI", "", (True, "defense_security")),
+    ("Machine-learning pipelines", "faster training", (True, "general")),
+    ("Deep-learning chips", "a new accelerator", (True, "tools_innovations")),
+    ("Officials said they maintain the plan", "", (False, "general")),
+]
+
+def check_expected():
+    """Print each expected classification and return the number that failed"""
+    failures = 0
+    for title, content, expected in EXPECTED:
+        result = classify_article(title, content)
+        status = "ok" if result == expected else "FAIL"
+        failures += result != expected
+        print(f"  {status:<5}{title + ' / ' + content!r:<48} expected={expected} got={result}")
+    return failures
+
+def legacy_classify(title, content):
+    """The substring scans is_relevant and categorize_article used before the matcher"""
+    combined_text = (title + " " + content).lower()
+    relevant = any(keyword.lower() in combined_text for keyword in RELEVANCE_KEYWORDS)
+
+    combined_text = (title + " " + content).lower()
+    # The prefix marker of stems like "cyber*" did not exist then
+    for keyword in (keyword.rstrip("*") for keyword in DEFENSE_KEYWORDS):
+        if keyword in combined_text:
+            return relevant, "defense_security"
+    for keyword in TOOLS_KEYWORDS:
+        if keyword in combined_text:
+            return relevant, "tools_innovations"
+    return relevant, "general"
+
+def synthetic_article(rng, filler, words, keyword_rate):
+    """Build a (title, content) pair of the given length with sparse keywords"""
+    keywords = RELEVANCE_KEYWORDS + DEFENSE_KEYWORDS + TOOLS_KEYWORDS
+    body = [rng.choice(keywords) if rng.random() < keyword_rate else rng.choice(filler) for _ in range(words)]
+    return " ".join(rng.choice(filler) for _ in range(8)), " ".join(body)
+
+def best_time(func, articles, repeat):
+    """Return the best seconds per article over repeat runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for title, content in articles:
+            func(title, content)
+        best = min(best, time.perf_counter() - start)
+    return best / len(articles)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    parser.add_argument("--articles", type=int, default=50, help="Articles per length")
+    parser.add_argument("--check", action="store_true", help="Only check the expected classifications")
+    args = parser.parse_args()
+
+    print("Expected classifications:")
+    failures = check_expected()
+    if failures:
+        sys.exit(f"{failures} expected classifications failed")
+    if args.check:
+        return
+    print()
+
+    rng = random.Random(0)
+    print(f"{'Text':<10}{'words':>8}{'keywords':>10}{'substring us':>15}{'matcher us':>13}{'speedup':>9}")
+    for filler_name, filler in FILLERS.items():
+        for words in (200, 1000, 5000, 20000):
+            for keyword_rate in (0.0, 0.01):
+                articles = [synthetic_article(rng, filler, words, keyword_rate) for _ in range(args.articles)]
+                before = best_time(legacy_classify, articles, args.repeat)
+                after = best_time(classify_article, articles, args.repeat)
+                print(f"{filler_name:<10}{words:>8}{keyword_rate:>10.0%}{before * 1e6:>15.0f}"
+                      f"{after * 1e6:>13.0f}{before / after:>8.1f}x")
+
+    print("\nResults changed by word-boundary matching:")
+    samples = [
+        ("Officials said they maintain the plan", "Capital spending will happen next year."),
+        ("New tools released", "The company launched an API update for developers using AI."),
+        ("Drones and AI", "Military uses of autonomous drones raise new risks."),
+        ("Retail earnings", "The chain said sales were strong and it will maintain its dividend."),
+    ]
+    for title, content in samples:
+        before, after = legacy_classify(title, content), classify_article(title, content)
+        marker = "changed" if before != after else "same"
+        print(f"  {title!r:<42} substring={before} matcher={after} ({marker})")
+
+if __name__ == "__main__":
+    main()
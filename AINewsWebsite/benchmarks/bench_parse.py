@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Parse Benchmark - Compares full html.parser trees with partial lxml parsing
+
+Measures, for the article page of every HTML source in sources.toml, the time
+and peak memory of the original get_soup parse (a full html.parser tree)
+against make_soup with the scraper's detail_targets.
+
+Usage:
+    python benchmarks/bench_parse.py [--pages DIR] [--repeat N]
+
+With --pages, DIR/<source-name>.html files (e.g. saved article pages, named
+like "Google DeepMind.html") are used instead of generated synthetic pages.
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from parsing import make_soup, DEFAULT_PARSER
+from scraper import HTMLSourceScraper, load_sources
+
+def element_markup(selector, inner):
+    """Render an element matching the first compound of a CSS selector, e.g. div.prose"""
+    name, _, css_class = selector.split()[0].partition(".")
+    class_attr = f' class="{css_class}"' if css_class else ""
+    return f"<{name}{class_attr}>{inner}</{name}>"
+
+def synthetic_article_page(scraper, paragraphs=40, nav_links=300):
+    """Build an article page with the markup a scraper expects plus typical page chrome"""
+    head = "".join(f"<script>var config{i} = {{'key': 'value{i}'}};</script>" for i in range(50))
+    head += "<style>" + "".join(f".c{i} {{ color: #{i:06x}; }}" for i in range(500)) + "</style>"
+    nav = "<nav><ul>" + "".join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(nav_links)) + "</ul></nav>"
+    body = "".join(
+        f"<p>Paragraph {i} about machine learning, large language models and AI security. "
+        f"<a href=\"/related/{i}\">Related</a> <em>emphasis</em> and more text to fill the line.</p>"
+        for i in range(paragraphs)
+    )
+    related = "".join(
+        f'<div class="card"><img src="/img/{i}.jpg"><span>Related story {i}</span></div>' for i in range(60)
+    )
+    footer = "<footer>" + "".join(f'<a href="/legal/{i}">Legal {i}</a>' for i in range(100)) + "</footer>"
+
+    title = element_markup(scraper.title_selector or "h1", f"AI model release from {scraper.source_name}")
+    content = element_markup(scraper.content_selector, body)
+    return (
+        f"<html><head><title>Article</title>{head}</head><body>{nav}"
+        f'<header>{title}<time datetime="2025-07-23T10:00:00Z">July 23, 2025</time></header>'
+        f"{content}<aside>{related}</aside>{footer}</body></html>"
+    )
+
+def extract(soup, scraper):
+    """Run the same extraction the scraper performs on an article page"""
+    title_elem = soup.select_one(scraper.title_selector) if scraper.title_selector else None
+    date_elem = soup.select_one(scraper.date_selector) if scraper.date_selector else None
+    content = " ".join(p.get_text() for p in soup.select(scraper.content_selector))
+    return (
+        title_elem.get_text() if title_elem else "",
+        date_elem.get("datetime") if date_elem else None,
+        content
+    )
+
+def measure(parse, html, repeat):
+    """Return (best seconds, peak bytes) for parsing html with parse()"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(html)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    soup = parse(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del soup
+    return best, peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", help="Directory of saved <source-name>.html article pages")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions per page")
+    args = parser.parse_args()
+
+    print(f"Partial parsing backend: {DEFAULT_PARSER}")
+    print(f"{'Source':<32}{'KiB':>7}{'before ms':>12}{'after ms':>11}{'before KiB':>13}{'after KiB':>12}")
+
+    scrapers = [HTMLSourceScraper(source) for source in load_sources() if source["type"] == "html"]
+    for scraper in scrapers:
+        if args.pages:
+            with open(os.path.join(args.pages, f"{scraper.source_name}.html"), encoding="utf-8") as f:
+                html = f.read()
+        else:
+            html = synthetic_article_page(scraper)
+
+        def before(markup):
+            return BeautifulSoup(markup, "html.parser")
+
+        def after(markup):
+            return make_soup(markup, targets=scraper.detail_targets)
+
+        if extract(before(html), scraper) != extract(after(html), scraper):
+            print(f"WARNING: {scraper.source_name} extracts different content with partial parsing")
+
+        before_time, before_peak = measure(before, html, args.repeat)
+        after_time, after_peak = measure(after, html, args.repeat)
+        print(f"{scraper.source_name:<32}{len(html) / 1024:>7.0f}"
+              f"{before_time * 1000:>12.1f}{after_time * 1000:>11.1f}"
+              f"{before_peak / 1024:>13.0f}{after_peak / 1024:>12.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Publish Benchmark - Publishing the report to a local bare remote
+
+Creates a bare repository and a clone of it in a temporary directory, then
+publishes the report and its JSON data from the clone:
+
+    legacy       the original update_github_repo: os.chdir, git add, git
+                 commit and git push, whatever changed
+    publisher    publisher.publish_report: stage the files, compare them with
+                 HEAD, then commit and push only what changed
+
+for a run with new articles and a run where nothing changed, printing the
+time of each step. First it checks publish_report against its own bare
+remote the way the daily job uses it, with the article archive: the first
+publish is committed and pushed, a rerun without changes commits and pushes
+nothing, and deleted files (an archive shard, the report data) are
+committed as deleted; the script exits with an error if a check fails.
+
+Usage:
+    python benchmarks/bench_publish.py [--days 90] [--rounds 3] [--check]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from article_archive import ARCHIVE_DIR, ARCHIVE_INDEX, export_archive, shard_path
+from article_store import DEFAULT_ARTICLE_DB, ArticleStore
+from publisher import publish_report
+from report_data import REPORT_DATA_PATH, build_report_data, save_report_data
+from report_renderer import render_markdown
+
+REPORT_PATH = "daily_ai_news_report.md"
+FILES = [REPORT_PATH, REPORT_DATA_PATH]
+WORDS = "model release research lab safety benchmark training inference chip drone policy agents".split()
+
+# A day no longer in the article store, whose shard the archive export removes
+STALE_DAY = "2000-01-01"
+
+def git(*args, cwd=None):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+def write_run(work, day, per_day=45, seed=0):
+    """Store one day's articles and write the report files for them"""
+    rng = random.Random(seed * 100000 + day)
+    articles = [
+        {
+            "title": " ".join(rng.choices(WORDS, k=8)).capitalize(),
+            "content": " ".join(rng.choices(WORDS, k=90))[:600],
+            "url": f"https://example.com/{day}/{n}",
+            "source": f"Source {n % 25}",
+            "date": f"2025-{1 + day // 28 % 12:02d}-{1 + day % 28:02d}",
+            "category": ("general", "defense_security", "tools_innovations")[n % 3],
+        }
+        for n in range(per_day)
+    ]
+    store = ArticleStore(os.path.join(work, DEFAULT_ARTICLE_DB))
+    run_id = store.upsert_articles(articles, run_id=f"run-{seed}-{day:04d}")
+    report = build_report_data(store.categorized(run_id))
+    store.close()
+    save_report_data(report, os.path.join(work, REPORT_DATA_PATH))
+    with open(os.path.join(work, REPORT_PATH), "w", encoding="utf-8") as f:
+        f.write(render_markdown(report))
+
+def write_archive(work):
+    """Export the work tree's article store to its archive directory"""
+    store = ArticleStore(os.path.join(work, DEFAULT_ARTICLE_DB))
+    export_archive(store, os.path.join(work, ARCHIVE_DIR))
+    store.close()
+
+def check_publish(tmp):
+    """Publish to a bare remote as the daily job does, print each check and return the number that failed"""
+    remote = os.path.join(tmp, "check.git")
+    work = os.path.join(tmp, "check")
+    git("init", "--bare", "-q", remote)
+    git("clone", "-q", remote, work)
+    git("config", "user.email", "bench@example.com", cwd=work)
+    git("config", "user.name", "Benchmark", cwd=work)
+    files = [*FILES, ARCHIVE_DIR]
+    stale_shard = f"{ARCHIVE_DIR}/{STALE_DAY}.jsonl"
+    failures = 0
+
+    def remote_state():
+        """The remote's head commit and files; the clone's branch has the remote's default name"""
+        branch = git("symbolic-ref", "--short", "HEAD", cwd=work).strip()
+        head = subprocess.run(["git", "--git-dir", remote, "rev-parse", "--verify", "--quiet", branch],
+                              capture_output=True, text=True).stdout.strip()
+        tree = git("--git-dir", remote, "ls-tree", "-r", "--name-only", branch).splitlines() if head else []
+        return head, set(tree)
+
+    def expect(step, description, ok):
+        nonlocal failures
+        failures += not ok
+        print(f"  {'ok' if ok else 'FAIL':<5}{step:<32}{description}")
+
+    def publish(step, message, committed, present=(), absent=()):
+        before, _ = remote_state()
+        result = publish_report(work, files, message)
+        head, tree = remote_state()
+        local = git("rev-parse", "HEAD", cwd=work).strip()
+        expect(step, f"committed={committed}", result.committed == committed)
+        expect(step, f"pushed={committed}", result.pushed == committed)
+        expect(step, "remote at the local head" if committed else "remote head unchanged",
+               head == local and (head != before) == committed)
+        for name in present:
+            expect(step, f"{name} on the remote", name in tree)
+        for name in absent:
+            expect(step, f"{name} not on the remote", name not in tree)
+
+    # The first run publishes a shard for a day the store no longer has
+    write_run(work, 0)
+    write_archive(work)
+    index_path = os.path.join(work, ARCHIVE_DIR, ARCHIVE_INDEX)
+    with open(index_path, "r", encoding="utf-8") as f:
+        index = json.load(f)
+    index["days"][STALE_DAY] = {"articles": 0, "sha256": ""}
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1)
+    open(shard_path(os.path.join(work, ARCHIVE_DIR), STALE_DAY), "w").close()
+    publish("first run", "Report day 0", True, present=[*FILES, f"{ARCHIVE_DIR}/{ARCHIVE_INDEX}", stale_shard])
+    publish("rerun without changes", "Report day 0 again", False)
+
+    # The next export removes the stale day's shard
+    write_run(work, 1)
+    write_archive(work)
+    publish("new run, shard removed", "Report day 1", True, present=FILES, absent=[stale_shard])
+    os.remove(os.path.join(work, REPORT_DATA_PATH))
+    publish("report data deleted", "Report day 1 without data", True, absent=[REPORT_DATA_PATH])
+    publish("rerun after the deletion", "Report day 1 again", False)
+    return failures
+
+def legacy_publish(work, message):
+    """The original update_github_repo, returning (ok, {step: seconds})"""
+    timings = {}
+    cwd = os.getcwd()
+    try:
+        os.chdir(work)
+        for step, command in (("add", ["git", "add", *FILES]), ("commit", ["git", "commit", "-m", message]),
+                              ("push", ["git", "push"])):
+            start = time.perf_counter()
+            result = subprocess.run(command, capture_output=True)
+            timings[step] = time.perf_counter() - start
+            if result.returncode != 0:
+                return False, timings
+        return True, timings
+    finally:
+        os.chdir(cwd)
+
+def show(name, scenario, ok, timings):
+    steps = "  ".join(f"{step} {seconds * 1000:6.1f}" for step, seconds in timings.items())
+    print(f"{name:<11}{scenario:<11}{ok:<22}{sum(timings.values()) * 1000:>9.1f}   {steps}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=90, help="Days of published reports in the history")
+    parser.add_argument("--rounds", type=int, default=3, help="Publishes of each kind")
+    parser.add_argument("--check", action="store_true", help="Only check publishing to a bare remote")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print("Publishing checks:")
+        failures = check_publish(tmp)
+        if failures:
+            sys.exit(f"{failures} publishing checks failed")
+        if args.check:
+            return
+        print()
+
+        remote = os.path.join(tmp, "remote.git")
+        git("init", "--bare", "-q", remote)
+        for name in ("legacy", "publisher"):
+            work = os.path.join(tmp, name)
+            git("clone", "-q", remote, work)
+            git("config", "user.email", "bench@example.com", cwd=work)
+            git("config", "user.name", "Benchmark", cwd=work)
+            git("checkout", "-q", "-b", name, cwd=work)
+            for day in range(args.days):
+                write_run(work, day, seed=len(name))
+            git("add", *FILES, cwd=work)
+            git("commit", "-q", "-m", "History", cwd=work)
+            git("push", "-q", "-u", "origin", name, cwd=work)
+        print(f"{'Method':<11}{'Run':<11}{'Result':<22}{'total ms':>9}   steps (ms)")
+
+        for round_number in range(args.rounds):
+            day = args.days + round_number
+            for name in ("legacy", "publisher"):
+                work = os.path.join(tmp, name)
+                write_run(work, day, seed=len(name))
+                message = f"Daily AI News Report Update - day {day}"
+                for scenario in ("new", "unchanged"):
+                    if name == "legacy":
+                        ok, timings = legacy_publish(work, message)
+                        show(name, scenario, "pushed" if ok else "failed (git error)", timings)
+                    else:
+                        result = publish_report(work, FILES, message)
+                        outcome = "committed and pushed" if result.pushed else "skipped"
+                        show(name, scenario, outcome, result.timings)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Report Load Benchmark - Cost of loading the report on each website rerun
+
+Streamlit reruns app.py on every interaction. This times what each rerun
+spends getting the report, for reports of growing size:
+
+    markdown     read daily_ai_news_report.md and parse it in two passes
+                 (what the website did before the report artifact)
+    json         read and decode the versioned daily_ai_news_report.json
+    memoized     load_report on an unchanged artifact: one stat() and a
+                 dictionary lookup
+
+Usage:
+    python benchmarks/bench_report_load.py [--items 15 100 500] [--repeat 200]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from article_store import CATEGORIES
+from report_data import build_report_data, load_report, parse_markdown_report, read_report_data, save_report_data
+from scraper import generate_markdown_report
+
+WORDS = (
+    "model release research lab safety benchmark training inference chip cloud startup funding "
+    "agency defense security drone policy regulation europe open weights developer platform users"
+).split()
+
+def make_articles(per_section, seed=0):
+    """Categorized article dictionaries with per_section articles in each category"""
+    rng = random.Random(seed)
+    return {
+        category: [
+            {
+                "title": " ".join(rng.choices(WORDS, k=8)).capitalize(),
+                "content": " ".join(rng.choices(WORDS, k=80)),
+                "url": f"https://example.com/{category}/{n}",
+                "source": f"Source {n % 25}",
+                "date": "2025-07-01",
+                "category": category,
+            }
+            for n in range(per_section)
+        ]
+        for category in CATEGORIES
+    }
+
+def read_markdown(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_markdown_report(f.read())
+
+def timed(func, repeat):
+    """Return the mean microseconds per call"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, nargs="+", default=[15, 100, 500], help="Items per section")
+    parser.add_argument("--repeat", type=int, default=200, help="Loads timed per method")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(f"{'items':>7}{'md KiB':>8}{'json KiB':>10}{'markdown us':>13}{'json us':>10}{'memoized us':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        md_path = os.path.join(tmp, "daily_ai_news_report.md")
+        json_path = os.path.join(tmp, "daily_ai_news_report.json")
+        for per_section in args.items:
+            articles = make_articles(per_section)
+            generate_markdown_report(articles, filename=md_path)
+            save_report_data(build_report_data(articles, items_per_section=per_section), json_path)
+
+            from_markdown = [item["title"] for section in read_markdown(md_path)["sections"] for item in section["items"]]
+            from_json = [item["title"] for section in read_report_data(json_path)["sections"] for item in section["items"]]
+            if from_markdown != from_json:
+                print("WARNING: markdown and report data items differ")
+
+            markdown_time = timed(lambda: read_markdown(md_path), args.repeat)
+            json_time = timed(lambda: read_report_data(json_path), args.repeat)
+            load_report(json_path)
+            memoized_time = timed(lambda: load_report(json_path), args.repeat)
+            print(f"{per_section * len(CATEGORIES):>7}{os.path.getsize(md_path) / 1024:>8.0f}"
+                  f"{os.path.getsize(json_path) / 1024:>10.0f}{markdown_time:>13.0f}{json_time:>10.0f}"
+                  f"{memoized_time:>13.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Scrape Benchmark - End-to-end throughput of scraping and report generation
+
+Runs scrape_all_sources and the report builder against the local fixture
+server (see fixture_server.py), so no request leaves the machine. The fixture
+server runs in a child process, so the CPU time reported for each stage is the
+scraper's own.
+
+Usage:
+    python benchmarks/bench_scrape.py [--concurrent] [--latency 0.05]
+        [--failure-rate 0.05] [--articles-per-source 5] [--cache] [--polite]
+        [--prefilter skip] [--depth listing]
+
+Reported per stage: wall time, CPU time, requests, requests/sec and bytes
+served. With --cache the scrape runs twice against one HTTP cache to show the
+cold and warm (conditional GET) cost. --prefilter and --depth override the
+setting of every HTML source to compare the article page fetches they save.
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def _serve(conn, latency, failure_rate, articles):
+    """Child process: start the fixture servers and hand their sources back"""
+    from fixture_server import FixtureServer
+    server = FixtureServer(latency=latency, failure_rate=failure_rate, articles=articles)
+    conn.send(server.start())
+    conn.recv()
+    server.stop()
+
+def server_stats(sources):
+    """Read the fixture server counters"""
+    with urllib.request.urlopen(sources[0]["url"] + "__stats") as response:
+        return json.load(response)
+
+def run_stage(name, sources, func, results):
+    """Run one stage, recording wall time, CPU time and the requests it caused"""
+    before = server_stats(sources)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    value = func()
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    after = server_stats(sources)
+    results.append({
+        "stage": name,
+        "wall": wall,
+        "cpu": cpu,
+        "requests": after["requests"] - before["requests"],
+        "bytes": after["bytes"] - before["bytes"],
+        "failures": after["failures"] - before["failures"],
+    })
+    return value
+
+def print_results(results):
+    print(f"{'Stage':<16}{'wall s':>9}{'cpu s':>9}{'requests':>10}{'req/s':>9}{'KiB':>10}{'503s':>7}")
+    for result in results:
+        rate = result["requests"] / result["wall"] if result["wall"] else 0
+        print(f"{result['stage']:<16}{result['wall']:>9.2f}{result['cpu']:>9.2f}{result['requests']:>10}"
+              f"{rate:>9.1f}{result['bytes'] / 1024:>10.0f}{result['failures']:>7}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles-per-source", type=int, default=5)
+    parser.add_argument("--fixture-articles", type=int, default=20, help="Articles served per source")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of delay per response")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Probability of a 503 response")
+    parser.add_argument("--concurrent", action="store_true", help="Use the concurrent scraping mode")
+    parser.add_argument("--workers", type=int, default=8, help="Fetch workers in concurrent mode")
+    parser.add_argument("--cache", action="store_true", help="Run a cold and a warm scrape with an HTTP cache")
+    parser.add_argument("--polite", action="store_true", help="Keep the default per-host rate limits")
+    parser.add_argument("--prefilter", choices=("deprioritize", "skip", "off"), help="Preview filter of HTML sources")
+    parser.add_argument("--depth", choices=("detail", "listing"), help="Scrape depth of HTML sources")
+    parser.add_argument("--verbose", action="store_true", help="Show scraper log output")
+    args = parser.parse_args()
+
+    parent_conn, child_conn = multiprocessing.Pipe()
+    server_process = multiprocessing.Process(
+        target=_serve, args=(child_conn, args.latency, args.failure_rate, args.fixture_articles), daemon=True
+    )
+    server_process.start()
+    sources = parent_conn.recv()
+    overrides = {key: value for key, value in (("prefilter", args.prefilter), ("depth", args.depth)) if value}
+    sources = [dict(source, **overrides) if source["type"] == "html" else source for source in sources]
+
+    import circuit_breaker
+    import http_cache
+    import http_client
+    import politeness
+    from scraper import scrape_all_sources
+    from generate_and_push_report import build_report_text
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep the benchmark away from the persistent state of real runs
+        cache = http_cache.HTTPCache(os.path.join(tmp, "cache.sqlite3")) if args.cache else None
+        http_client.configure_client(cache=cache)
+        circuit_breaker.configure_breakers(path=None)
+        if not args.polite:
+            politeness.configure_scheduler(rate=1000, burst=1000, respect_robots=False)
+
+        def scrape():
+            return scrape_all_sources(
+                articles_per_source=args.articles_per_source, concurrent=args.concurrent,
+                max_workers=args.workers, sources=sources
+            )
+
+        results = []
+        articles = run_stage("scrape", sources, scrape, results)
+        if args.cache:
+            articles = run_stage("scrape (warm)", sources, scrape, results)
+        run_stage("report", sources, lambda: build_report_text(articles), results)
+        http_client.get_client().close()
+
+    parent_conn.send("stop")
+    server_process.join(timeout=5)
+
+    mode = "concurrent" if args.concurrent else "sequential"
+    print(f"\n{len(sources)} sources, {mode}, latency {args.latency * 1000:.0f} ms, "
+          f"failure rate {args.failure_rate:.0%}, {sum(len(v) for v in articles.values())} articles")
+    print_results(results)
+
+if __name__ == "__main__":
+    main()
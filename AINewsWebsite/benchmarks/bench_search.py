@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Search Benchmark - Full-text search latency over a year of article history
+
+Fills an ArticleStore with one run per day of synthetic articles (about 45 a
+day, as the daily job keeps), timing the upserts that also maintain the
+full-text index. It then times ArticleStore.search for common, rare,
+multi-word, prefix and filtered queries, next to a LIKE scan of the articles
+table as the no-index baseline. The scan is unranked and walks the date index
+newest first, so it is quick when most articles match and slowest when few
+or none do; ranked search does the most work for words in most articles.
+
+Usage:
+    python benchmarks/bench_search.py [--days 365] [--per-day 45] [--db FILE]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from article_store import CATEGORIES, ArticleStore
+
+VOCABULARY = (
+    "model release research lab safety benchmark training inference chip cloud startup funding "
+    "agency defense security drone policy regulation europe open weights developer platform users "
+    "results evaluation dataset reasoning agents robotics vision speech language company partnership"
+).split()
+SOURCES = [f"Source {n}" for n in range(25)]
+
+QUERIES = [
+    ("common word", "model", {}),
+    ("two words", "drone security", {}),
+    ("rare word", "quantization", {}),
+    ("prefix", "robot*", {}),
+    ("filtered", "policy", {"categories": ["defense_security"], "start_date": "2025-06-01"}),
+    ("no match", "zeppelin", {}),
+]
+
+def word_list(rng, size=5000):
+    """Synthetic vocabulary with the real topic words at the head of the distribution"""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    filler = {"".join(rng.choice(letters) for _ in range(rng.randint(4, 10))) for _ in range(size)}
+    return VOCABULARY + sorted(filler) + ["quantization"]
+
+def make_article(rng, words, weights, day, n):
+    # Full text of about 2,000 characters; the stored excerpt is its first 600
+    text = " ".join(rng.choices(words, weights, k=300))
+    return {
+        "title": " ".join(rng.choices(words, weights, k=8)).capitalize(),
+        "content": text[:600],
+        "text": text,
+        "url": f"https://example.com/{day.isoformat()}/{n}",
+        "source": rng.choice(SOURCES),
+        "date": day.isoformat(),
+        "category": rng.choice(CATEGORIES),
+    }
+
+def fill(store, days, per_day, seed=0):
+    """Store one run per day; return the seconds spent in upserts"""
+    rng = random.Random(seed)
+    words = word_list(rng)
+    # Zipf-like word frequencies, like natural text
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    start = date(2025, 1, 1)
+    elapsed = 0.0
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        articles = [make_article(rng, words, weights, day, n) for n in range(per_day)]
+        begin = time.perf_counter()
+        store.upsert_articles(articles, run_id=f"{day.isoformat()}T01:00:00")
+        elapsed += time.perf_counter() - begin
+    return elapsed
+
+def like_scan(store, text, limit=20):
+    """Baseline: every word somewhere in the title or content, newest first"""
+    words = text.replace("*", "").split()
+    clause = " AND ".join("(title LIKE ? OR content LIKE ?)" for _ in words)
+    params = [value for word in words for value in (f"%{word}%", f"%{word}%")]
+    return store._conn.execute(
+        f"SELECT title, url FROM articles WHERE {clause} ORDER BY date DESC LIMIT ?", params + [limit]
+    ).fetchall()
+
+def timed(func, repeat):
+    """Return (median ms, max ms, result) over repeat calls"""
+    times = []
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        result = func()
+        times.append((time.perf_counter() - begin) * 1000)
+    return statistics.median(times), max(times), result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=365, help="Days of history")
+    parser.add_argument("--per-day", type=int, default=45, help="Articles stored per daily run")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions per query")
+    parser.add_argument("--db", help="Database file to use, kept afterwards (default: a temporary file)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db or os.path.join(tmp, "articles.sqlite3")
+        store = ArticleStore(path)
+        upsert_time = fill(store, args.days, args.per_day)
+        total = store.count()
+        print(f"Stored {total} articles in {args.days} runs: {upsert_time:.2f}s of upserts "
+              f"({upsert_time / args.days * 1000:.1f} ms per run), {os.path.getsize(path) / 2**20:.1f} MiB")
+        print()
+        print(f"{'Query':<14}{'text':<16}{'hits':>6}{'search ms':>11}{'max ms':>9}{'LIKE ms':>10}")
+        for name, text, filters in QUERIES:
+            median, worst, results = timed(lambda: store.search(text, **filters), args.repeat)
+            like_median = "-"
+            if not filters:
+                like_median, _, _ = timed(lambda: like_scan(store, text), max(1, args.repeat // 4))
+                like_median = f"{like_median:.1f}"
+            print(f"{name:<14}{text:<16}{len(results):>6}{median:>11.2f}{worst:>9.2f}{like_median:>10}")
+        store.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Static Site Load Test - Requests per second for the pre-rendered report page
+
+Builds the static site for a synthetic report and load-tests two local
+servers with concurrent keep-alive clients:
+
+    per-request   reads the report data and renders the page for every
+                  request, uncompressed - the work each website session did
+                  before the page was pre-rendered
+    pre-rendered  serves static/index.html as built by static_site.build_site,
+                  picking the .br or .gz copy from Accept-Encoding
+
+Usage:
+    python benchmarks/bench_static.py [--clients 8] [--requests 500] [--items 15]
+"""
+
+import argparse
+import http.client
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_report_load import make_articles
+from report_data import build_report_data, read_report_data, save_report_data
+from static_site import brotli, build_site, render_page
+
+def make_handler(site_dir, data_path, prerendered):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if not prerendered:
+                stylesheet = next(name for name in os.listdir(site_dir) if name.endswith(".css"))
+                body = render_page(read_report_data(data_path), stylesheet).encode("utf-8")
+                encoding = None
+            else:
+                path = os.path.join(site_dir, "index.html")
+                accepted = self.headers.get("Accept-Encoding", "")
+                encoding = None
+                for candidate, suffix in (("br", ".br"), ("gzip", ".gz")):
+                    if candidate in accepted and os.path.exists(path + suffix):
+                        path, encoding = path + suffix, candidate
+                        break
+                with open(path, "rb") as f:
+                    body = f.read()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+def load_test(port, clients, requests_per_client, accept_encoding):
+    """Return (requests/sec, bytes per response)"""
+    sizes = []
+
+    def client():
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        for _ in range(requests_per_client):
+            connection.request("GET", "/", headers={"Accept-Encoding": accept_encoding})
+            response = connection.getresponse()
+            sizes.append(len(response.read()))
+        connection.close()
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return len(sizes) / elapsed, sum(sizes) / len(sizes)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent keep-alive clients")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per client")
+    parser.add_argument("--items", type=int, default=15, help="Items per report section")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    encodings = ["identity", "gzip"] + (["br, gzip"] if brotli is not None else [])
+    with tempfile.TemporaryDirectory() as tmp:
+        site_dir = os.path.join(tmp, "static")
+        data_path = os.path.join(tmp, "daily_ai_news_report.json")
+        report = build_report_data(make_articles(args.items), items_per_section=args.items)
+        save_report_data(report, data_path)
+        build_site(report, site_dir)
+        if brotli is None:
+            print("brotli is not installed; only gzip copies are served")
+
+        print(f"{'Server':<14}{'Accept-Encoding':<17}{'req/s':>9}{'KiB/response':>14}")
+        for name, prerendered in (("per-request", False), ("pre-rendered", True)):
+            server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(site_dir, data_path, prerendered))
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            for accept_encoding in (["identity"] if not prerendered else encodings):
+                rate, size = load_test(server.server_address[1], args.clients, args.requests, accept_encoding)
+                print(f"{name:<14}{accept_encoding:<17}{rate:>9.0f}{size / 1024:>14.1f}")
+            server.shutdown()
+            server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Fixture Server - Serves listing pages, article pages and feeds for every source
+
+Each source in sources.toml gets its own local HTTP server (and so its own
+host:port), serving pages built from the source's configured selectors:
+
+    /                 listing page (HTML sources) or RSS feed (RSS sources)
+    /articles/<n>     article page
+    /__stats          JSON request and byte counters
+
+Latency and failures can be injected per request, and responses carry ETags so
+that conditional GETs are answered with 304.
+
+Usage as a standalone server:
+    python benchmarks/fixture_server.py [--latency 0.05] [--failure-rate 0.1]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from email.utils import formatdate
+from html import escape
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper import load_sources
+
+# Phrases mixed into article bodies so every category and some irrelevant
+# articles show up in the results
+TOPICS = [
+    "a new machine learning framework release with an open API for developers",
+    "AI security research on threat detection and defense against cyber attacks",
+    "large language model evaluation results from an artificial intelligence lab",
+    "deep learning startup funding and a partnership to launch a new platform",
+    "national security agencies testing autonomous drone surveillance with AI",
+    "quarterly earnings of a retail chain and its new store openings",
+]
+
+# Words that make each story's paragraphs distinct
+VOCABULARY = (
+    "researchers engineers company team results benchmark dataset customers users report study "
+    "quarter week month region europe asia market growth cost price scale training inference "
+    "evaluation rollout pilot program budget contract agency office lab university hospital"
+).split()
+
+# Share of articles that are wire stories syndicated by several sources, drawn
+# from a pool of WIRE_STORIES
+SYNDICATED_SHARE = 0.2
+WIRE_STORIES = 10
+
+def _element(selector, inner, extra_attrs=""):
+    """Render an element matching the first compound of a CSS selector"""
+    name, _, css_class = selector.split()[0].partition(".")
+    class_attr = f' class="{css_class}"' if css_class else ""
+    return f"<{name}{class_attr}{extra_attrs}>{inner}</{name}>"
+
+def _page(body):
+    """Wrap a body in typical page chrome (scripts, navigation, footer)"""
+    scripts = "".join(f"<script>window.cfg{i} = {{flag: {i}}};</script>" for i in range(20))
+    nav = "<nav>" + "".join(f'<a href="/section/{i}">Section {i}</a>' for i in range(80)) + "</nav>"
+    footer = "<footer>" + "".join(f'<a href="/legal/{i}">Legal {i}</a>' for i in range(30)) + "</footer>"
+    return f"<!DOCTYPE html><html><head><title>Fixture</title>{scripts}</head><body>{nav}{body}{footer}</body></html>"
+
+class SourceFixtures:
+    """Deterministic pages for one configured source"""
+
+    def __init__(self, source, articles=20, paragraphs=12, seed=0):
+        self.source = source
+        self.articles = articles
+        self.paragraphs = paragraphs
+        self.rng = random.Random(f"{seed}-{source['name']}")
+        self.stories = []
+        for n in range(articles):
+            if self.rng.random() < SYNDICATED_SHARE:
+                self.stories.append(f"{seed}-wire-{self.rng.randrange(WIRE_STORIES)}")
+            else:
+                self.stories.append(f"{seed}-{source['name']}-{n}")
+        self.topics = [random.Random(story).choice(TOPICS) for story in self.stories]
+
+    def title(self, n):
+        return f"{self.source['name']} story {n}: {self.topics[n].split(' with ')[0]}"
+
+    def paragraphs_for(self, n):
+        """Paragraphs of an article; syndicated wire stories share them across sources"""
+        rng = random.Random(self.stories[n])
+        return [
+            f"{' '.join(rng.choice(VOCABULARY) for _ in range(8)).capitalize()} on {self.topics[n]}, "
+            f"{' '.join(rng.choice(VOCABULARY) for _ in range(12))}."
+            for _ in range(self.paragraphs)
+        ]
+
+    def listing(self):
+        """Listing page whose cards match the source's card/link/title/preview selectors"""
+        source = self.source
+        cards = []
+        for n in range(self.articles):
+            href = f"/articles/{n}"
+            if source.get("link_contains"):
+                href = f"{source['link_contains'].rstrip('/')}/articles/{n}"
+            title = escape(self.title(n))
+            if source.get("link"):
+                inner = _element(source["link"], title, f' href="{href}"')
+                if source.get("card_title") and source["card_title"] != source["link"]:
+                    inner += _element(source["card_title"], title)
+                if source.get("preview"):
+                    inner += _element(source["preview"], escape(self.paragraphs_for(n)[0]))
+                cards.append(_element(source["card"], inner))
+            else:
+                cards.append(_element(source["card"], title, f' href="{href}"'))
+        return _page("<main>" + "".join(cards) + "</main>")
+
+    def article(self, n):
+        """Article page matching the source's title/date/content selectors"""
+        source = self.source
+        title = _element(source["title"], escape(self.title(n))) if source.get("title") else ""
+        date = f'<time datetime="2025-07-{1 + n % 28:02d}T09:00:00Z">July {1 + n % 28}</time>'
+        paragraphs = "".join(f"<p>{escape(text)}</p>" for text in self.paragraphs_for(n))
+        content_container = source["content"].split()[0]
+        return _page(f"<article>{title}{date}{_element(content_container, paragraphs)}</article>")
+
+    def feed(self, base_url):
+        """RSS 2.0 feed with one item per article"""
+        items = []
+        for n in range(self.articles):
+            description = escape("".join(f"<p>{text}</p>" for text in self.paragraphs_for(n)))
+            items.append(
+                f"<item><title>{escape(self.title(n))}</title>"
+                f"<link>{base_url}articles/{n}</link>"
+                f"<description>{description}</description>"
+                f"<pubDate>{formatdate(1750000000 + n * 86400, usegmt=True)}</pubDate></item>"
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>{escape(self.source['name'])}</title><link>{base_url}</link>"
+            f"<description>Fixture feed</description>{''.join(items)}</channel></rss>"
+        )
+
+class FixtureServer:
+    """One local HTTP server per source, with latency and failure injection"""
+
+    def __init__(self, sources=None, latency=0.0, failure_rate=0.0, articles=20, seed=0):
+        """
+        Args:
+            sources: Source configurations, defaults to sources.toml
+            latency: Seconds each response is delayed
+            failure_rate: Probability of answering a request with 503
+            articles: Number of articles per source
+            seed: Seed for fixture content and failure injection
+        """
+        self.sources = load_sources() if sources is None else sources
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.articles = articles
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.requests = 0
+        self.bytes_sent = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+        self._servers = []
+
+    def start(self):
+        """
+        Start the servers
+
+        Returns:
+            List of source configurations rewritten to point at the local servers
+        """
+        local_sources = []
+        for source in self.sources:
+            fixtures = SourceFixtures(source, articles=self.articles, seed=self.seed)
+            server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler(source, fixtures))
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self._servers.append(server)
+            local_sources.append(dict(source, url=f"http://127.0.0.1:{server.server_port}/"))
+        return local_sources
+
+    def stop(self):
+        """Stop all servers"""
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers = []
+
+    def stats(self):
+        """Return request, byte and injected failure counters"""
+        with self._lock:
+            return {"requests": self.requests, "bytes": self.bytes_sent, "failures": self.failures}
+
+    def reset_stats(self):
+        """Zero the counters"""
+        with self._lock:
+            self.requests = self.bytes_sent = self.failures = 0
+
+    def _should_fail(self):
+        with self._lock:
+            return self.failure_rate and self.rng.random() < self.failure_rate
+
+    def _record(self, nbytes, failed=False):
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += nbytes
+            self.failures += int(failed)
+
+    def _handler(self, source, fixtures):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path == "/__stats":
+                    return self._send(200, json.dumps(server.stats()).encode(), "application/json", count=False)
+
+                if server.latency:
+                    time.sleep(server.latency)
+                if server._should_fail():
+                    return self._send(503, b"Service Unavailable", "text/plain", failed=True)
+
+                path = self.path.split("?")[0]
+                base_url = f"http://127.0.0.1:{self.server.server_port}/"
+                if path == "/":
+                    if source["type"] == "rss":
+                        return self._send(200, fixtures.feed(base_url).encode(), "application/rss+xml; charset=utf-8")
+                    return self._send(200, fixtures.listing().encode(), "text/html; charset=utf-8")
+
+                number = path.rstrip("/").rsplit("/", 1)[-1]
+                if "/articles/" in path and number.isdigit() and int(number) < fixtures.articles:
+                    return self._send(200, fixtures.article(int(number)).encode(), "text/html; charset=utf-8")
+                return self._send(404, b"Not Found", "text/plain")
+
+            def _send(self, status, body, content_type, failed=False, count=True):
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                if status == 200 and self.headers.get("If-None-Match") == etag:
+                    status, body = 304, b""
+
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                if status in (200, 304):
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+                if count:
+                    server._record(len(body), failed)
+
+        return Handler
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of delay per response")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Probability of a 503 response")
+    parser.add_argument("--articles", type=int, default=20, help="Articles per source")
+    args = parser.parse_args()
+
+    server = FixtureServer(latency=args.latency, failure_rate=args.failure_rate, articles=args.articles)
+    for source in server.start():
+        print(f"{source['name']:<24} {source['url']}")
+    print("Serving fixtures, press Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
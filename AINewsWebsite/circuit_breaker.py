@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Circuit Breaker - Stops fetching from hosts that keep failing
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger("ai_news_scraper.breaker")
+
+DEFAULT_BREAKER_PATH = ".circuit_breakers.json"
+# Consecutive failed URLs that open a host's breaker
+DEFAULT_FAILURE_THRESHOLD = 5
+# Seconds an open breaker stays open before a single half-open probe is allowed;
+# longer than a run, so an opened host is skipped for the rest of the run and
+# probed again by the next daily run
+DEFAULT_RESET_TIMEOUT = 6 * 60 * 60
+
+# HTTP statuses that say the host itself is failing or overloaded; any other
+# error status is a problem with one URL and does not count against the host
+HOST_FAILURE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitBreakerRegistry:
+    """
+    Per-host circuit breakers persisted in a JSON file
+
+    A breaker opens after failure_threshold consecutive failed requests to its
+    host. While open, requests to the host are refused. Once reset_timeout has
+    passed, one probe request is let through (half-open): success closes the
+    breaker, failure opens it again for another reset_timeout.
+    """
+
+    def __init__(self, path=DEFAULT_BREAKER_PATH, failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout=DEFAULT_RESET_TIMEOUT):
+        """
+        Load or create breaker state
+
+        Args:
+            path: JSON file holding breaker state between runs, or None to keep
+                state in memory only
+            failure_threshold: Consecutive failures that open a breaker
+            reset_timeout: Seconds before an open breaker allows a probe
+        """
+        self.path = path
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.skipped = {}
+        self._probing = set()
+        self._lock = threading.Lock()
+        self._states = self._load()
+
+    def _load(self):
+        """Read persisted breaker state, ignoring a missing or corrupt file"""
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable circuit breaker state {self.path}: {e}")
+            return {}
+
+    def _save(self):
+        """Write breaker state atomically; callers hold the lock"""
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._states, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _host(url):
+        return urlparse(url).netloc.lower()
+
+    def state(self, url):
+        """Return the breaker state of a URL's host"""
+        with self._lock:
+            return self._states.get(self._host(url), {}).get("state", CLOSED)
+
+    def allow(self, url):
+        """
+        Check whether a request to a URL's host may be sent
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            True if the request may go ahead
+        """
+        host = self._host(url)
+        with self._lock:
+            entry = self._states.get(host)
+            if entry is None or entry["state"] == CLOSED:
+                return True
+
+            if entry["state"] == OPEN and time.time() - entry["opened_at"] >= self.reset_timeout:
+                entry["state"] = HALF_OPEN
+                self._save()
+                logger.info(f"Circuit breaker for {host} is half-open, sending a probe request")
+
+            # Only one probe at a time while half-open
+            if entry["state"] == HALF_OPEN and host not in self._probing:
+                self._probing.add(host)
+                return True
+
+            self.skipped[host] = self.skipped.get(host, 0) + 1
+            return False
+
+    def is_open(self, url):
+        """Return True if a URL's host is open and retries should stop"""
+        return self.state(url) == OPEN
+
+    def record_success(self, url):
+        """Record a successful request, closing the host's breaker"""
+        host = self._host(url)
+        with self._lock:
+            self._probing.discard(host)
+            entry = self._states.get(host)
+            if entry is None or (entry["state"] == CLOSED and entry["failures"] == 0):
+                return
+            if entry["state"] != CLOSED:
+                logger.info(f"Circuit breaker for {host} closed")
+            self._states[host] = {"state": CLOSED, "failures": 0, "opened_at": None}
+            self._save()
+
+    def release(self, url):
+        """
+        Give up a host's half-open probe without a result
+
+        Called after every request, so a probe that ended in an unexpected
+        error does not keep the host blocked for the rest of the run; after
+        record_success() or record_failure() it does nothing.
+        """
+        with self._lock:
+            self._probing.discard(self._host(url))
+
+    def record_failure(self, url):
+        """Record a failed request, opening the host's breaker past the threshold"""
+        host = self._host(url)
+        with self._lock:
+            self._probing.discard(host)
+            entry = self._states.setdefault(host, {"state": CLOSED, "failures": 0, "opened_at": None})
+            entry["failures"] += 1
+
+            if entry["state"] == HALF_OPEN or (
+                    entry["state"] == CLOSED and entry["failures"] >= self.failure_threshold):
+                entry["state"] = OPEN
+                entry["opened_at"] = time.time()
+                logger.warning(f"Circuit breaker for {host} opened after {entry['failures']} consecutive failures; "
+                               f"skipping it for {self.reset_timeout / 3600:.0f} hours")
+            self._save()
+
+    def log_stats(self):
+        """Log the hosts whose breakers are open and the requests skipped in this run"""
+        with self._lock:
+            open_hosts = sorted(host for host, entry in self._states.items() if entry["state"] != CLOSED)
+            skipped = dict(self.skipped)
+        for host in open_hosts:
+            logger.info(f"Circuit breaker open for {host}: {skipped.get(host, 0)} requests skipped")
+
+def is_host_failure(error):
+    """
+    Whether a failed request counts against its host's breaker
+
+    Connection errors, timeouts and HOST_FAILURE_STATUSES responses do; a 404
+    or other client error on one article does not.
+
+    Args:
+        error: requests.exceptions.RequestException raised by the request
+
+    Returns:
+        True if the error should be recorded with record_failure()
+    """
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code in HOST_FAILURE_STATUSES
+    return False
+
+_breakers = None
+_breakers_lock = threading.Lock()
+
+def get_breakers():
+    """Return the shared circuit breaker registry, loading DEFAULT_BREAKER_PATH if needed"""
+    global _breakers
+    with _breakers_lock:
+        if _breakers is None:
+            _breakers = CircuitBreakerRegistry()
+        return _breakers
+
+def configure_breakers(**kwargs):
+    """
+    Replace the shared circuit breaker registry
+
+    Args:
+        **kwargs: Arguments passed to CircuitBreakerRegistry, e.g. failure_threshold
+
+    Returns:
+        The new CircuitBreakerRegistry
+    """
+    global _breakers
+    with _breakers_lock:
+        _breakers = CircuitBreakerRegistry(**kwargs)
+        return _breakers
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Detection - Groups syndicated copies of a story with MinHash and LSH
+"""
+
+import hashlib
+import logging
+import random
+import re
+import sqlite3
+import threading
+from array import array
+from datetime import datetime, timedelta
+
+logger = logging.getLogger("ai_news_scraper.dedupe")
+
+DEFAULT_SIGNATURE_PATH = ".article_signatures.sqlite3"
+# Words per shingle
+SHINGLE_SIZE = 3
+# Signature length, split into LSH bands of BAND_ROWS values. With 32 bands of
+# 4 rows, pairs with a Jaccard similarity above about 0.4 become candidates
+NUM_PERM = 128
+BAND_ROWS = 4
+# Estimated Jaccard similarity at which two candidates are duplicates
+DEFAULT_THRESHOLD = 0.5
+# Days of signatures kept to dedupe later runs against
+HISTORY_DAYS = 30
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_WORD_RE = re.compile(r"\w+")
+
+def _hash64(data):
+    """Stable 64-bit hash of bytes, the same in every process"""
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+class MinHasher:
+    """Computes MinHash signatures of word shingles and their LSH band keys"""
+
+    def __init__(self, num_perm=NUM_PERM, band_rows=BAND_ROWS, shingle_size=SHINGLE_SIZE, seed=1):
+        """
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            band_rows: Signature values per LSH band
+            shingle_size: Words per shingle
+            seed: Seed of the permutations; stored signatures are only
+                comparable when it stays the same
+        """
+        if num_perm % band_rows:
+            raise ValueError("num_perm must be a multiple of band_rows")
+        self.num_perm = num_perm
+        self.band_rows = band_rows
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+
+    def shingles(self, text):
+        """Return the set of word shingles of a text"""
+        words = _WORD_RE.findall(text.lower())
+        if len(words) <= self.shingle_size:
+            return {" ".join(words)} if words else set()
+        size = self.shingle_size
+        return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+    def signature(self, text):
+        """
+        Compute the MinHash signature of a text
+
+        Args:
+            text: Text to sign
+
+        Returns:
+            Tuple of num_perm integers
+        """
+        hashes = [_hash64(shingle.encode("utf-8")) for shingle in self.shingles(text)] or [0]
+        prime = _MERSENNE_PRIME
+        return tuple(min((a * h + b) % prime for h in hashes) for a, b in self._perms)
+
+    def band_keys(self, signature):
+        """Return one hash per LSH band of a signature, as signed 64-bit integers"""
+        rows = self.band_rows
+        keys = []
+        for band, start in enumerate(range(0, len(signature), rows)):
+            data = array("Q", (band,) + signature[start:start + rows]).tobytes()
+            keys.append(int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big", signed=True))
+        return keys
+
+    @staticmethod
+    def similarity(first, second):
+        """Estimate the Jaccard similarity of two signatures"""
+        return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+class SignatureStore:
+    """
+    SQLite store of MinHash signatures and band keys of articles from earlier runs
+
+    Signatures of the articles a run keeps are staged in memory and only
+    written by commit(), which the daily job calls with the URLs of the
+    articles in its saved report. A story that was kept but never reported,
+    because of the section cap or a failed run, is not treated as covered.
+    """
+
+    def __init__(self, path=DEFAULT_SIGNATURE_PATH, history_days=HISTORY_DAYS):
+        """
+        Open or create a store, dropping signatures older than history_days
+
+        Args:
+            path: SQLite database file, or ":memory:" for a throwaway store
+            history_days: Days of signatures to keep
+        """
+        self.path = path
+        self.matched = 0
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS signatures (
+                url TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                signature BLOB NOT NULL,
+                seen_on TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS signature_bands (
+                band_key INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                PRIMARY KEY (band_key, url)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS signature_bands_url ON signature_bands (url);
+        """)
+        cutoff = (datetime.now() - timedelta(days=history_days)).isoformat(timespec="seconds")
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM signature_bands WHERE url IN (SELECT url FROM signatures WHERE seen_on < ?)", (cutoff,)
+            )
+            self._conn.execute("DELETE FROM signatures WHERE seen_on < ?", (cutoff,))
+
+    def find_match(self, url, signature, band_keys, threshold=DEFAULT_THRESHOLD):
+        """
+        Find a stored article that is a near duplicate of a signature
+
+        Args:
+            url: URL of the article being checked; its own entry never matches
+            signature: MinHash signature of the article
+            band_keys: LSH band keys of the signature
+            threshold: Minimum estimated Jaccard similarity
+
+        Returns:
+            (url, title) of the stored duplicate, or None
+        """
+        placeholders = ",".join("?" * len(band_keys))
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT s.url, s.title, s.signature FROM signatures s
+                WHERE s.url IN (SELECT DISTINCT url FROM signature_bands WHERE band_key IN ({placeholders}))
+                  AND s.url != ?
+            """, (*band_keys, url)).fetchall()
+
+        for stored_url, title, blob in rows:
+            if MinHasher.similarity(signature, array("Q", blob)) >= threshold:
+                self.matched += 1
+                return stored_url, title
+        return None
+
+    def add_many(self, entries):
+        """
+        Store signatures in one transaction
+
+        Args:
+            entries: Iterable of (url, title, signature, band_keys) tuples
+        """
+        seen_on = datetime.now().isoformat(timespec="seconds")
+        with self._lock, self._conn:
+            for url, title, signature, band_keys in entries:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO signatures (url, title, signature, seen_on) VALUES (?, ?, ?, ?)",
+                    (url, title, array("Q", signature).tobytes(), seen_on)
+                )
+                self._conn.execute("DELETE FROM signature_bands WHERE url = ?", (url,))
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO signature_bands (band_key, url) VALUES (?, ?)",
+                    [(key, url) for key in band_keys]
+                )
+
+    def stage(self, url, title, signature, band_keys):
+        """Hold the signature of an article kept by this run until commit()"""
+        with self._lock:
+            self._pending[url] = (url, title, signature, band_keys)
+
+    def unstage(self, url):
+        """Drop a staged signature, e.g. of an article replaced by a better duplicate"""
+        with self._lock:
+            self._pending.pop(url, None)
+
+    def commit(self, urls):
+        """
+        Store the staged signatures of the reported articles and drop the rest
+
+        Args:
+            urls: URLs of the articles in the saved report
+
+        Returns:
+            Number of signatures stored
+        """
+        with self._lock:
+            entries = [self._pending[url] for url in urls if url in self._pending]
+            self._pending.clear()
+        self.add_many(entries)
+        return len(entries)
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+
+    def log_stats(self):
+        """Log how many articles matched stories from earlier runs"""
+        logger.info(f"Signature store: {self.matched} articles matched earlier stories, {len(self)} signatures kept")
+
+    def close(self):
+        """Close the store database"""
+        with self._lock:
+            self._conn.close()
+
+class StreamingDeduplicator:
+    """
+    Near-duplicate filter for articles that arrive one at a time
+
+    Kept articles are indexed by their LSH band keys as they arrive. A new
+    article that duplicates a kept one is dropped, unless it is the better
+    representative (longer full text), in which case it replaces the kept one
+    and the caller is told which article it supersedes. With a store, articles
+    matching a story reported in an earlier run are dropped, and the
+    signatures of kept articles are staged in the store for
+    SignatureStore.commit().
+    """
+
+    def __init__(self, store=None, hasher=None, threshold=DEFAULT_THRESHOLD):
+        """
+        Args:
+            store: Optional SignatureStore holding signatures from earlier runs
+            hasher: Optional MinHasher, defaults to the standard settings
+            threshold: Minimum estimated Jaccard similarity of duplicates
+        """
+        self.store = store
+        self.hasher = hasher or MinHasher()
+        self.threshold = threshold
+        self.seen = 0
+        self.dropped = 0
+        self._kept = []
+        self._buckets = {}
+
+    def add(self, article):
+        """
+        Offer an article to the filter
+
+        Args:
+            article: ArticleInfo object
+
+        Returns:
+            (keep, replaced) where keep is False if the article is a duplicate to
+            drop, and replaced is the previously kept article it supersedes, or None
+        """
+        self.seen += 1
+        signature = self.hasher.signature(f"{article.title}\n{article.full_text()}")
+        band_keys = self.hasher.band_keys(signature)
+
+        for key in band_keys:
+            for slot in self._buckets.get(key, ()):
+                kept, kept_signature = self._kept[slot]
+                if self.hasher.similarity(signature, kept_signature) < self.threshold:
+                    continue
+                self.dropped += 1
+                if _representative_score(article) <= _representative_score(kept):
+                    logger.info(f"Dropping duplicate '{article.title}' ({article.source}), "
+                                f"keeping '{kept.title}' ({kept.source})")
+                    return False, None
+
+                logger.info(f"Dropping duplicate '{kept.title}' ({kept.source}), "
+                            f"keeping '{article.title}' ({article.source})")
+                if self.store is not None:
+                    # The superseded article will not be reported, so later
+                    # runs must not treat its story as covered through it
+                    self.store.unstage(kept.url)
+                self._keep(slot, article, signature, band_keys)
+                return True, kept
+
+        if self.store is not None:
+            match = self.store.find_match(article.url, signature, band_keys, self.threshold)
+            if match:
+                self.dropped += 1
+                logger.info(f"Dropping '{article.title}' ({article.source}), already reported as '{match[1]}'")
+                return False, None
+
+        self._kept.append(None)
+        self._keep(len(self._kept) - 1, article, signature, band_keys)
+        return True, None
+
+    def _keep(self, slot, article, signature, band_keys):
+        """Index an accepted article under its band keys and stage its signature"""
+        self._kept[slot] = (article, signature)
+        for key in band_keys:
+            slots = self._buckets.setdefault(key, [])
+            if slot not in slots:
+                slots.append(slot)
+        if self.store is not None:
+            self.store.stage(article.url, article.title, signature, band_keys)
+
+    def log_stats(self):
+        """Log how many articles were dropped as duplicates"""
+        logger.info(f"Deduplication kept {self.seen - self.dropped} of {self.seen} articles")
+
+def _representative_score(article):
+    """Rank duplicates by the length of their full text; ties keep the earliest scraped"""
+    return article.length
+
+def deduplicate_articles(articles, store=None, hasher=None, threshold=DEFAULT_THRESHOLD):
+    """
+    Drop near-duplicate articles from a list, keeping the best representative of each story
+
+    Runs the list through a StreamingDeduplicator, the filter the scraping
+    pipeline applies as articles arrive.
+
+    Args:
+        articles: List of ArticleInfo objects
+        store: Optional SignatureStore holding signatures from earlier runs;
+            the kept articles' signatures are staged in it for commit()
+        hasher: Optional MinHasher, defaults to the standard settings
+        threshold: Minimum estimated Jaccard similarity of duplicates
+
+    Returns:
+        List of kept ArticleInfo objects, in the order they were accepted
+    """
+    deduplicator = StreamingDeduplicator(store=store, hasher=hasher, threshold=threshold)
+    kept = []
+    for article in articles:
+        keep, replaced = deduplicator.add(article)
+        if replaced is not None:
+            kept = [other for other in kept if other is not replaced]
+        if keep:
+            kept.append(article)
+    deduplicator.log_stats()
+    return kept
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Email Renderer - Single-pass conversion of the markdown report to HTML and plain-text email parts
+"""
+
+import re
+from collections import namedtuple
+from html import escape
+
+RenderedEmail = namedtuple("RenderedEmail", ["html", "text"])
+
+EMAIL_HTML_TEMPLATE = """<html>
+<head>
+    <meta charset="utf-8">
+    <title>{title}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }}
+        h1 {{ color: #2c3e50; border-bottom: 1px solid #eee; padding-bottom: 10px; }}
+        h2 {{ color: #3498db; margin-top: 30px; }}
+        h3 {{ color: #2980b9; margin-top: 25px; }}
+        a {{ color: #3498db; text-decoration: none; }}
+        a:hover {{ text-decoration: underline; }}
+        .source {{ color: #7f8c8d; font-style: italic; }}
+        .references {{ background-color: #f9f9f9; padding: 15px; border-radius: 5px; margin-top: 30px; }}
+        .references a {{ display: block; margin-bottom: 5px; }}
+    </style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+# "[Ref12] https://..." lines of the references section
+_REFERENCE_RE = re.compile(r"\[Ref(\d+)\]\s+(\S+)\s*$")
+# Bold text, reference markers and source attributions within a line
+_INLINE_RE = re.compile(r"\*\*(.+?)\*\*|\[Ref(\d+)\]|\((Source: [^()]*)\)")
+
+def _inline_html(text, references):
+    """Convert one line of report text to HTML, linking references found in the map"""
+    parts = []
+    position = 0
+    for match in _INLINE_RE.finditer(text):
+        parts.append(escape(text[position:match.start()]))
+        bold, ref, source = match.groups()
+        if bold is not None:
+            parts.append(f"<strong>{escape(bold)}</strong>")
+        elif ref is not None:
+            url = references.get(ref)
+            label = f"[Ref{ref}]"
+            parts.append(f'<a href="{escape(url)}">{label}</a>' if url else label)
+        else:
+            parts.append(f'<span class="source">({escape(source)})</span>')
+        position = match.end()
+    parts.append(escape(text[position:]))
+    return "".join(parts)
+
+def _inline_text(text):
+    """Strip markdown emphasis from one line of report text"""
+    return text.replace("**", "")
+
+def render_email(markdown_content):
+    """
+    Render the markdown report as HTML and plain-text email parts
+
+    The references section is read once into a map, then every line is
+    converted in a single pass: headings, paragraphs of report items with
+    bold titles, source attributions and [RefN] markers linked to their URLs,
+    and the references as a list of links. Text is HTML-escaped, so the
+    output is well-formed whatever the article titles contain.
+
+    Args:
+        markdown_content: Markdown report text
+
+    Returns:
+        RenderedEmail with the HTML document and the plain-text part
+    """
+    lines = markdown_content.splitlines()
+    references = {}
+    for line in lines:
+        match = _REFERENCE_RE.match(line)
+        if match:
+            references[match.group(1)] = match.group(2)
+
+    html_parts = []
+    text_parts = []
+    paragraph = []
+    in_references = False
+    title = ""
+
+    def end_paragraph():
+        if paragraph:
+            html_parts.append(f"<p>{'<br>'.join(paragraph)}</p>")
+            paragraph.clear()
+
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            end_paragraph()
+            continue
+
+        heading = len(stripped) - len(stripped.lstrip("#"))
+        if 1 <= heading <= 6 and stripped[heading:heading + 1] == " ":
+            end_paragraph()
+            text = stripped[heading + 1:].strip()
+            if in_references:
+                html_parts.append("</div>")
+                in_references = False
+            if heading == 1 and not title:
+                title = text
+            html_parts.append(f"<h{heading}>{_inline_html(text, references)}</h{heading}>")
+            underline = "=" if heading == 1 else "-"
+            text_parts.append(f"{_inline_text(text)}\n{underline * len(text)}\n")
+            if text == "References":
+                html_parts.append('<div class="references">')
+                in_references = True
+            continue
+
+        match = _REFERENCE_RE.match(stripped)
+        if in_references and match:
+            ref, url = match.groups()
+            html_parts.append(f'<a href="{escape(url)}">[Ref{ref}] {escape(url)}</a>')
+            text_parts.append(f"[Ref{ref}] {url}")
+            continue
+
+        paragraph.append(_inline_html(stripped, references))
+        text_parts.append(f"{_inline_text(stripped)}\n")
+
+    end_paragraph()
+    if in_references:
+        html_parts.append("</div>")
+
+    html = EMAIL_HTML_TEMPLATE.format(title=escape(title), body="\n".join(html_parts))
+    text = "\n".join(text_parts).strip() + "\n"
+    return RenderedEmail(html, text)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Feed Parser - Streaming RSS/Atom entry parser and lightweight HTML stripper
+"""
+
+import html
+import logging
+import re
+import time
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+import feedparser
+
+logger = logging.getLogger("ai_news_scraper.feeds")
+
+# Bytes handed to the XML parser at a time; parsing stops between chunks once
+# the caller has the entries it needs
+CHUNK_SIZE = 16 * 1024
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+RSS1_NS = "{http://purl.org/rss/1.0/}"
+CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+# RSS 2.0 items, RSS 1.0 (RDF) items and Atom entries
+ENTRY_TAGS = {"item", RSS1_NS + "item", ATOM_NS + "entry"}
+# Entry children read into FeedEntry fields, by tag. Extension elements in
+# other namespaces, such as media:title or itunes:summary, are ignored even
+# when their local name matches one of these
+ENTRY_FIELDS = {
+    **{name: name for name in ("title", "link", "description", "guid", "pubDate")},
+    **{RSS1_NS + name: name for name in ("title", "link", "description")},
+    **{ATOM_NS + name: name for name in ("title", "summary", "content", "published", "updated")},
+    CONTENT_ENCODED: "encoded",
+    DC_DATE: "dc_date",
+}
+
+FeedEntry = namedtuple("FeedEntry", ["title", "link", "content", "date"])
+
+# Elements whose text is set apart from the text around it
+BLOCK_TAGS = frozenset(
+    "p div br hr li ul ol h1 h2 h3 h4 h5 h6 tr td th table blockquote pre section article figure figcaption".split()
+)
+
+_SKIPPED_BLOCK_RE = re.compile(r"<(script|style)\b.*?</\1\s*>|<!--.*?-->", re.IGNORECASE | re.DOTALL)
+_BLOCK_TAG_RE = re.compile(r"</?(?:" + "|".join(sorted(BLOCK_TAGS)) + r")\b[^>]*>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]*>")
+
+def strip_html(markup):
+    """
+    Convert an HTML fragment such as a feed summary to plain text
+
+    Block-level tags become spaces so words in adjacent paragraphs stay apart;
+    scripts, styles and comments are dropped and entities are decoded.
+
+    Args:
+        markup: HTML fragment
+
+    Returns:
+        Plain text
+    """
+    if "<" not in markup and "&" not in markup:
+        return markup
+    text = _SKIPPED_BLOCK_RE.sub("", markup)
+    text = _BLOCK_TAG_RE.sub(" ", text)
+    text = _TAG_RE.sub("", text)
+    return html.unescape(text)
+
+def _local_name(tag):
+    """Strip the namespace from an element tag, e.g. {ns}title -> title"""
+    return tag.rsplit("}", 1)[-1]
+
+def _element_text(elem):
+    """Text of an element with child elements, such as Atom XHTML content, with blocks kept apart"""
+    parts = []
+
+    def walk(node):
+        block = _local_name(node.tag).lower() in BLOCK_TAGS
+        if block:
+            parts.append(" ")
+        parts.append(node.text or "")
+        for child in node:
+            walk(child)
+            parts.append(child.tail or "")
+        if block:
+            parts.append(" ")
+
+    walk(elem)
+    return "".join(parts)
+
+def _parse_date(value):
+    """Return YYYY-MM-DD for an RFC 822 or ISO 8601 date, or None"""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).strftime("%Y-%m-%d")
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        return datetime.fromisoformat(value).strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+def _entry_from_element(elem):
+    """Build a FeedEntry from a finished <item> or <entry> element"""
+    fields = {}
+    link = None
+    for child in elem:
+        if child.tag == ATOM_NS + "link":
+            # Atom links live in attributes; prefer the alternate (article) link
+            if child.get("rel", "alternate") == "alternate" and link is None:
+                link = child.get("href")
+            continue
+        name = ENTRY_FIELDS.get(child.tag)
+        if name is not None and name not in fields:
+            # Atom content may hold XHTML child elements instead of text
+            fields[name] = _element_text(child) if len(child) else (child.text or "")
+
+    if link is None:
+        link = fields.get("link") or fields.get("guid")
+    content = fields.get("encoded") or fields.get("content") or fields.get("description") or fields.get("summary") or ""
+    # Atom entries may only carry <updated>
+    date = _parse_date(fields.get("pubDate") or fields.get("published") or fields.get("dc_date")
+                       or fields.get("updated"))
+    return FeedEntry(fields.get("title", "").strip(), (link or "").strip(), content, date)
+
+def iter_entries(data, chunk_size=CHUNK_SIZE):
+    """
+    Parse feed entries incrementally, yielding each one as soon as it is complete
+
+    The feed bytes are fed to an XML pull parser in chunks and each entry is
+    discarded once yielded, so stopping early skips parsing the rest of the
+    feed and memory stays bounded by one entry.
+
+    Args:
+        data: Feed document as bytes
+        chunk_size: Bytes fed to the parser at a time
+
+    Yields:
+        FeedEntry tuples in feed order
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the feed is not well-formed XML
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    depth = 0
+    for start in range(0, len(data), chunk_size):
+        parser.feed(data[start:start + chunk_size])
+        for event, elem in parser.read_events():
+            if elem.tag not in ENTRY_TAGS:
+                continue
+            if event == "start":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    yield _entry_from_element(elem)
+                    elem.clear()
+    parser.close()
+
+def iter_feedparser_entries(data, response_headers=None):
+    """
+    Parse a whole feed with feedparser, which tolerates malformed feeds
+
+    Args:
+        data: Feed document as bytes
+        response_headers: Optional lowercased HTTP response headers
+
+    Yields:
+        FeedEntry tuples in feed order
+    """
+    feed = feedparser.parse(data, response_headers=response_headers or {})
+    for entry in feed.entries:
+        content = ""
+        if 'content' in entry:
+            content = " ".join([c.value for c in entry.content])
+        elif 'summary' in entry:
+            content = entry.summary
+        parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+        date = time.strftime("%Y-%m-%d", parsed) if parsed else None
+        yield FeedEntry(entry.get('title', ""), entry.get('link', ""), content, date)
+
+def iter_feed(data, response_headers=None):
+    """
+    Yield feed entries with the streaming parser, falling back to feedparser
+
+    If the feed turns out not to be well-formed XML, feedparser takes over and
+    entries already yielded are not repeated.
+
+    Args:
+        data: Feed document as bytes
+        response_headers: Optional lowercased HTTP response headers
+
+    Yields:
+        FeedEntry tuples in feed order
+    """
+    yielded = set()
+    try:
+        for entry in iter_entries(data):
+            yielded.add(entry.link)
+            yield entry
+        return
+    except ET.ParseError as e:
+        logger.info(f"Feed is not well-formed XML ({e}), falling back to feedparser")
+
+    for entry in iter_feedparser_entries(data, response_headers):
+        if entry.link not in yielded:
+            yield entry
@@ -8,9 +8,6 @@ sends an email newsletter, and pushes updates to GitHub.
 import os
 import subprocess
 from datetime import datetime
-import time
-import json
-import re
 import random
 import logging
 import sys
@@ -28,84 +25,173 @@ logger = logging.getLogger("ai_news_generator")
 
 # Import the scraper module
 try:
-    from scraper import scrape_all_sources, save_articles_to_json
+    from scraper import scrape_all_sources
+    from seen_store import SeenURLStore
+    from article_store import ArticleStore
+    from article_archive import ARCHIVE_DIR, export_archive, import_archive
+    from dedupe import SignatureStore
+    from pipeline import DEFAULT_JSONL_PATH, JSONLSink, read_jsonl
+    from text_spool import TextSpool
+    from report_data import REPORT_DATA_PATH, build_report_data, save_report_data
+    from email_renderer import render_email
+    from report_renderer import RenderCache, render_markdown, report_digest
+    from publisher import publish_report
+    from static_site import SITE_DIR, build_site
     logger.info("Successfully imported scraper module")
 except ImportError as e:
     logger.error(f"Failed to import scraper module: {e}")
     logger.error("Make sure scraper.py is in the same directory")
     sys.exit(1)
 
-def generate_report_content():
-    """Generate the daily AI news report with current date and fresh content from web scraping"""
-    today_date = datetime.now().strftime("%B %d, %Y")
+class NoNewArticles(Exception):
+    """Raised when a run finds no articles that earlier reports did not cover"""
+
+def recover_interrupted_run(store, path=DEFAULT_JSONL_PATH):
+    """
+    Store the articles an interrupted run left in its JSON Lines log
+    
+    The log is removed once a run's articles are in the article store, so a
+    log that still exists belongs to a run that crashed before storing them.
+    Its articles are stored as a run of their own, named after the time of
+    the log's last write. They were never reported, so they are not marked
+    as seen, and the next scrape still picks them up.
+    
+    Args:
+        store: ArticleStore
+        path: JSON Lines log written by JSONLSink
+    """
+    if not os.path.exists(path):
+        return
+    articles = read_jsonl(path)
+    if articles:
+        run_id = datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec="seconds")
+        store.upsert_articles(articles, run_id=run_id)
+        logger.warning(f"Recovered {len(articles)} articles of an interrupted run from {path}")
+    os.remove(path)
+
+def generate_report_data(today_date=None, seen_urls=None, signatures=None):
+    """
+    Scrape fresh content and select the articles for today's report
+    
+    Args:
+        today_date: Date shown in the report header, defaults to today
+        seen_urls: Optional SeenURLStore; articles reported in earlier runs
+            are skipped
+        signatures: Optional SignatureStore; stories reported in earlier runs
+            are skipped
+        
+    Neither store is written here: record the report's articles in both with
+    record_reported() once the report is saved.
+        
+    Returns:
+        Report data dictionary, or None if scraping failed
+        
+    Raises:
+        NoNewArticles: If every scraped article was already reported; the
+            previous report should be kept rather than replaced by an empty one
+    """
+    if today_date is None:
+        today_date = datetime.now().strftime("%B %d, %Y")
     
     logger.info(f"Generating expanded report for {today_date}...")
     
     # Get current news from web scraping (5 articles per source)
     try:
-        # Scrape articles from all sources (5 articles per source)
-        articles = scrape_all_sources(articles_per_source=5)
+        # Scrape articles from all sources (5 articles per source), skipping
+        # articles already covered by an earlier report. Articles are appended
+        # to latest_ai_news.jsonl as they arrive, and the log is removed only
+        # once the kept articles are stored as a new run in the article store,
+        # with their full texts from the spool indexed for search; a log left
+        # by a run that crashed before that is stored first. The report is
+        # built from the new run. An empty store (a new machine, or an
+        # evicted Actions cache) is first restored from the published archive
+        store = ArticleStore()
+        spool = TextSpool()
+        try:
+            if not store.count():
+                import_archive(store)
+            recover_interrupted_run(store)
+            sink = JSONLSink(append=True)
+            try:
+                new_articles = scrape_all_sources(articles_per_source=5, seen_urls=seen_urls, spool=spool,
+                                                  signatures=signatures, sink=sink, store=store)
+            finally:
+                sink.close()
+            os.remove(sink.path)
+            articles = store.categorized()
+        finally:
+            spool.close()
+            store.close()
         
-        # Save articles to JSON for reference
-        save_articles_to_json(articles, filename="latest_ai_news.json")
-        
-        logger.info(f"Successfully scraped {sum(len(v) for v in articles.values())} articles")
+        logger.info(f"Successfully scraped {sum(len(v) for v in new_articles.values())} new articles")
     except Exception as e:
         logger.error(f"Error scraping articles: {e}")
-        logger.warning("Using backup news generation method")
-        return generate_backup_report_content()
+        return None
     
-    # Start building the report with current date
-    report_text = f"""# Daily AI News Report
-
-## Date: {today_date}
-
-### General AI News
+    if not any(new_articles.values()):
+        raise NoNewArticles("Every scraped article was already covered by an earlier report")
+    return build_report_data(articles, today_date)
 
-"""
-    
-    # Add general AI news (10-15 items)
-    general_news = articles.get("general", [])
-    for i, article in enumerate(general_news[:15], 1):
-        report_text += f"{i}. **{article['title']}** - {article['content'][:200]}... (Source: {article['source']}) [Ref{i}]\n\n"
-    
-    report_text += "### AI in Defense and Security\n\n"
-    
-    # Add defense/security news (10-15 items)
-    defense_news = articles.get("defense_security", [])
-    ref_counter = len(general_news[:15]) + 1
-    for i, article in enumerate(defense_news[:15], 1):
-        report_text += f"{i}. **{article['title']}** - {article['content'][:200]}... (Source: {article['source']}) [Ref{ref_counter}]\n\n"
-        ref_counter += 1
-    
-    report_text += "### Important Tools and Innovations\n\n"
-    
-    # Add tools and innovations (10-15 items)
-    tools_news = articles.get("tools_innovations", [])
-    for i, article in enumerate(tools_news[:15], 1):
-        report_text += f"{i}. **{article['title']}** - {article['content'][:200]}... (Source: {article['source']}) [Ref{ref_counter}]\n\n"
-        ref_counter += 1
+def record_reported(report, seen_urls, signatures):
+    """
+    Record the articles of a saved report, so later runs skip them and their stories
     
-    # Add references section
-    report_text += "## References\n\n"
+    Only reported articles are recorded: one dropped by deduplication or the
+    section cap, or scraped by a run that failed before saving its report, is
+    scraped again by the next run and its story is not treated as covered.
     
-    ref_num = 1
-    for article in general_news[:15]:
-        report_text += f"[Ref{ref_num}] {article['url']}\n"
-        ref_num += 1
+    Args:
+        report: Report dictionary that was saved
+        seen_urls: SeenURLStore
+        signatures: SignatureStore holding the staged signatures of this run
+    """
+    urls = [reference["url"] for reference in report["references"]]
+    seen_urls.add_many(urls)
+    stored = signatures.commit(urls)
+    logger.info(f"Recorded {len(urls)} reported articles as seen and {stored} story signatures")
+
+def build_report_text(articles, today_date=None):
+    """
+    Build the markdown report from categorized articles
     
-    for article in defense_news[:15]:
-        report_text += f"[Ref{ref_num}] {article['url']}\n"
-        ref_num += 1
+    Args:
+        articles: Dictionary with articles categorized by type
+        today_date: Date shown in the report header, defaults to today
         
-    for article in tools_news[:15]:
-        report_text += f"[Ref{ref_num}] {article['url']}\n"
-        ref_num += 1
-    
-    return report_text
+    Returns:
+        Markdown report text
+    """
+    return render_markdown(build_report_data(articles, today_date))
+
+# Placeholder items of the backup report, per section
+BACKUP_ITEMS = {
+    "general": (
+        "Latest developments in AI research from {source}",
+        "This article discusses recent advancements in artificial intelligence research, including new models, "
+        "techniques, and applications that are pushing the boundaries of what AI can achieve",
+    ),
+    "defense_security": (
+        "AI applications in defense and security from {source}",
+        "This article explores how artificial intelligence is being applied to enhance defense capabilities and "
+        "improve security measures, including threat detection, cybersecurity, and strategic planning",
+    ),
+    "tools_innovations": (
+        "New AI tools and innovations from {source}",
+        "This article highlights recent innovations in AI tools and technologies that are making artificial "
+        "intelligence more accessible, efficient, and powerful for various applications",
+    ),
+}
 
-def generate_backup_report_content():
-    """Generate backup report content in case web scraping fails"""
+def generate_backup_report_data():
+    """
+    Generate backup report data in case web scraping fails
+    
+    The backup goes through build_report_data like a scraped report, so the
+    markdown, the JSON data and the static page all show the same report.
+    
+    Returns:
+        Report data dictionary
+    """
     logger.warning("Using backup report generation method")
     today_date = datetime.now().strftime("%B %d, %Y")
     
@@ -121,90 +207,29 @@ def generate_backup_report_content():
         "Microsoft Research", "NVIDIA Blog", "IBM Research", "Nature", "Science"
     ]
     
-    # Generate backup report content
-    report_text = f"""# Daily AI News Report
-
-## Date: {today_date}
-
-### General AI News
-
-"""
-    
-    # Add general AI news (15 items)
-    for i in range(1, 16):
-        source = random.choice(news_sources)
-        report_text += f"{i}. **Latest developments in AI research from {source}** - This article discusses recent advancements in artificial intelligence research, including new models, techniques, and applications that are pushing the boundaries of what AI can achieve. (Source: {source}) [Ref{i}]\n\n"
-    
-    report_text += "### AI in Defense and Security\n\n"
-    
-    # Add defense/security news (15 items)
-    for i in range(1, 16):
-        source = random.choice(news_sources)
-        report_text += f"{i}. **AI applications in defense and security from {source}** - This article explores how artificial intelligence is being applied to enhance defense capabilities and improve security measures, including threat detection, cybersecurity, and strategic planning. (Source: {source}) [Ref{i+15}]\n\n"
-    
-    report_text += "### Important Tools and Innovations\n\n"
-    
-    # Add tools and innovations (15 items)
-    for i in range(1, 16):
-        source = random.choice(news_sources)
-        report_text += f"{i}. **New AI tools and innovations from {source}** - This article highlights recent innovations in AI tools and technologies that are making artificial intelligence more accessible, efficient, and powerful for various applications. (Source: {source}) [Ref{i+30}]\n\n"
-    
-    # Add references section
-    report_text += "## References\n\n"
-    
-    for i in range(1, 46):
-        source = news_sources[(i-1) % len(news_sources)]
-        domain = source.lower().replace(" ", "").replace("'", "").replace("-", "")
-        report_text += f"[Ref{i}] https://www.{domain}.com/article{i}\n"
-    
-    return report_text
+    # 15 placeholder items per section, each linking to a reference URL; the
+    # report adds "..." after each summary
+    articles = {}
+    ref = 0
+    for category, (title, content) in BACKUP_ITEMS.items():
+        articles[category] = []
+        for _ in range(15):
+            ref += 1
+            source = random.choice(news_sources)
+            domain = news_sources[(ref - 1) % len(news_sources)].lower().replace(" ", "").replace("'", "").replace("-", "")
+            articles[category].append({
+                "title": title.format(source=source),
+                "content": content,
+                "url": f"https://www.{domain}.com/article{ref}",
+                "source": source,
+                "date": datetime.now().strftime("%Y-%m-%d"),
+            })
+    
+    return build_report_data(articles, today_date)
 
 def generate_email_content(markdown_content):
     """Convert markdown content to HTML for email"""
-    today_date = datetime.now().strftime("%B %d, %Y")
-    
-    # Convert markdown to HTML (basic conversion)
-    html_content = markdown_content.replace("# ", "<h1>").replace("## ", "<h2>").replace("### ", "<h3>")
-    html_content = html_content.replace("**", "<strong>").replace("**", "</strong>")
-    html_content = html_content.replace("\n\n", "</p><p>").replace("\n", "<br>")
-    
-    # Convert reference links to clickable HTML links
-    ref_pattern = r'\[Ref(\d+)\]'
-    for match in re.finditer(ref_pattern, html_content):
-        ref_num = match.group(1)
-        ref_link_pattern = f"\\[Ref{ref_num}\\] (https?://[^\\s]+)"
-        ref_link_match = re.search(ref_link_pattern, html_content)
-        if ref_link_match:
-            link_url = ref_link_match.group(1)
-            html_content = html_content.replace(f"[Ref{ref_num}]", f'<a href="{link_url}">[Ref{ref_num}]</a>')
-    
-    html_content = f"""
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }}
-            h1 {{ color: #2c3e50; border-bottom: 1px solid #eee; padding-bottom: 10px; }}
-            h2 {{ color: #3498db; margin-top: 30px; }}
-            h3 {{ color: #2980b9; margin-top: 25px; }}
-            a {{ color: #3498db; text-decoration: none; }}
-            a:hover {{ text-decoration: underline; }}
-            .source {{ color: #7f8c8d; font-style: italic; }}
-            .references {{ background-color: #f9f9f9; padding: 15px; border-radius: 5px; margin-top: 30px; }}
-            .references a {{ display: block; margin-bottom: 5px; }}
-        </style>
-    </head>
-    <body>
-        {html_content}
-    </body>
-    </html>
-    """
-    
-    # Clean up HTML formatting
-    html_content = html_content.replace("<p><h1>", "<h1>").replace("</h1></p>", "</h1>")
-    html_content = html_content.replace("<p><h2>", "<h2>").replace("</h2></p>", "</h2>")
-    html_content = html_content.replace("<p><h3>", "<h3>").replace("</h3></p>", "</h3>")
-    
-    return html_content
+    return render_email(markdown_content).html
 
 def send_email_newsletter(content, recipient_email):
     """Send the daily AI news report via email using Manus email system"""
@@ -212,11 +237,8 @@ def send_email_newsletter(content, recipient_email):
         today_date = datetime.now().strftime("%B %d, %Y")
         subject = f"Daily AI News Report - {today_date}"
         
-        # Convert markdown to HTML for better email formatting
-        html_content = generate_email_content(content)
-        
-        # For now, we'll create a simple text version
-        text_content = content.replace("#", "").replace("**", "")
+        # Render the HTML and plain-text parts in one pass over the report
+        html_content, text_content = render_email(content)
         
         logger.info(f"Preparing to send email to {recipient_email}")
         logger.info(f"Subject: {subject}")
@@ -237,22 +259,13 @@ def send_email_newsletter(content, recipient_email):
         logger.error(f"Error sending email: {e}")
         return False
 
-def update_github_repo(repo_path, file_name, commit_message):
-    """Update the GitHub repository with new content"""
+def update_github_repo(repo_path, file_names, commit_message):
+    """Update the GitHub repository with new content, skipping the commit and push when nothing changed"""
     try:
-        os.chdir(repo_path)
-        
-        # Add the updated file
-        subprocess.run(["git", "add", file_name], check=True)
-        
-        # Commit the changes
-        subprocess.run(["git", "commit", "-m", commit_message], check=True)
-        
-        # Push to GitHub
-        subprocess.run(["git", "push"], check=True)
+        publish_report(repo_path, file_names, commit_message)
         return True
     except subprocess.CalledProcessError as e:
-        logger.error(f"Error updating GitHub repository: {e}")
+        logger.error(f"Error updating GitHub repository: {e}: {(e.stderr or '').strip()}")
         return False
     except Exception as e:
         logger.error(f"Unexpected error updating GitHub repository: {e}")
@@ -271,33 +284,95 @@ if __name__ == "__main__":
     logger.info(f"Starting daily AI news automation for {datetime.now().strftime('%B %d, %Y')}...")
     logger.info(f"Using expanded format with 10-15 news items per section from real-time sources")
     
-    # Generate the new report content with current date and fresh news
-    new_report_content = generate_report_content()
-    
-    # Write the new content to the Markdown file
-    with open(report_file_name, "w") as f:
-        f.write(new_report_content)
+    # Select today's articles. Once a report is recorded its articles are
+    # never selected again, so the render cache only skips stages when this
+    # run retries one that stopped before recording its report
+    render_cache = RenderCache()
+    seen_urls = SeenURLStore()
+    signatures = SignatureStore()
+    try:
+        report = generate_report_data(seen_urls=seen_urls, signatures=signatures)
+    except NoNewArticles as e:
+        # Keep yesterday's report online rather than rendering, emailing and
+        # pushing an empty one
+        logger.info(f"✓ {e}; keeping the published report, skipping render, email and publish.")
+        seen_urls.close()
+        signatures.close()
+        sys.exit(0)
+    if report is None:
+        logger.warning("Using backup news generation method")
+        report = generate_backup_report_data()
+        digest = None
+    else:
+        digest = report_digest(report)
     
-    logger.info(f"✓ '{report_file_name}' updated with real-time content for {datetime.now().strftime('%B %d, %Y')}.")
-    logger.info(f"✓ Report now includes up to 45 news items from over 25 high-quality sources.")
+    if render_cache.is_done(digest, "render") and os.path.exists(report_file_name) and os.path.exists(REPORT_DATA_PATH):
+        logger.info(f"✓ Selected articles unchanged since the last report; keeping '{report_file_name}'.")
+        with open(report_file_name, "r") as f:
+            new_report_content = f.read()
+    else:
+        # Render the new content with current date and fresh news, and
+        # publish it as structured data for the website and the API, as a
+        # pre-rendered page for static hosting, and with the article archive
+        # the website and the API rebuild their article store from
+        new_report_content = render_markdown(report)
+        save_report_data(report)
+        build_site(report)
+        store = ArticleStore()
+        try:
+            export_archive(store)
+        finally:
+            store.close()
+        
+        # Write the new content to the Markdown file
+        with open(report_file_name, "w") as f:
+            f.write(new_report_content)
+        if digest is not None:
+            render_cache.mark_done(digest, "render")
+        
+        logger.info(f"✓ '{report_file_name}' updated with real-time content for {datetime.now().strftime('%B %d, %Y')}.")
+        logger.info(f"✓ Report now includes up to 45 news items from over 25 high-quality sources.")
     
     # Send email newsletter
-    logger.info("Sending email newsletter with real-time content...")
-    email_sent = send_email_newsletter(new_report_content, recipient_email)
-    
-    if email_sent:
-        logger.info("✓ Email newsletter with real-time content sent successfully!")
+    if render_cache.is_done(digest, "email"):
+        logger.info("✓ Email newsletter already sent for these articles; skipping.")
     else:
-        logger.error("✗ Failed to send email newsletter.")
+        logger.info("Sending email newsletter with real-time content...")
+        email_sent = send_email_newsletter(new_report_content, recipient_email)
+        
+        if email_sent:
+            logger.info("✓ Email newsletter with real-time content sent successfully!")
+            if digest is not None:
+                render_cache.mark_done(digest, "email")
+        else:
+            logger.error("✗ Failed to send email newsletter.")
     
     # Update and push to GitHub
-    logger.info("Pushing real-time report to GitHub...")
-    github_updated = update_github_repo(github_repo_path, report_file_name, commit_msg)
-    
-    if github_updated:
-        logger.info("✓ Real-time report successfully committed and pushed to GitHub.")
+    if render_cache.is_done(digest, "publish"):
+        logger.info("✓ Report for these articles already pushed to GitHub; skipping.")
     else:
-        logger.error("✗ Failed to update GitHub repository.")
+        logger.info("Pushing real-time report to GitHub...")
+        # The report data, static site and archive are published with the
+        # report; the article store database stays out of git, where each run
+        # would add a full copy, while the archive only adds the changed days
+        github_updated = update_github_repo(github_repo_path,
+                                            [report_file_name, REPORT_DATA_PATH, SITE_DIR, ARCHIVE_DIR],
+                                            commit_msg)
+        
+        if github_updated:
+            logger.info("✓ Real-time report successfully committed and pushed to GitHub.")
+            if digest is not None:
+                render_cache.mark_done(digest, "publish")
+        else:
+            logger.error("✗ Failed to update GitHub repository.")
+    
+    # The report is saved; only now do its articles and stories count as
+    # seen. A run that stops before this point is retried with the same
+    # articles, and the render cache skips the stages it completed
+    if digest is not None:
+        record_reported(report, seen_urls, signatures)
+    seen_urls.close()
+    signatures.close()
     
     logger.info(f"✓ Daily AI news automation completed successfully for {datetime.now().strftime('%B %d, %Y')}!")
     logger.info(f"✓ Website will be automatically updated by Streamlit Cloud")
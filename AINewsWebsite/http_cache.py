@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+HTTP Cache - Persistent conditional-GET cache for pages and feeds
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger("ai_news_scraper.cache")
+
+DEFAULT_CACHE_PATH = ".http_cache.sqlite3"
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# Response headers kept with a cached body; everything else describes the
+# original transfer (length, encoding, connection) and no longer applies
+STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+class CacheEntry:
+    """A cached response body with its validators"""
+
+    def __init__(self, url, body, headers):
+        self.url = url
+        self.body = body
+        self.headers = headers
+
+    @property
+    def etag(self):
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self):
+        return self.headers.get("last-modified")
+
+    def conditional_headers(self):
+        """Return the If-None-Match / If-Modified-Since headers for revalidation"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+class HTTPCache:
+    """
+    SQLite-backed cache of response bodies keyed by URL
+
+    Entries are only stored for responses that carry an ETag or Last-Modified
+    validator, and are always revalidated with a conditional GET before use.
+    When the total body size exceeds max_bytes the least recently used entries
+    are evicted. The total is read once when the cache is opened and then kept
+    up to date as entries are stored and removed.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Open or create a cache
+
+        Args:
+            path: SQLite database file, or ":memory:" for a throwaway cache
+            max_bytes: Maximum total size of cached bodies
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+        """)
+        self._conn.commit()
+        self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, url):
+        """
+        Look up a cached response
+
+        Args:
+            url: URL of the request
+
+        Returns:
+            CacheEntry or None if the URL is not cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT headers, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(url, row[1], json.loads(row[0]))
+
+    def store(self, url, response):
+        """
+        Store a 200 response if it carries validators, counting a cache miss
+
+        Args:
+            url: URL of the request
+            response: requests.Response with the downloaded body
+        """
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        body = response.content
+        with self._lock:
+            self.misses += 1
+            self._delete(url)
+            if "etag" in headers or "last-modified" in headers:
+                self._conn.execute(
+                    "INSERT INTO responses (url, headers, body, size, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (url, json.dumps(headers), body, len(body), time.time())
+                )
+                self._total += len(body)
+                if self._total > self.max_bytes:
+                    self._evict()
+            self._conn.commit()
+
+    def revalidated(self, entry, response):
+        """
+        Record a 304 for a cached entry, refreshing its validators and LRU position
+        and counting a cache hit
+
+        Args:
+            entry: CacheEntry that was revalidated
+            response: The 304 requests.Response
+        """
+        for name in ("etag", "last-modified"):
+            if name in response.headers:
+                entry.headers[name] = response.headers[name]
+
+        with self._lock:
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE responses SET headers = ?, accessed_at = ? WHERE url = ?",
+                (json.dumps(entry.headers), time.time(), entry.url)
+            )
+            self._conn.commit()
+
+    def discard(self, url):
+        """Remove a URL from the cache"""
+        with self._lock:
+            self._delete(url)
+            self._conn.commit()
+
+    def total_bytes(self):
+        """Return the total size of cached bodies"""
+        with self._lock:
+            return self._total
+
+    def _delete(self, url):
+        """Delete a URL's entry and take its size off the total; callers hold the lock"""
+        row = self._conn.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self._total -= row[0]
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes; callers hold the lock"""
+        rows = self._conn.execute("SELECT url, size FROM responses ORDER BY accessed_at")
+        evicted = []
+        for url, size in rows:
+            if self._total <= self.max_bytes:
+                break
+            evicted.append((url,))
+            self._total -= size
+            self.evictions += 1
+        self._conn.executemany("DELETE FROM responses WHERE url = ?", evicted)
+
+    def log_stats(self):
+        """Log hit/miss counters for this run"""
+        requests_seen = self.hits + self.misses
+        hit_rate = self.hits / requests_seen * 100 if requests_seen else 0
+        logger.info(f"HTTP cache: {self.hits} hits, {self.misses} misses ({hit_rate:.0f}% hit rate), "
+                    f"{self.evictions} evictions, {self.total_bytes() / 1024:.0f} KiB on disk")
+
+    def close(self):
+        """Close the cache database"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+HTTP Client - Shared keep-alive HTTP session used by all scrapers
+"""
+
+import logging
+import threading
+from collections import Counter
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from http_cache import HTTPCache, DEFAULT_CACHE_PATH
+
+logger = logging.getLogger("ai_news_scraper.http")
+
+# Only advertise brotli when a decoder is installed, otherwise servers may send
+# bodies that urllib3 cannot decompress
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
+# Number of per-host connection pools kept alive (one per news source host)
+DEFAULT_POOL_CONNECTIONS = 32
+# Number of keep-alive connections kept in each host pool
+DEFAULT_POOL_MAXSIZE = 4
+DEFAULT_TIMEOUT = 10
+
+def _counting_pool_classes(record_connect):
+    """
+    Build urllib3 pool classes whose connections report every socket connect
+
+    urllib3 silently reconnects a pooled connection the server has closed, so
+    counting pool.num_connections would overstate reuse.
+    """
+    class CountingHTTPConnection(HTTPConnection):
+        def connect(self):
+            super().connect()
+            record_connect(self.host)
+
+    class CountingHTTPSConnection(HTTPSConnection):
+        def connect(self):
+            super().connect()
+            record_connect(self.host)
+
+    class CountingHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = CountingHTTPConnection
+
+    class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = CountingHTTPSConnection
+
+    return {"http": CountingHTTPConnectionPool, "https": CountingHTTPSConnectionPool}
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter that records requests and new connections per host"""
+
+    def __init__(self, stats, **kwargs):
+        self._stats = stats
+        self._pool_classes = _counting_pool_classes(stats.record_connect)
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+    def send(self, request, **kwargs):
+        self._stats.record_request(urlparse(request.url).hostname)
+        return super().send(request, **kwargs)
+
+class ConnectionStats:
+    """Thread-safe per-host counters of requests sent and connections opened"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = Counter()
+        self.connections = Counter()
+
+    def record_request(self, host):
+        with self._lock:
+            self.requests[host] += 1
+
+    def record_connect(self, host):
+        with self._lock:
+            self.connections[host] += 1
+
+    def snapshot(self):
+        """Return a dict mapping host to its requests, connections and reused counts"""
+        with self._lock:
+            return {
+                host: {
+                    "requests": self.requests[host],
+                    "connections": self.connections[host],
+                    "reused": max(self.requests[host] - self.connections[host], 0)
+                }
+                for host in self.requests
+            }
+
+class HTTPClient:
+    """Pooled HTTP client with keep-alive connections and compression negotiation"""
+
+    def __init__(self, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 timeout=DEFAULT_TIMEOUT, cache=None):
+        """
+        Create a client
+
+        Args:
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum number of keep-alive connections per host
+            timeout: Default request timeout in seconds
+            cache: Optional HTTPCache used for conditional GETs
+        """
+        self.timeout = timeout
+        self.cache = cache
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Connection": "keep-alive"
+        })
+
+        # Retries are handled by the callers, so the adapter never retries itself
+        self.stats = ConnectionStats()
+        adapter = _CountingAdapter(self.stats, pool_connections=pool_connections,
+                                   pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, url, headers=None, timeout=None, use_cache=True, **kwargs):
+        """
+        Send a GET request through the shared session
+
+        When a cache is configured and holds the URL, the request is sent as a
+        conditional GET and a 304 answer is served from disk as a 200 response
+        with from_cache set to True.
+
+        Args:
+            url: URL to fetch
+            headers: Optional headers to send with the request
+            timeout: Request timeout in seconds, defaults to the client timeout
+            use_cache: Whether to revalidate against and update the cache
+
+        Returns:
+            requests.Response object
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        cache = self.cache if use_cache else None
+        entry = cache.get(url) if cache else None
+        if entry:
+            headers = dict(headers or {})
+            headers.update(entry.conditional_headers())
+
+        response = self.session.get(url, headers=headers, timeout=timeout, **kwargs)
+        response.from_cache = False
+
+        if cache is None:
+            return response
+
+        if response.status_code == 304 and entry:
+            cache.revalidated(entry, response)
+            return self._response_from_cache(entry, response)
+
+        if response.status_code == 200:
+            cache.store(url, response)
+        return response
+
+    @staticmethod
+    def _response_from_cache(entry, not_modified):
+        """Build a 200 response from a cache entry and the 304 that revalidated it"""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry.body
+        response.from_cache = True
+        return response
+
+    def connection_stats(self):
+        """
+        Report connection reuse per host
+
+        Returns:
+            Dictionary mapping host to a dict with "requests", "connections"
+            and "reused" counts
+        """
+        return self.stats.snapshot()
+
+    def log_connection_stats(self):
+        """Log connection reuse per host and in total"""
+        stats = self.connection_stats()
+        total_requests = sum(entry["requests"] for entry in stats.values())
+        total_connections = sum(entry["connections"] for entry in stats.values())
+
+        for host, entry in sorted(stats.items()):
+            logger.info(f"HTTP {host}: {entry['requests']} requests over {entry['connections']} connections")
+
+        if total_requests:
+            reuse_rate = (total_requests - total_connections) / total_requests * 100
+            logger.info(f"HTTP connection reuse: {total_requests} requests, {total_connections} connections "
+                        f"({reuse_rate:.0f}% reused)")
+
+    def log_cache_stats(self):
+        """Log cache hit/miss counters if a cache is configured"""
+        if self.cache:
+            self.cache.log_stats()
+
+    def close(self):
+        """Close all pooled connections and the cache"""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """
+    Return the shared HTTP client, creating it with default settings if needed
+
+    The default client keeps its conditional-GET cache in DEFAULT_CACHE_PATH.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HTTPClient(cache=HTTPCache(DEFAULT_CACHE_PATH))
+        return _client
+
+def configure_client(**kwargs):
+    """
+    Replace the shared HTTP client
+
+    Args:
+        **kwargs: Arguments passed to HTTPClient, e.g. pool_maxsize or cache
+
+    Returns:
+        The new HTTPClient
+    """
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = HTTPClient(**kwargs)
+        return _client
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Keyword Matcher - Finds many keywords in a text with one regular expression pass
+"""
+
+import re
+
+# Inflections accepted after a keyword, so "tool" matches "tools" and "tooling"
+# but "ai" does not match inside "said" or "maintain". Keywords of three letters
+# or fewer (mostly acronyms) only take a plural "s", otherwise "ai" would match
+# "aid" and "rag" would match "raging".
+LONG_KEYWORD_SUFFIX = r"(?:s|es|d|ed|ing|er|ers|ment|ments)?"
+SHORT_KEYWORD_SUFFIX = r"s?"
+SHORT_KEYWORD_LENGTH = 3
+# Words of a multi-word keyword may be separated by whitespace or hyphens, so
+# "machine learning" also matches "machine-learning"
+WORD_SEPARATOR = r"[\s-]+"
+# A keyword ending in this marker matches any word it starts, so "cyber*"
+# matches "cyberattack" and "cybercrime"
+PREFIX_MARKER = "*"
+
+class KeywordMatcher:
+    """
+    Matches groups of keywords with word-boundary semantics
+
+    All keywords are compiled into a single trie-shaped regular expression that
+    is tried at every word boundary through a lookahead, so overlapping hits
+    ("ai security" and "security") are all found in one scan of the text. At a
+    given position the longest keyword wins; it inherits the groups of any
+    shorter keyword it starts with, so no group is lost to a longer match.
+    Keywords ending in PREFIX_MARKER match as word prefixes, tried after the
+    full keywords that share their stem.
+    """
+
+    def __init__(self, groups):
+        """
+        Args:
+            groups: Dictionary mapping a group name to a list of keywords
+        """
+        self.groups = {name: [keyword.lower() for keyword in keywords] for name, keywords in groups.items()}
+
+        keyword_groups = {}
+        for name, keywords in self.groups.items():
+            for keyword in keywords:
+                keyword_groups.setdefault(" ".join(keyword.split()), set()).add(name)
+
+        self.keywords = sorted(keyword_groups)
+        self._keyword_groups = [
+            frozenset().union(*(keyword_groups[prefix] for prefix in self._word_prefixes(keyword, keyword_groups)))
+            for keyword in self.keywords
+        ]
+        self._pattern = re.compile(r"\b(?=" + self._trie_pattern() + ")")
+
+    @staticmethod
+    def _word_prefixes(keyword, known):
+        """Yield the keyword and every known keyword made of its leading words"""
+        words = keyword.split(" ")
+        for end in range(1, len(words) + 1):
+            prefix = " ".join(words[:end])
+            if prefix in known:
+                yield prefix
+
+    def _trie_pattern(self):
+        """
+        Build a regular expression trie with one empty capture group per keyword
+
+        Capture groups are numbered in the order they appear in the pattern, so
+        _group_keywords maps each group number (minus one) to its keyword index.
+        """
+        trie = {}
+        self._group_keywords = []
+        for index, keyword in enumerate(self.keywords):
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = index
+
+        def render(node):
+            alternatives = []
+            for char in sorted((key for key in node if key), key=lambda key: (key == PREFIX_MARKER, key)):
+                if char == " ":
+                    token = WORD_SEPARATOR
+                elif char == PREFIX_MARKER:
+                    token = r"\w*"
+                else:
+                    token = re.escape(char)
+                alternatives.append(token + render(node[char]))
+            if "" in node:
+                # The keyword ends here; tried after longer keywords sharing this prefix
+                keyword = self.keywords[node[""]]
+                self._group_keywords.append(node[""])
+                if keyword.endswith(PREFIX_MARKER):
+                    suffix = ""
+                elif len(keyword) <= SHORT_KEYWORD_LENGTH:
+                    suffix = SHORT_KEYWORD_SUFFIX
+                else:
+                    suffix = LONG_KEYWORD_SUFFIX
+                alternatives.append(suffix + r"\b()")
+            if len(alternatives) == 1:
+                return alternatives[0]
+            return "(?:" + "|".join(alternatives) + ")"
+
+        return render(trie)
+
+    def iter_hits(self, text):
+        """
+        Yield the index of every keyword hit in a lowercase text
+
+        Args:
+            text: Lowercase text to search
+        """
+        for match in self._pattern.finditer(text):
+            yield self._group_keywords[match.lastindex - 1]
+
+    def find(self, text):
+        """
+        Find every keyword occurring in a text
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Set of matched keywords
+        """
+        return {self.keywords[index] for index in self.iter_hits(text.lower())}
+
+    def find_groups(self, text, stop_after=None):
+        """
+        Find which keyword groups occur in a text
+
+        Args:
+            text: Text to search
+            stop_after: Group names that, once all found, end the scan early;
+                defaults to every group
+
+        Returns:
+            Set of group names with at least one hit
+        """
+        stop_after = set(self.groups if stop_after is None else stop_after)
+        found = set()
+        for index in self.iter_hits(text.lower()):
+            found |= self._keyword_groups[index]
+            if stop_after <= found:
+                break
+        return found
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+HTML Parsing - Parser backend selection and partial parsing for the scrapers
+"""
+
+import re
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+# lxml is several times faster than the pure-Python html.parser; fall back to
+# html.parser when it is not installed
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = "lxml"
+except ImportError:
+    DEFAULT_PARSER = "html.parser"
+
+# First compound of a CSS selector: a tag name with an optional class
+_SELECTOR_HEAD = re.compile(r"^\s*([a-zA-Z][a-zA-Z0-9-]*)(?:\.([\w-]+))?")
+
+class ParseTargets:
+    """
+    The parts of a page a scraper actually reads
+
+    Only matching elements and their descendants are built into the soup, so
+    CSS selectors that start at one of the targets keep working while the rest
+    of the page (navigation, scripts, footers) is skipped.
+    """
+
+    def __init__(self, tags=(), containers=()):
+        """
+        Args:
+            tags: Tag names kept wherever they appear, e.g. ("h1", "time")
+            containers: (tag name, CSS class) pairs kept with their subtree,
+                e.g. (("div", "rich-text"),)
+        """
+        self.tags = frozenset(tags)
+        self.containers = tuple(containers)
+
+    @classmethod
+    def from_selectors(cls, *selectors):
+        """
+        Derive targets from the CSS selectors a scraper runs against a page
+
+        Only the first compound of each selector matters: "div.prose p" keeps
+        every div.prose subtree and "time" keeps every time element. Selectors
+        that do not start with a tag name cannot be targeted, so the whole page
+        is parsed in that case.
+
+        Args:
+            *selectors: CSS selectors, None entries are ignored
+
+        Returns:
+            ParseTargets, or None if the selectors cannot be targeted
+        """
+        tags = []
+        containers = []
+        for selector in selectors:
+            if not selector:
+                continue
+            for alternative in selector.split(","):
+                match = _SELECTOR_HEAD.match(alternative)
+                if not match:
+                    return None
+                name, css_class = match.groups()
+                if css_class:
+                    containers.append((name.lower(), css_class))
+                else:
+                    tags.append(name.lower())
+        return cls(tags=tags, containers=containers)
+
+    def matches(self, name, attrs):
+        """Return True if a tag with this name and attributes is a target"""
+        if name in self.tags:
+            return True
+
+        for container_name, container_class in self.containers:
+            if name != container_name:
+                continue
+            classes = attrs.get("class") or ()
+            if isinstance(classes, str):
+                classes = classes.split()
+            if container_class in classes:
+                return True
+        return False
+
+    def strainer(self):
+        """Build a SoupStrainer that keeps only the targets"""
+        def match(name, attrs=None):
+            if isinstance(name, Tag):
+                name, attrs = name.name, name.attrs
+            return self.matches(name, attrs or {})
+
+        return SoupStrainer(match)
+
+    def __repr__(self):
+        return f"ParseTargets(tags={sorted(self.tags)}, containers={list(self.containers)})"
+
+def make_soup(markup, targets=None, parser=None):
+    """
+    Parse HTML into a BeautifulSoup object
+
+    Args:
+        markup: HTML string or bytes
+        targets: Optional ParseTargets restricting which subtrees are built
+        parser: Parser backend, defaults to DEFAULT_PARSER
+
+    Returns:
+        BeautifulSoup object
+    """
+    parse_only = targets.strainer() if targets else None
+    return BeautifulSoup(markup, parser or DEFAULT_PARSER, parse_only=parse_only)
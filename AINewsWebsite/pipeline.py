@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Article Pipeline - Streams scraped articles through deduplication into sinks
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+
+logger = logging.getLogger("ai_news_scraper.pipeline")
+
+DEFAULT_JSONL_PATH = "latest_ai_news.jsonl"
+# Articles buffered between the source threads and the consumer; when it is
+# full the sources wait, so a slow sink slows down scraping instead of
+# letting articles pile up in memory
+DEFAULT_QUEUE_SIZE = 32
+
+_DONE = object()
+
+class JSONLSink:
+    """
+    Writes articles to a JSON Lines file as they arrive
+
+    Each line is flushed when written, so everything scraped before a crash is
+    on disk. An article that supersedes an earlier line (a better copy of the
+    same story) is written with a "replaces" field holding the earlier URL.
+    """
+
+    def __init__(self, path=DEFAULT_JSONL_PATH, append=False):
+        """
+        Args:
+            path: Output file
+            append: Add to an existing file instead of starting a new one
+        """
+        self.path = path
+        self.count = 0
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+
+    def write(self, article, replaces=None):
+        """
+        Append an article
+
+        Args:
+            article: ArticleInfo object
+            replaces: Optional ArticleInfo written earlier that this one supersedes
+        """
+        record = article.to_dict()
+        if replaces is not None:
+            record["replaces"] = replaces.url
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        """Close the output file"""
+        self._file.close()
+        logger.info(f"Wrote {self.count} articles to {self.path}")
+
+def read_jsonl(path=DEFAULT_JSONL_PATH):
+    """
+    Read articles written by a JSONLSink, applying replacements
+
+    A truncated last line, left by a crash while writing, is ignored.
+
+    Args:
+        path: JSON Lines file
+
+    Returns:
+        List of article dictionaries in the order they were first written
+    """
+    articles = {}
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning(f"Ignoring truncated line in {path}")
+                continue
+            replaces = record.pop("replaces", None)
+            if replaces is not None:
+                articles.pop(replaces, None)
+            articles[record["url"]] = record
+    return list(articles.values())
+
+class ArticleCollector:
+    """Keeps the articles that come out of the pipeline, for categorizing at the end"""
+
+    def __init__(self):
+        self._articles = {}
+
+    def write(self, article, replaces=None):
+        """Add an article, dropping the article it replaces"""
+        if replaces is not None:
+            self._articles.pop(id(replaces), None)
+        self._articles[id(article)] = article
+
+    def articles(self):
+        """Return the collected articles in arrival order"""
+        return list(self._articles.values())
+
+def merge_streams(producers, max_workers, queue_size=DEFAULT_QUEUE_SIZE):
+    """
+    Run article generators on threads and yield their articles as they arrive
+
+    Producers hand articles over through a bounded queue, so they block while
+    the consumer is behind. If the consumer stops early, the producers stop at
+    their next article.
+
+    Args:
+        producers: List of (name, zero-argument callable returning an article iterator)
+        max_workers: Maximum number of producers running at once
+        queue_size: Maximum number of articles waiting for the consumer
+
+    Yields:
+        Articles in arrival order
+    """
+    articles = queue.Queue(maxsize=queue_size)
+    stopped = threading.Event()
+    pending = list(reversed(producers))
+    pending_lock = threading.Lock()
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                articles.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker():
+        while not stopped.is_set():
+            with pending_lock:
+                if not pending:
+                    break
+                name, produce = pending.pop()
+            iterator = produce()
+            try:
+                for article in iterator:
+                    if not put(article):
+                        break
+            except Exception as e:
+                logger.error(f"Error scraping {name}: {e}")
+            finally:
+                close = getattr(iterator, "close", None)
+                if close:
+                    close()
+        put(_DONE)
+
+    workers = [
+        threading.Thread(target=worker, name=f"source-{i}", daemon=True)
+        for i in range(min(len(producers), max_workers) or 1)
+    ]
+    for thread in workers:
+        thread.start()
+
+    try:
+        remaining = len(workers)
+        while remaining:
+            item = articles.get()
+            if item is _DONE:
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        stopped.set()
+        for thread in workers:
+            thread.join()
+
+def run_pipeline(articles, deduplicator=None, sinks=()):
+    """
+    Pass a stream of articles through deduplication into sinks
+
+    Args:
+        articles: Iterable of ArticleInfo objects, e.g. from merge_streams
+        deduplicator: Optional StreamingDeduplicator
+        sinks: Objects with a write(article, replaces=None) method
+
+    Returns:
+        Number of articles written
+    """
+    written = 0
+    for article in articles:
+        replaced = None
+        if deduplicator is not None:
+            keep, replaced = deduplicator.add(article)
+            if not keep:
+                continue
+        for sink in sinks:
+            sink.write(article, replaces=replaced)
+        written += 1
+    return written
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Politeness Scheduler - Per-host token-bucket rate limiting for the scrapers
+"""
+
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+from http_client import get_client
+
+logger = logging.getLogger("ai_news_scraper.politeness")
+
+# Default per-host budget: bursts of 2 requests, then one request every 2 seconds
+DEFAULT_RATE = 0.5
+DEFAULT_BURST = 2
+ROBOTS_TIMEOUT = 5
+
+# Per-host overrides as {host: (rate, burst)}, e.g. {"openai.com": (0.2, 1)}
+HOST_LIMITS = {}
+
+class TokenBucket:
+    """Token bucket that hands out waiting times instead of blocking"""
+
+    def __init__(self, rate, burst):
+        """
+        Create a full bucket
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket holds
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Take one token
+
+        The bucket may go into debt, so concurrent callers are queued in the
+        order they reserved rather than racing for the next token.
+
+        Returns:
+            Number of seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+def fetch_robots_txt(robots_url):
+    """
+    Download a robots.txt file through the shared HTTP client
+
+    Args:
+        robots_url: URL of the robots.txt file
+
+    Returns:
+        File contents, or None if it could not be fetched
+    """
+    try:
+        response = get_client().get(robots_url, timeout=ROBOTS_TIMEOUT)
+        if response.status_code == 200:
+            return response.text
+    except Exception as e:
+        logger.warning(f"Could not fetch {robots_url}: {e}")
+    return None
+
+class PolitenessScheduler:
+    """
+    Rate-limits requests per host
+
+    Each host gets its own token bucket, so a request to one host never waits
+    on another host's budget. A robots.txt Crawl-delay slows a host down to at
+    most one request per delay.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, host_limits=None,
+                 respect_robots=True, robots_fetcher=fetch_robots_txt, user_agent="*"):
+        """
+        Create a scheduler
+
+        Args:
+            rate: Default requests per second per host
+            burst: Default number of back-to-back requests allowed per host
+            host_limits: Optional {host: (rate, burst)} overrides
+            respect_robots: Whether to honor robots.txt Crawl-delay
+            robots_fetcher: Callable returning robots.txt contents for a URL
+            user_agent: User agent matched against robots.txt groups
+        """
+        self.rate = rate
+        self.burst = burst
+        self.host_limits = HOST_LIMITS if host_limits is None else host_limits
+        self.respect_robots = respect_robots
+        self.robots_fetcher = robots_fetcher
+        self.user_agent = user_agent
+        self._buckets = {}
+        self._host_locks = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        """
+        Block until a request to the host of a URL is allowed
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            Number of seconds waited
+        """
+        delay = self._bucket_for(url).reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def _bucket_for(self, url):
+        """Return the token bucket of a URL's host, creating it on first use"""
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+
+        bucket = self._buckets.get(host)
+        if bucket is not None:
+            return bucket
+
+        with self._lock:
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+
+        # robots.txt is fetched under a per-host lock so other hosts are not held up
+        with host_lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.host_limits.get(host, (self.rate, self.burst))
+                crawl_delay = self._crawl_delay(parsed.scheme, host) if self.respect_robots else None
+                if crawl_delay:
+                    rate = min(rate, 1.0 / crawl_delay)
+                    burst = 1
+                    logger.info(f"Honoring Crawl-delay of {crawl_delay}s for {host}")
+                bucket = TokenBucket(rate, burst)
+                self._buckets[host] = bucket
+        return bucket
+
+    def _crawl_delay(self, scheme, host):
+        """Return the robots.txt Crawl-delay for a host, or None"""
+        robots_txt = self.robots_fetcher(f"{scheme}://{host}/robots.txt")
+        if not robots_txt:
+            return None
+
+        parser = RobotFileParser()
+        parser.parse(robots_txt.splitlines())
+        try:
+            crawl_delay = parser.crawl_delay(self.user_agent)
+            return float(crawl_delay) if crawl_delay else None
+        except (TypeError, ValueError):
+            return None
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler():
+    """Return the shared politeness scheduler, creating it with default settings if needed"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = PolitenessScheduler()
+        return _scheduler
+
+def configure_scheduler(**kwargs):
+    """
+    Replace the shared politeness scheduler
+
+    Args:
+        **kwargs: Arguments passed to PolitenessScheduler, e.g. rate or burst
+
+    Returns:
+        The new PolitenessScheduler
+    """
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = PolitenessScheduler(**kwargs)
+        return _scheduler
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Publisher - Commits and pushes the report artifacts only when their content changed
+"""
+
+import logging
+import os
+import subprocess
+import time
+from collections import namedtuple
+
+logger = logging.getLogger("ai_news_generator.publisher")
+
+PublishResult = namedtuple("PublishResult", ["committed", "pushed", "timings"])
+
+def _git(repo_path, *args, check=True):
+    """Run a git command in repo_path and return the completed process"""
+    return subprocess.run(["git", "-C", repo_path, *args], check=check, capture_output=True, text=True)
+
+def staged_changes(repo_path, file_names):
+    """
+    Stage the given files and return those whose content differs from HEAD
+
+    git add only re-hashes files whose size or modification time changed, so
+    unchanged artifacts cost a stat() each.
+
+    Args:
+        repo_path: Repository working directory
+        file_names: Paths relative to repo_path
+
+    Returns:
+        List of changed or new file names, relative to repo_path
+    """
+    if not file_names:
+        return []
+    _git(repo_path, "add", "--", *file_names)
+    head = _git(repo_path, "rev-parse", "--verify", "--quiet", "HEAD", check=False)
+    if head.returncode != 0:
+        # Nothing committed yet, everything staged is new
+        return list(file_names)
+    diff = _git(repo_path, "diff", "--cached", "--name-only", "--relative", "HEAD", "--", *file_names)
+    return diff.stdout.splitlines()
+
+def commits_ahead(repo_path):
+    """Return the number of local commits not on the upstream branch, or None without an upstream"""
+    ahead = _git(repo_path, "rev-list", "--count", "@{upstream}..HEAD", check=False)
+    return int(ahead.stdout) if ahead.returncode == 0 else None
+
+def publish_report(repo_path, file_names, commit_message, remote=None):
+    """
+    Commit the report artifacts together and push them, skipping unchanged work
+
+    The files are staged and compared with HEAD; nothing is committed when
+    every file matches, and the push is skipped when the branch has nothing
+    new for its upstream. Only the given files are committed, whatever else
+    is staged.
+
+    Args:
+        repo_path: Repository working directory
+        file_names: Report, report data and archive files, relative to repo_path;
+            a deleted file that is tracked is committed as deleted, other
+            files that do not exist are left out
+        commit_message: Message for the report commit
+        remote: Optional remote to push HEAD to, defaults to the upstream branch
+
+    Returns:
+        PublishResult with whether a commit was made, whether it was pushed
+        and the seconds spent in each step
+
+    Raises:
+        subprocess.CalledProcessError: If a git command fails
+    """
+    timings = {}
+    start = time.perf_counter()
+    file_names = [name for name in file_names if os.path.exists(os.path.join(repo_path, name))
+                  or _git(repo_path, "ls-files", "--", name).stdout]
+    changed = staged_changes(repo_path, file_names)
+    timings["stage"] = time.perf_counter() - start
+
+    committed = False
+    if changed:
+        start = time.perf_counter()
+        _git(repo_path, "commit", "-m", commit_message, "--", *changed)
+        timings["commit"] = time.perf_counter() - start
+        committed = True
+        logger.info(f"Committed {', '.join(changed)}")
+    else:
+        logger.info("Report files unchanged since the last commit; nothing to commit")
+
+    start = time.perf_counter()
+    ahead = commits_ahead(repo_path) if remote is None else None
+    pushed = False
+    if ahead == 0:
+        logger.info("Branch is up to date with its upstream; skipping push")
+    elif committed or ahead:
+        _git(repo_path, "push", *([remote, "HEAD"] if remote else []))
+        pushed = True
+    timings["push"] = time.perf_counter() - start
+
+    logger.info("Publish timings: " + ", ".join(f"{step} {seconds * 1000:.0f} ms" for step, seconds in timings.items()))
+    return PublishResult(committed, pushed, timings)
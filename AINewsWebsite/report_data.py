@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Report Data - Versioned JSON artifact of the daily report for the website
+"""
+
+import json
+import logging
+import os
+import re
+from datetime import datetime
+
+from article_store import CATEGORIES, CATEGORY_TITLES
+
+logger = logging.getLogger("ai_news_generator.report_data")
+
+REPORT_DATA_PATH = "daily_ai_news_report.json"
+# Bump when the artifact layout changes; readers reject other versions
+REPORT_DATA_VERSION = 1
+# Items per section in the published report
+ITEMS_PER_SECTION = 15
+# Characters of article content shown per item
+SUMMARY_LENGTH = 200
+
+_REF_RE = re.compile(r"\[Ref(\d+)\]")
+
+# Loaded reports keyed on path, with the (mtime, size) they were read at
+_cache = {}
+
+def build_report_data(articles, report_date=None, items_per_section=ITEMS_PER_SECTION):
+    """
+    Build the report artifact from categorized articles
+
+    Items are numbered within their section and references are numbered
+    across sections, as in the markdown report.
+
+    Args:
+        articles: Dictionary with articles categorized by type
+        report_date: Date shown in the report header, defaults to today
+        items_per_section: Maximum items per section
+
+    Returns:
+        Report dictionary
+    """
+    if report_date is None:
+        report_date = datetime.now().strftime("%B %d, %Y")
+
+    sections = []
+    references = []
+    for category in CATEGORIES:
+        items = []
+        for number, article in enumerate(articles.get(category, [])[:items_per_section], 1):
+            ref = len(references) + 1
+            references.append({"ref": ref, "url": article["url"]})
+            items.append({
+                "number": number,
+                "ref": ref,
+                "title": article["title"],
+                "summary": f"{article['content'][:SUMMARY_LENGTH]}...",
+                "source": article["source"],
+                "url": article["url"],
+                "date": article.get("date"),
+            })
+        sections.append({"category": category, "title": CATEGORY_TITLES[category], "items": items})
+
+    return {
+        "version": REPORT_DATA_VERSION,
+        "date": report_date,
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "sections": sections,
+        "references": references,
+    }
+
+def save_report_data(report, path=REPORT_DATA_PATH):
+    """
+    Write the report artifact, replacing the previous one atomically
+
+    Args:
+        report: Report dictionary from build_report_data
+        path: Output file
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+    logger.info(f"Saved report data with {len(report['references'])} items to {path}")
+
+def read_report_data(path=REPORT_DATA_PATH):
+    """
+    Read a report artifact from disk
+
+    Args:
+        path: Artifact file
+
+    Returns:
+        Report dictionary
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file is not a report artifact of REPORT_DATA_VERSION
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    if not isinstance(report, dict) or report.get("version") != REPORT_DATA_VERSION:
+        raise ValueError(f"{path} is not a version {REPORT_DATA_VERSION} report artifact")
+    return report
+
+def parse_markdown_report(text):
+    """
+    Build a report dictionary from the markdown report
+
+    Used when only the markdown report has been published.
+
+    Args:
+        text: Markdown report text
+
+    Returns:
+        Report dictionary
+    """
+    lines = text.split("\n")
+    ref_urls = {}
+    references = []
+    for line in lines:
+        if line.startswith("[Ref") and "] " in line:
+            ref, url = line.split("] ", 1)
+            ref = ref.replace("[Ref", "")
+            if ref.isdigit():
+                ref_urls[ref] = url
+                references.append({"ref": int(ref), "url": url})
+
+    titles = {title: category for category, title in CATEGORY_TITLES.items()}
+    report_date = ""
+    sections = []
+    for line in lines:
+        if line.startswith("## Date:"):
+            report_date = line.replace("## Date:", "").strip()
+        elif line.startswith("### "):
+            title = line[4:].strip()
+            sections.append({"category": titles.get(title), "title": title, "items": []})
+        elif sections and line[:1].isdigit() and ". **" in line and "** - " in line:
+            head, content = line.split("** - ", 1)
+            number, title = head.split(". **", 1)
+            source = ""
+            source_start = content.rfind("(Source: ")
+            if source_start != -1:
+                source = content[source_start + len("(Source: "):]
+                source = source[:source.rfind(")")] if ")" in source else source
+                content = content[:source_start]
+            ref_match = _REF_RE.search(line)
+            ref = int(ref_match.group(1)) if ref_match else None
+            sections[-1]["items"].append({
+                "number": int(number) if number.isdigit() else number,
+                "ref": ref,
+                "title": title,
+                "summary": content.strip(),
+                "source": source,
+                "url": ref_urls.get(str(ref), "#"),
+                "date": None,
+            })
+
+    return {
+        "version": REPORT_DATA_VERSION,
+        "date": report_date,
+        "generated_at": None,
+        "sections": sections,
+        "references": references,
+    }
+
+def load_report(path=REPORT_DATA_PATH, markdown_path=None):
+    """
+    Return the published report, reading it only when the file has changed
+
+    The parsed report is kept in memory keyed on the file's modification time
+    and size, so repeated calls cost one stat(). The returned dictionary is
+    shared between callers and must not be modified.
+
+    Args:
+        path: Report artifact file
+        markdown_path: Optional markdown report to parse when the artifact
+            does not exist
+
+    Returns:
+        Report dictionary
+
+    Raises:
+        FileNotFoundError: If neither file exists
+        ValueError: If the artifact has an unsupported version
+    """
+    path, parse = _report_source(path, markdown_path)
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    report = parse(path)
+    _cache[path] = (key, report)
+    return report
+
+def report_version(path=REPORT_DATA_PATH, markdown_path=None):
+    """
+    Identify the published report that load_report would return
+
+    Args:
+        path: Report artifact file
+        markdown_path: Optional markdown report used when the artifact does not exist
+
+    Returns:
+        Tuple of the file path, modification time and size, which changes
+        whenever a new report is published
+
+    Raises:
+        FileNotFoundError: If neither file exists
+    """
+    path, _ = _report_source(path, markdown_path)
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+def _report_source(path, markdown_path):
+    """Return the file to load the report from and the function that parses it"""
+    if markdown_path is not None and not os.path.exists(path):
+        return markdown_path, _parse_markdown_file
+    return path, read_report_data
+
+def _parse_markdown_file(path):
+    """Read and parse a markdown report file"""
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_markdown_report(f.read())
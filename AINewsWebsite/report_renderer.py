@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Report Renderer - Markdown report templates and a content-hash render cache
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+
+logger = logging.getLogger("ai_news_generator.renderer")
+
+DEFAULT_RENDER_CACHE_PATH = ".report_render_cache.json"
+
+# Stages of the daily job that the render cache can skip
+RENDER_STAGES = ("render", "email", "publish")
+
+# Markdown templates, formatted with the fields of the report data
+REPORT_HEADER_TEMPLATE = "# Daily AI News Report\n\n## Date: {date}\n\n"
+SECTION_TEMPLATE = "### {title}\n\n"
+ITEM_TEMPLATE = "{number}. **{title}** - {summary} (Source: {source}) [Ref{ref}]\n\n"
+REFERENCES_HEADER = "## References\n\n"
+REFERENCE_TEMPLATE = "[Ref{ref}] {url}\n"
+
+def render_markdown(report):
+    """
+    Render report data as the markdown report
+
+    Args:
+        report: Report dictionary from report_data.build_report_data
+
+    Returns:
+        Markdown report text
+    """
+    item = ITEM_TEMPLATE.format_map
+    reference = REFERENCE_TEMPLATE.format_map
+    parts = [REPORT_HEADER_TEMPLATE.format_map(report)]
+    for section in report["sections"]:
+        parts.append(SECTION_TEMPLATE.format_map(section))
+        parts.extend(item(entry) for entry in section["items"])
+    parts.append(REFERENCES_HEADER)
+    parts.extend(reference(entry) for entry in report["references"])
+    return "".join(parts)
+
+def report_digest(report):
+    """
+    Hash the articles selected for a report
+
+    Only the selected articles count: the report date and generation time are
+    left out, so a report with the same articles as the last one hashes the
+    same on another day.
+
+    Args:
+        report: Report dictionary from report_data.build_report_data
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    selected = [
+        [section["category"], [[item["title"], item["summary"], item["source"], item["url"]] for item in section["items"]]]
+        for section in report["sections"]
+    ]
+    payload = json.dumps(selected, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class RenderCache:
+    """
+    Remembers which stages of the daily job have completed for a report digest
+
+    When the selected articles hash the same as the last run's, stages that
+    already completed for them (rendering, the email, publishing) are skipped;
+    a stage that failed is retried. A new digest starts over.
+
+    The daily job marks a report's articles as seen once the run completes,
+    and later runs skip them, so consecutive daily runs practically never
+    share a digest. The cache pays off when a run is retried after stopping
+    before that point: the retry selects the same articles and only redoes the
+    stages that had not completed.
+    """
+
+    def __init__(self, path=DEFAULT_RENDER_CACHE_PATH):
+        """
+        Args:
+            path: JSON file holding the last digest and its completed stages
+        """
+        self.path = path
+        self.digest = None
+        self.stages = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self.digest = state.get("digest")
+            self.stages = dict(state.get("stages", {}))
+        except FileNotFoundError:
+            pass
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable render cache {path}: {e}")
+
+    def is_done(self, digest, stage):
+        """Return True if stage already completed for a report with this digest"""
+        return digest is not None and digest == self.digest and stage in self.stages
+
+    def mark_done(self, digest, stage):
+        """
+        Record that stage completed for a report with this digest
+
+        Args:
+            digest: Digest from report_digest
+            stage: One of RENDER_STAGES
+        """
+        if stage not in RENDER_STAGES:
+            raise ValueError(f"Unknown render stage {stage!r}, expected one of {RENDER_STAGES}")
+        if digest != self.digest:
+            self.digest = digest
+            self.stages = {}
+        self.stages[stage] = datetime.now().isoformat(timespec="seconds")
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"digest": self.digest, "stages": self.stages}, f, indent=2)
+        os.replace(tmp_path, self.path)
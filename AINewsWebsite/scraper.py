@@ -4,15 +4,29 @@ AI News Scraper - Fetches the latest AI news from multiple sources
 """
 
 import requests
-from bs4 import BeautifulSoup
-import json
 import re
 import time
 import random
 import logging
+import os
+import threading
+import tomllib
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from urllib.parse import urljoin, urlparse
-import feedparser
+from http_client import get_client
+from politeness import get_scheduler
+from parsing import ParseTargets, make_soup
+from circuit_breaker import get_breakers, is_host_failure
+from keyword_matcher import KeywordMatcher
+from dedupe import StreamingDeduplicator
+from article_store import ArticleStore
+from report_data import build_report_data
+from report_renderer import render_markdown
+from feed_parser import iter_feed, iter_feedparser_entries, strip_html
+from pipeline import ArticleCollector, DEFAULT_QUEUE_SIZE, merge_streams, run_pipeline
 
 # Configure logging
 logging.basicConfig(
@@ -34,13 +48,54 @@ USER_AGENTS = [
     'Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1'
 ]
 
+# Source registry and the selectors each source type requires
+DEFAULT_SOURCES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sources.toml")
+REQUIRED_SOURCE_KEYS = {
+    "html": ("card", "content"),
+    "rss": ()
+}
+# How far HTML sources are scraped: article pages, or only the listing cards
+SOURCE_DEPTHS = ("detail", "listing")
+# What HTML sources do with cards whose title and preview match no relevance
+# keyword: fetch them only after the other cards, never fetch them, or ignore
+# the cards' text entirely
+PREFILTER_MODES = ("deprioritize", "skip", "off")
+# How RSS sources parse their feeds
+FEED_PARSERS = ("stream", "feedparser")
+
+# Concurrency settings for the opt-in concurrent scraping mode
+DEFAULT_MAX_WORKERS = 8
+PER_HOST_CONCURRENCY = 2
+
+# Characters of article content kept in memory and in the JSON output; the
+# report shows the first 200
+EXCERPT_LENGTH = 600
+
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
 def get_random_user_agent():
     """Return a random user agent from the list"""
     return random.choice(USER_AGENTS)
 
-def get_soup(url, headers=None, timeout=10, max_retries=3):
+def get_host_semaphore(url):
+    """Return the semaphore limiting concurrent requests to the host of a URL"""
+    host = urlparse(url).netloc.lower()
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(PER_HOST_CONCURRENCY)
+            _host_semaphores[host] = semaphore
+    return semaphore
+
+def fetch_url(url, headers=None, timeout=10, max_retries=3):
     """
-    Fetch a URL and return a BeautifulSoup object
+    Fetch a URL through the shared HTTP client, retrying transient failures
+    
+    Requests to a host whose circuit breaker is open are skipped without
+    touching the network. Connection errors, timeouts and 429/5xx responses
+    are retried and count once against the host if every attempt fails; other
+    error statuses, such as a 404, give up at once without counting.
     
     Args:
         url: URL to fetch
@@ -49,27 +104,126 @@ def get_soup(url, headers=None, timeout=10, max_retries=3):
         max_retries: Maximum number of retries on failure
         
     Returns:
-        BeautifulSoup object or None if failed
+        requests.Response object or None if failed
     """
+    breakers = get_breakers()
+    if not breakers.allow(url):
+        logger.info(f"Skipping {url}: circuit breaker open for {urlparse(url).netloc}")
+        return None
+    
     if headers is None:
         headers = {'User-Agent': get_random_user_agent()}
     
+    client = get_client()
+    scheduler = get_scheduler()
     retries = 0
-    while retries < max_retries:
-        try:
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Error fetching {url}: {e}")
-            retries += 1
-            if retries < max_retries:
-                sleep_time = 2 ** retries  # Exponential backoff
-                logger.info(f"Retrying in {sleep_time} seconds...")
-                time.sleep(sleep_time)
-            else:
-                logger.error(f"Failed to fetch {url} after {max_retries} attempts")
-                return None
+    try:
+        while retries < max_retries:
+            try:
+                # Be nice to the server: wait for the host's rate limit, and never
+                # hold more than PER_HOST_CONCURRENCY connections to one host
+                scheduler.wait(url)
+                with get_host_semaphore(url):
+                    response = client.get(url, headers=headers, timeout=timeout)
+                response.raise_for_status()
+                breakers.record_success(url)
+                return response
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Error fetching {url}: {e}")
+                retries += 1
+                if not is_host_failure(e):
+                    # The host answered; retrying a dead link will not help, and
+                    # it says nothing against the rest of the site
+                    breakers.record_success(url)
+                    logger.error(f"Failed to fetch {url}: {e}")
+                    return None
+                if breakers.is_open(url):
+                    logger.error(f"Giving up on {url}: circuit breaker open for {urlparse(url).netloc}")
+                    return None
+                if retries < max_retries:
+                    sleep_time = 2 ** retries  # Exponential backoff
+                    logger.info(f"Retrying in {sleep_time} seconds...")
+                    time.sleep(sleep_time)
+                else:
+                    # One failure per URL, however many attempts it took
+                    breakers.record_failure(url)
+                    logger.error(f"Failed to fetch {url} after {max_retries} attempts")
+                    return None
+    finally:
+        # A half-open probe that raised something unexpected must not keep
+        # the host blocked
+        breakers.release(url)
+
+def get_soup(url, headers=None, timeout=10, max_retries=3, targets=None):
+    """
+    Fetch a URL and return a BeautifulSoup object
+    
+    Args:
+        url: URL to fetch
+        headers: Optional headers to send with the request
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retries on failure
+        targets: Optional ParseTargets; only these parts of the page are parsed
+        
+    Returns:
+        BeautifulSoup object or None if failed
+    """
+    response = fetch_url(url, headers=headers, timeout=timeout, max_retries=max_retries)
+    if response is None:
+        return None
+    return make_soup(response.text, targets=targets)
+
+def _fetch_soup_safely(url, targets=None):
+    """Fetch a URL with get_soup, logging unexpected errors instead of raising"""
+    try:
+        return get_soup(url, targets=targets)
+    except Exception as e:
+        logger.error(f"Error fetching {url}: {e}")
+        return None
+
+def iter_soups(urls, executor=None, prefetch=PER_HOST_CONCURRENCY, targets=None):
+    """
+    Fetch article pages in order, yielding (url, soup) pairs
+    
+    Without an executor the pages are fetched one at a time as the caller
+    consumes them. With an executor, up to `prefetch` pages are fetched ahead
+    of the caller; pages that were never consumed are cancelled when the caller
+    stops iterating, so a scraper that reaches its limit early does not keep
+    downloading.
+    
+    Args:
+        urls: Iterable of URLs to fetch
+        executor: Optional concurrent.futures executor used to fetch pages
+        prefetch: Number of pages to keep in flight when an executor is given
+        targets: Optional ParseTargets passed to get_soup
+        
+    Yields:
+        (url, soup) tuples, where soup is None if the fetch failed
+    """
+    if executor is None:
+        for url in urls:
+            yield url, _fetch_soup_safely(url, targets)
+        return
+    
+    pending = deque()
+    urls = iter(urls)
+    try:
+        while True:
+            # Keep the prefetch window full
+            while len(pending) < prefetch:
+                url = next(urls, None)
+                if url is None:
+                    break
+                pending.append((url, executor.submit(_fetch_soup_safely, url, targets)))
+            
+            if not pending:
+                return
+            
+            url, future = pending.popleft()
+            yield url, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
 
 def clean_text(text):
     """Clean up text by removing extra whitespace and normalizing"""
@@ -80,6 +234,78 @@ def clean_text(text):
     # Remove leading/trailing whitespace
     return text.strip()
 
+# Keywords that make an article relevant to AI news
+RELEVANCE_KEYWORDS = [
+    'ai', 'artificial intelligence', 'machine learning', 'deep learning', 
+    'neural network', 'llm', 'large language model', 'gpt', 'chatgpt',
+    'openai', 'deepmind', 'anthropic', 'claude', 'gemini', 'mistral',
+    'transformer', 'diffusion', 'stable diffusion', 'midjourney',
+    'computer vision', 'nlp', 'natural language processing',
+    'reinforcement learning', 'generative ai', 'foundation model',
+    'multimodal', 'embedding', 'vector database', 'rag',
+    'ai safety', 'ai ethics', 'ai regulation', 'ai policy',
+    'ai security', 'ai defense', 'ai cybersecurity'
+]
+
+# Defense and security keywords
+DEFENSE_KEYWORDS = [
+    'security', 'defense', 'defence', 'military', 'cyber*', 'cybersecurity',
+    'threat', 'attack', 'vulnerability', 'exploit', 'malware', 'ransomware',
+    'phishing', 'hacking', 'privacy', 'surveillance', 'encryption', 'classified',
+    'national security', 'intelligence', 'counterintelligence', 'warfare',
+    'weapon', 'missile', 'drone', 'uav', 'autonomous weapon', 'darpa',
+    'pentagon', 'nato', 'protection', 'safeguard', 'risk', 'threat detection'
+]
+
+# Tools and innovations keywords
+TOOLS_KEYWORDS = [
+    'tool', 'innovation', 'breakthrough', 'release', 'launch', 'announce',
+    'new model', 'new feature', 'update', 'upgrade', 'version', 'api',
+    'library', 'framework', 'platform', 'software', 'hardware', 'chip',
+    'processor', 'gpu', 'tpu', 'accelerator', 'infrastructure', 'cloud',
+    'edge', 'mobile', 'app', 'application', 'product', 'service', 'solution',
+    'startup', 'funding', 'investment', 'acquisition', 'partnership'
+]
+
+# Matches all keyword lists in a single pass over the article text
+ARTICLE_MATCHER = KeywordMatcher({
+    "relevant": RELEVANCE_KEYWORDS,
+    "defense_security": DEFENSE_KEYWORDS,
+    "tools_innovations": TOOLS_KEYWORDS
+})
+
+@lru_cache(maxsize=32)
+def _relevance_matcher(keywords):
+    """Compile (and remember) a matcher for a custom relevance keyword list"""
+    return KeywordMatcher({"relevant": keywords})
+
+def classify_article(title, content):
+    """
+    Check relevance and categorize an article with one scan of its text
+    
+    Keywords match whole words (with common inflections such as plurals), so
+    "ai" no longer matches inside "said" or "maintain"; stems such as "cyber*"
+    match every word they start.
+    
+    Args:
+        title: Article title
+        content: Article content
+        
+    Returns:
+        Tuple of (is relevant, category string)
+    """
+    # A defense/security hit decides the category, so the scan can stop there
+    groups = ARTICLE_MATCHER.find_groups(title + "\n" + content, stop_after=("relevant", "defense_security"))
+    
+    if "defense_security" in groups:
+        category = "defense_security"
+    elif "tools_innovations" in groups:
+        category = "tools_innovations"
+    else:
+        category = "general"
+    
+    return "relevant" in groups, category
+
 def is_relevant(title, content, keywords=None):
     """
     Check if an article is relevant to AI news based on keywords
@@ -87,32 +313,16 @@ def is_relevant(title, content, keywords=None):
     Args:
         title: Article title
         content: Article content
-        keywords: List of keywords to check for relevance
+        keywords: List of keywords to check for relevance, defaults to RELEVANCE_KEYWORDS
         
     Returns:
         Boolean indicating if the article is relevant
     """
     if keywords is None:
-        keywords = [
-            'ai', 'artificial intelligence', 'machine learning', 'deep learning', 
-            'neural network', 'llm', 'large language model', 'gpt', 'chatgpt',
-            'openai', 'deepmind', 'anthropic', 'claude', 'gemini', 'mistral',
-            'transformer', 'diffusion', 'stable diffusion', 'midjourney',
-            'computer vision', 'nlp', 'natural language processing',
-            'reinforcement learning', 'generative ai', 'foundation model',
-            'multimodal', 'embedding', 'vector database', 'rag',
-            'ai safety', 'ai ethics', 'ai regulation', 'ai policy',
-            'ai security', 'ai defense', 'ai cybersecurity'
-        ]
-    
-    combined_text = (title + " " + content).lower()
-    
-    # Check if any keyword is in the combined text
-    for keyword in keywords:
-        if keyword.lower() in combined_text:
-            return True
-    
-    return False
+        return classify_article(title, content)[0]
+    
+    matcher = _relevance_matcher(tuple(keywords))
+    return bool(matcher.find_groups(title + "\n" + content))
 
 def categorize_article(title, content):
     """
@@ -125,55 +335,58 @@ def categorize_article(title, content):
     Returns:
         Category string: "general", "defense_security", or "tools_innovations"
     """
-    combined_text = (title + " " + content).lower()
-    
-    # Defense and security keywords
-    defense_keywords = [
-        'security', 'defense', 'defence', 'military', 'cyber', 'cybersecurity',
-        'threat', 'attack', 'vulnerability', 'exploit', 'malware', 'ransomware',
-        'phishing', 'hacking', 'privacy', 'surveillance', 'encryption', 'classified',
-        'national security', 'intelligence', 'counterintelligence', 'warfare',
-        'weapon', 'missile', 'drone', 'uav', 'autonomous weapon', 'darpa',
-        'pentagon', 'nato', 'protection', 'safeguard', 'risk', 'threat detection'
-    ]
-    
-    # Tools and innovations keywords
-    tools_keywords = [
-        'tool', 'innovation', 'breakthrough', 'release', 'launch', 'announce',
-        'new model', 'new feature', 'update', 'upgrade', 'version', 'api',
-        'library', 'framework', 'platform', 'software', 'hardware', 'chip',
-        'processor', 'gpu', 'tpu', 'accelerator', 'infrastructure', 'cloud',
-        'edge', 'mobile', 'app', 'application', 'product', 'service', 'solution',
-        'startup', 'funding', 'investment', 'acquisition', 'partnership'
-    ]
+    return classify_article(title, content)[1]
+
+class ArticleInfo:
+    """
+    Compact record of a scraped article
     
-    # Check for defense and security keywords
-    for keyword in defense_keywords:
-        if keyword in combined_text:
-            return "defense_security"
+    Only an excerpt of at most EXCERPT_LENGTH characters is kept in memory; the
+    report never shows more. The full text is kept only when a TextSpool is
+    given, on disk, and read back through full_text(). The category is computed
+    on first access unless the scraper already provides it.
+    """
     
-    # Check for tools and innovations keywords
-    for keyword in tools_keywords:
-        if keyword in combined_text:
-            return "tools_innovations"
+    __slots__ = ("title", "content", "length", "url", "source", "date", "_category", "_spool", "_text_span")
     
-    # Default to general AI news
-    return "general"
-
-class ArticleInfo:
-    """Class to store article information"""
-    def __init__(self, title, content, url, source, date=None, category=None):
+    def __init__(self, title, content, url, source, date=None, category=None, spool=None):
+        """
+        Args:
+            title: Article title
+            content: Full article content
+            url: Article URL
+            source: Source name
+            date: Publication date (YYYY-MM-DD), defaults to today
+            category: Category string, computed lazily if not provided
+            spool: Optional TextSpool that keeps the full content on disk
+        """
+        content = clean_text(content)
         self.title = clean_text(title)
-        self.content = clean_text(content)
+        self.content = content[:EXCERPT_LENGTH]
+        self.length = len(content)
         self.url = url
         self.source = source
         self.date = date if date else datetime.now().strftime("%Y-%m-%d")
-        
-        # Auto-categorize if category not provided
-        if category is None:
-            self.category = categorize_article(self.title, self.content)
-        else:
-            self.category = category
+        self._category = category
+        self._spool = spool
+        self._text_span = spool.write(content) if spool is not None and len(content) > EXCERPT_LENGTH else None
+    
+    @property
+    def category(self):
+        """Article category, computed from the title and text on first access"""
+        if self._category is None:
+            self._category = categorize_article(self.title, self.full_text())
+        return self._category
+    
+    @category.setter
+    def category(self, value):
+        self._category = value
+    
+    def full_text(self):
+        """Return the full article content if it was spooled, otherwise the excerpt"""
+        if self._text_span is None:
+            return self.content
+        return self._spool.read(self._text_span)
     
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
@@ -190,490 +403,325 @@ class ArticleInfo:
         """String representation of the article"""
         return f"{self.title} - {self.source} ({self.date}) [{self.category}]"
 
-class MITTechnologyReviewScraper:
-    """Scraper for MIT Technology Review AI section"""
+class HTMLSourceScraper:
+    """
+    Scraper for a listing page that links to article pages
     
-    def __init__(self):
-        self.base_url = "https://www.technologyreview.com/topic/artificial-intelligence/"
-        self.source_name = "MIT Technology Review"
+    All HTML sources share this engine; they differ only in the URL and CSS
+    selectors configured for them in sources.toml.
+    """
     
-    def scrape_articles(self, limit=5):
+    def __init__(self, source):
+        """
+        Args:
+            source: Source configuration dictionary from sources.toml
         """
-        Scrape articles from MIT Technology Review AI section
+        self.base_url = source["url"]
+        self.source_name = source["name"]
+        self.limit = source.get("limit")
+        self.card_selector = source["card"]
+        self.link_selector = source.get("link")
+        self.link_contains = source.get("link_contains")
+        self.card_title_selector = source.get("card_title")
+        self.preview_selector = source.get("preview")
+        self.title_selector = source.get("title")
+        self.date_selector = source.get("date")
+        self.content_selector = source.get("content")
+        self.depth = source.get("depth", "detail")
+        self.prefilter = source.get("prefilter", "deprioritize")
+        self.fetch_stats = Counter()
+        
+        # Parts of the listing and article pages this scraper reads
+        self.listing_targets = ParseTargets.from_selectors(self.card_selector)
+        self.detail_targets = ParseTargets.from_selectors(
+            self.title_selector, self.date_selector, self.content_selector
+        )
+    
+    def scrape_articles(self, limit=5, executor=None, seen_urls=None, spool=None):
+        """
+        Scrape articles from the source's listing page
         
         Args:
             limit: Maximum number of articles to scrape
+            executor: Optional executor used to fetch article pages concurrently
+            seen_urls: Optional SeenURLStore; articles reported in earlier runs
+                are not fetched again
+            spool: Optional TextSpool that keeps full article texts on disk
             
         Returns:
             List of ArticleInfo objects
         """
-        logger.info(f"Scraping {self.source_name}...")
-        articles = []
-        
-        try:
-            soup = get_soup(self.base_url)
-            if not soup:
-                return articles
-            
-            # Find article cards on the main page
-            article_cards = soup.select("div.cardGroup__card")
-            
-            count = 0
-            for card in article_cards:
-                if count >= limit:
-                    break
-                
-                try:
-                    # Extract article URL
-                    link_elem = card.select_one("a.cardItem__title")
-                    if not link_elem:
-                        continue
-                    
-                    article_url = urljoin(self.base_url, link_elem.get("href"))
-                    
-                    # Extract title
-                    title = link_elem.get_text()
-                    
-                    # Extract preview content
-                    preview = card.select_one("p.cardItem__excerpt")
-                    preview_text = preview.get_text() if preview else ""
-                    
-                    # Get full article content
-                    article_soup = get_soup(article_url)
-                    if not article_soup:
-                        continue
-                    
-                    # Extract date
-                    date_elem = article_soup.select_one("time")
-                    date = date_elem.get("datetime").split("T")[0] if date_elem else None
-                    
-                    # Extract full content
-                    content_elems = article_soup.select("div.contentArticle__content p")
-                    content = " ".join([p.get_text() for p in content_elems])
-                    
-                    # Check if article is relevant to AI
-                    if not is_relevant(title, content):
-                        continue
-                    
-                    # Create article object
-                    article = ArticleInfo(
-                        title=title,
-                        content=content if content else preview_text,
-                        url=article_url,
-                        source=self.source_name,
-                        date=date
-                    )
-                    
-                    articles.append(article)
-                    count += 1
-                    logger.info(f"Scraped article: {article.title}")
-                    
-                    # Be nice to the server
-                    time.sleep(random.uniform(1, 3))
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping article: {e}")
-                    continue
-        
-        except Exception as e:
-            logger.error(f"Error scraping {self.source_name}: {e}")
-        
-        return articles
-
-class DeepMindBlogScraper:
-    """Scraper for Google DeepMind blog"""
-    
-    def __init__(self):
-        self.base_url = "https://deepmind.google/discover/blog/"
-        self.source_name = "Google DeepMind"
+        return list(self.iter_articles(limit, executor, seen_urls, spool))
     
-    def scrape_articles(self, limit=5):
+    def iter_articles(self, limit=5, executor=None, seen_urls=None, spool=None):
         """
-        Scrape articles from Google DeepMind blog
+        Yield articles from the source's listing page as they are scraped
+        
+        Article pages are fetched, extracted and classified one at a time, so
+        each article reaches the caller as soon as it is ready.
         
         Args:
             limit: Maximum number of articles to scrape
+            executor: Optional executor used to fetch article pages concurrently
+            seen_urls: Optional SeenURLStore; articles reported in earlier runs
+                are not fetched again
+            spool: Optional TextSpool that keeps full article texts on disk
             
-        Returns:
-            List of ArticleInfo objects
+        Yields:
+            ArticleInfo objects
         """
         logger.info(f"Scraping {self.source_name}...")
-        articles = []
         
         try:
-            soup = get_soup(self.base_url)
+            soup = get_soup(self.base_url, targets=self.listing_targets)
+            self.fetch_stats["listing"] += 1
             if not soup:
-                return articles
+                return
             
-            # Find article cards on the main page
-            article_cards = soup.select("a.card-link")
-            
-            count = 0
-            for card in article_cards:
-                if count >= limit:
-                    break
+            # Collect article URLs together with the title and preview shown on each card
+            card_data = {}
+            for card in soup.select(self.card_selector):
+                link_elem = card.select_one(self.link_selector) if self.link_selector else card
+                if not link_elem or not link_elem.get("href"):
+                    continue
                 
-                try:
-                    # Extract article URL
-                    article_url = urljoin(self.base_url, card.get("href"))
-                    
-                    # Get article page
-                    article_soup = get_soup(article_url)
-                    if not article_soup:
-                        continue
-                    
-                    # Extract title
-                    title_elem = article_soup.select_one("h1")
-                    title = title_elem.get_text() if title_elem else ""
-                    
-                    # Extract date
-                    date_elem = article_soup.select_one("time")
-                    date = date_elem.get("datetime").split("T")[0] if date_elem else None
-                    
-                    # Extract content
-                    content_elems = article_soup.select("div.rich-text p")
-                    content = " ".join([p.get_text() for p in content_elems])
-                    
-                    # Check if article is relevant to AI
-                    if not is_relevant(title, content):
-                        continue
-                    
-                    # Create article object
-                    article = ArticleInfo(
-                        title=title,
-                        content=content,
-                        url=article_url,
-                        source=self.source_name,
-                        date=date
-                    )
-                    
-                    articles.append(article)
-                    count += 1
-                    logger.info(f"Scraped article: {article.title}")
-                    
-                    # Be nice to the server
-                    time.sleep(random.uniform(1, 3))
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping article: {e}")
+                article_url = urljoin(self.base_url, link_elem.get("href"))
+                if self.link_contains and self.link_contains not in article_url:
                     continue
-        
-        except Exception as e:
-            logger.error(f"Error scraping {self.source_name}: {e}")
-        
-        return articles
-
-class OpenAIBlogScraper:
-    """Scraper for OpenAI blog"""
-    
-    def __init__(self):
-        self.base_url = "https://openai.com/blog"
-        self.source_name = "OpenAI"
-    
-    def scrape_articles(self, limit=5):
-        """
-        Scrape articles from OpenAI blog
-        
-        Args:
-            limit: Maximum number of articles to scrape
+                
+                card_data.setdefault(article_url, (
+                    self._select_text(card, self.card_title_selector) or link_elem.get_text(),
+                    self._select_text(card, self.preview_selector)
+                ))
             
-        Returns:
-            List of ArticleInfo objects
-        """
-        logger.info(f"Scraping {self.source_name}...")
-        articles = []
-        
-        try:
-            soup = get_soup(self.base_url)
-            if not soup:
-                return articles
+            # Only fetch articles that were not reported in an earlier run
+            article_urls = list(card_data)
+            if seen_urls is not None:
+                article_urls = seen_urls.filter_new(article_urls)
             
-            # Find article links on the main page
-            article_links = soup.select("a.ui-link")
+            if self.depth == "listing":
+                yield from self._listing_articles(article_urls, card_data, limit, spool)
+                return
             
             count = 0
-            for link in article_links:
+            for tier_urls in self._fetch_tiers(article_urls, card_data):
                 if count >= limit:
                     break
                 
-                try:
-                    # Extract article URL
-                    article_url = urljoin(self.base_url, link.get("href"))
-                    
-                    # Skip non-blog URLs
-                    if "/blog/" not in article_url:
-                        continue
-                    
-                    # Get article page
-                    article_soup = get_soup(article_url)
-                    if not article_soup:
+                for article_url, article_soup in iter_soups(tier_urls, executor, targets=self.detail_targets):
+                    if count >= limit:
+                        break
+                    self.fetch_stats["detail"] += 1
+                    
+                    try:
+                        card_title, preview_text = card_data[article_url]
+                        
+                        # Get article page
+                        if not article_soup:
+                            continue
+                        
+                        # Extract title, falling back to the title on the card
+                        title = self._select_text(article_soup, self.title_selector) or card_title
+                        
+                        # Extract date
+                        date = None
+                        date_elem = article_soup.select_one(self.date_selector) if self.date_selector else None
+                        if date_elem and date_elem.get("datetime"):
+                            date = date_elem.get("datetime").split("T")[0]
+                        
+                        # Extract content
+                        content_elems = article_soup.select(self.content_selector)
+                        content = " ".join([p.get_text() for p in content_elems])
+                        
+                        # Check if article is relevant to AI and categorize it in the same pass
+                        content = content if content else preview_text
+                        relevant, category = classify_article(title, content)
+                        if not relevant:
+                            continue
+                        
+                        # Create article object
+                        article = ArticleInfo(
+                            title=title,
+                            content=content,
+                            url=article_url,
+                            source=self.source_name,
+                            date=date,
+                            category=category,
+                            spool=spool
+                        )
+                        
+                        count += 1
+                        logger.info(f"Scraped article: {article.title}")
+                        yield article
+                        
+                    except Exception as e:
+                        logger.error(f"Error scraping article: {e}")
                         continue
-                    
-                    # Extract title
-                    title_elem = article_soup.select_one("h1")
-                    title = title_elem.get_text() if title_elem else ""
-                    
-                    # Extract date
-                    date_elem = article_soup.select_one("time")
-                    date = date_elem.get("datetime").split("T")[0] if date_elem else None
-                    
-                    # Extract content
-                    content_elems = article_soup.select("div.post-content p")
-                    content = " ".join([p.get_text() for p in content_elems])
-                    
-                    # Check if article is relevant to AI
-                    if not is_relevant(title, content):
-                        continue
-                    
-                    # Create article object
-                    article = ArticleInfo(
-                        title=title,
-                        content=content,
-                        url=article_url,
-                        source=self.source_name,
-                        date=date
-                    )
-                    
-                    articles.append(article)
-                    count += 1
-                    logger.info(f"Scraped article: {article.title}")
-                    
-                    # Be nice to the server
-                    time.sleep(random.uniform(1, 3))
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping article: {e}")
-                    continue
         
         except Exception as e:
             logger.error(f"Error scraping {self.source_name}: {e}")
-        
-        return articles
-
-class HuggingFaceBlogScraper:
-    """Scraper for Hugging Face blog"""
     
-    def __init__(self):
-        self.base_url = "https://huggingface.co/blog"
-        self.source_name = "Hugging Face"
-    
-    def scrape_articles(self, limit=5):
+    def _fetch_tiers(self, article_urls, card_data):
         """
-        Scrape articles from Hugging Face blog
+        Order article URLs for fetching by what their listing cards show
+        
+        Cards whose title and preview match no relevance keyword are clearly
+        off-topic; depending on the prefilter mode they are fetched only after
+        all other cards, or not at all. Cards without a preview are never
+        judged on their title alone.
         
         Args:
-            limit: Maximum number of articles to scrape
+            article_urls: Article URLs in listing order
+            card_data: Dictionary mapping each URL to its (card title, preview)
             
         Returns:
-            List of ArticleInfo objects
+            List of URL lists, fetched in turn until the limit is reached
         """
-        logger.info(f"Scraping {self.source_name}...")
-        articles = []
-        
-        try:
-            soup = get_soup(self.base_url)
-            if not soup:
-                return articles
-            
-            # Find article cards on the main page
-            article_cards = soup.select("a.group")
-            
-            count = 0
-            for card in article_cards:
-                if count >= limit:
-                    break
-                
-                try:
-                    # Extract article URL
-                    article_url = urljoin(self.base_url, card.get("href"))
-                    
-                    # Get article page
-                    article_soup = get_soup(article_url)
-                    if not article_soup:
-                        continue
-                    
-                    # Extract title
-                    title_elem = article_soup.select_one("h1")
-                    title = title_elem.get_text() if title_elem else ""
-                    
-                    # Extract date
-                    date_elem = article_soup.select_one("time")
-                    date = date_elem.get("datetime").split("T")[0] if date_elem else None
-                    
-                    # Extract content
-                    content_elems = article_soup.select("div.prose p")
-                    content = " ".join([p.get_text() for p in content_elems])
-                    
-                    # Check if article is relevant to AI
-                    if not is_relevant(title, content):
-                        continue
-                    
-                    # Create article object
-                    article = ArticleInfo(
-                        title=title,
-                        content=content,
-                        url=article_url,
-                        source=self.source_name,
-                        date=date
-                    )
-                    
-                    articles.append(article)
-                    count += 1
-                    logger.info(f"Scraped article: {article.title}")
-                    
-                    # Be nice to the server
-                    time.sleep(random.uniform(1, 3))
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping article: {e}")
-                    continue
-        
-        except Exception as e:
-            logger.error(f"Error scraping {self.source_name}: {e}")
+        if self.prefilter == "off":
+            return [article_urls]
+        
+        candidates, unlikely = [], []
+        for article_url in article_urls:
+            card_title, preview_text = card_data[article_url]
+            if preview_text and not is_relevant(card_title, preview_text):
+                unlikely.append(article_url)
+            else:
+                candidates.append(article_url)
         
-        return articles
-
-class VentureBeatAIScraper:
-    """Scraper for VentureBeat AI section"""
+        if self.prefilter == "skip":
+            self.fetch_stats["skipped"] += len(unlikely)
+            return [candidates]
+        self.fetch_stats["deprioritized"] += len(unlikely)
+        return [candidates, unlikely]
     
-    def __init__(self):
-        self.base_url = "https://venturebeat.com/category/ai/"
-        self.source_name = "VentureBeat"
-    
-    def scrape_articles(self, limit=5):
+    def _listing_articles(self, article_urls, card_data, limit, spool=None):
         """
-        Scrape articles from VentureBeat AI section
+        Yield articles built from listing cards alone, without fetching article pages
         
         Args:
-            limit: Maximum number of articles to scrape
+            article_urls: Article URLs in listing order
+            card_data: Dictionary mapping each URL to its (card title, preview)
+            limit: Maximum number of articles to yield
+            spool: Optional TextSpool
             
-        Returns:
-            List of ArticleInfo objects
+        Yields:
+            ArticleInfo objects whose content is the card preview
         """
-        logger.info(f"Scraping {self.source_name}...")
-        articles = []
-        
-        try:
-            soup = get_soup(self.base_url)
-            if not soup:
-                return articles
+        count = 0
+        for article_url in article_urls:
+            if count >= limit:
+                break
             
-            # Find article cards on the main page
-            article_cards = soup.select("article.ArticleListing")
+            card_title, preview_text = card_data[article_url]
             
-            count = 0
-            for card in article_cards:
-                if count >= limit:
-                    break
-                
-                try:
-                    # Extract article URL
-                    link_elem = card.select_one("a.ArticleListing__title-link")
-                    if not link_elem:
-                        continue
-                    
-                    article_url = link_elem.get("href")
-                    
-                    # Get article page
-                    article_soup = get_soup(article_url)
-                    if not article_soup:
-                        continue
-                    
-                    # Extract title
-                    title_elem = article_soup.select_one("h1.article-title")
-                    title = title_elem.get_text() if title_elem else ""
-                    
-                    # Extract date
-                    date_elem = article_soup.select_one("time")
-                    date = date_elem.get("datetime").split("T")[0] if date_elem else None
-                    
-                    # Extract content
-                    content_elems = article_soup.select("div.article-content p")
-                    content = " ".join([p.get_text() for p in content_elems])
-                    
-                    # Check if article is relevant to AI
-                    if not is_relevant(title, content):
-                        continue
-                    
-                    # Create article object
-                    article = ArticleInfo(
-                        title=title,
-                        content=content,
-                        url=article_url,
-                        source=self.source_name,
-                        date=date
-                    )
-                    
-                    articles.append(article)
-                    count += 1
-                    logger.info(f"Scraped article: {article.title}")
-                    
-                    # Be nice to the server
-                    time.sleep(random.uniform(1, 3))
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping article: {e}")
-                    continue
-        
-        except Exception as e:
-            logger.error(f"Error scraping {self.source_name}: {e}")
-        
-        return articles
+            relevant, category = classify_article(card_title, preview_text)
+            if not relevant:
+                continue
+            
+            article = ArticleInfo(
+                title=card_title,
+                content=preview_text,
+                url=article_url,
+                source=self.source_name,
+                category=category,
+                spool=spool
+            )
+            
+            count += 1
+            self.fetch_stats["listing_only"] += 1
+            logger.info(f"Scraped article from listing: {article.title}")
+            yield article
+    
+    @staticmethod
+    def _select_text(soup, selector):
+        """Return the text of the first element matching selector, or an empty string"""
+        if not selector:
+            return ""
+        elem = soup.select_one(selector)
+        return elem.get_text() if elem else ""
 
 class RSSFeedScraper:
     """Generic RSS feed scraper"""
     
-    def __init__(self, feed_url, source_name):
+    def __init__(self, feed_url, source_name, limit=None, parser="stream"):
+        """
+        Args:
+            feed_url: URL of the RSS or Atom feed
+            source_name: Source name shown in the report
+            limit: Optional number of articles overriding the per-source default
+            parser: "stream" parses entries incrementally and stops at the limit,
+                falling back to feedparser for malformed feeds; "feedparser"
+                always parses the whole feed with feedparser
+        """
         self.feed_url = feed_url
         self.source_name = source_name
+        self.limit = limit
+        self.parser = parser
+        self.fetch_stats = Counter()
     
-    def scrape_articles(self, limit=5):
+    def scrape_articles(self, limit=5, executor=None, seen_urls=None, spool=None):
         """
         Scrape articles from an RSS feed
         
         Args:
             limit: Maximum number of articles to scrape
+            executor: Unused; feeds are fetched in a single request
+            seen_urls: Optional SeenURLStore; entries reported in earlier runs are skipped
+            spool: Optional TextSpool that keeps full article texts on disk
             
         Returns:
             List of ArticleInfo objects
         """
+        return list(self.iter_articles(limit, executor, seen_urls, spool))
+    
+    def iter_articles(self, limit=5, executor=None, seen_urls=None, spool=None):
+        """
+        Yield articles from an RSS feed as they are extracted
+        
+        Args:
+            limit: Maximum number of articles to scrape
+            executor: Unused; feeds are fetched in a single request
+            seen_urls: Optional SeenURLStore; entries reported in earlier runs are skipped
+            spool: Optional TextSpool that keeps full article texts on disk
+            
+        Yields:
+            ArticleInfo objects
+        """
         logger.info(f"Scraping {self.source_name} RSS feed...")
-        articles = []
         
         try:
-            feed = feedparser.parse(self.feed_url)
+            response = fetch_url(self.feed_url)
+            self.fetch_stats["listing"] += 1
+            if response is None:
+                return
+            
+            # Parse the downloaded bytes so the parser does not open its own connection
+            response_headers = {key.lower(): value for key, value in response.headers.items()}
+            if self.parser == "feedparser":
+                entries = iter_feedparser_entries(response.content, response_headers)
+            else:
+                entries = iter_feed(response.content, response_headers)
             
             count = 0
-            for entry in feed.entries:
-                if count >= limit:
-                    break
-                
+            for entry in entries:
                 try:
                     # Extract article information
                     title = entry.title
                     
-                    # Extract content
-                    content = ""
-                    if 'content' in entry:
-                        content = " ".join([c.value for c in entry.content])
-                    elif 'summary' in entry:
-                        content = entry.summary
-                    
                     # Clean HTML from content
-                    soup = BeautifulSoup(content, 'html.parser')
-                    content = soup.get_text()
+                    content = strip_html(entry.content)
                     
-                    # Extract URL
+                    # Extract URL, skipping entries reported in an earlier run
                     url = entry.link
+                    if seen_urls is not None and not seen_urls.is_new(url):
+                        continue
                     
                     # Extract date
-                    date = None
-                    if 'published_parsed' in entry:
-                        date_tuple = entry.published_parsed
-                        date = time.strftime("%Y-%m-%d", date_tuple)
+                    date = entry.date
                     
-                    # Check if article is relevant to AI
-                    if not is_relevant(title, content):
+                    # Check if article is relevant to AI and categorize it in the same pass
+                    relevant, category = classify_article(title, content)
+                    if not relevant:
                         continue
                     
                     # Create article object
@@ -682,78 +730,226 @@ class RSSFeedScraper:
                         content=content,
                         url=url,
                         source=self.source_name,
-                        date=date
+                        date=date,
+                        category=category,
+                        spool=spool
                     )
                     
-                    articles.append(article)
                     count += 1
                     logger.info(f"Scraped article: {article.title}")
+                    yield article
                     
                 except Exception as e:
                     logger.error(f"Error scraping RSS entry: {e}")
                     continue
+                
+                # Stop before the parser reads any further into the feed
+                if count >= limit:
+                    break
         
         except Exception as e:
             logger.error(f"Error scraping {self.source_name} RSS feed: {e}")
+
+def load_sources(path=DEFAULT_SOURCES_PATH):
+    """
+    Load the source registry
+    
+    Args:
+        path: Path of the TOML source registry
         
-        return articles
+    Returns:
+        List of source configuration dictionaries
+    """
+    with open(path, "rb") as f:
+        sources = tomllib.load(f).get("source", [])
+    
+    for source in sources:
+        if source.get("type") not in REQUIRED_SOURCE_KEYS:
+            raise ValueError(f"Source {source.get('name')!r} in {path} has unknown type {source.get('type')!r}")
+        required = ("name", "url") + REQUIRED_SOURCE_KEYS[source["type"]]
+        if source.get("depth", "detail") not in SOURCE_DEPTHS:
+            raise ValueError(f"Source {source.get('name')!r} in {path} has unknown depth {source['depth']!r}")
+        if source.get("prefilter", "deprioritize") not in PREFILTER_MODES:
+            raise ValueError(f"Source {source.get('name')!r} in {path} has unknown prefilter {source['prefilter']!r}")
+        if source.get("parser", "stream") not in FEED_PARSERS:
+            raise ValueError(f"Source {source.get('name')!r} in {path} has unknown parser {source['parser']!r}")
+        if source.get("depth") == "listing":
+            # Listing-only sources never read article pages
+            required = tuple(key for key in required if key != "content")
+        missing = [key for key in required if key not in source]
+        if missing:
+            raise ValueError(f"Source {source.get('name')!r} in {path} is missing {', '.join(missing)}")
+    
+    return sources
+
+def build_scrapers(sources):
+    """
+    Create a scraper for every configured source
+    
+    Args:
+        sources: List of source configuration dictionaries
+        
+    Returns:
+        List of scraper objects
+    """
+    scrapers = []
+    for source in sources:
+        if source["type"] == "html":
+            scrapers.append(HTMLSourceScraper(source))
+        else:
+            scrapers.append(RSSFeedScraper(source["url"], source["name"], limit=source.get("limit"),
+                                           parser=source.get("parser", "stream")))
+    return scrapers
 
-def scrape_all_sources(articles_per_source=3):
+def scrape_all_sources(articles_per_source=3, concurrent=False, max_workers=DEFAULT_MAX_WORKERS,
+                       seen_urls=None, sources=None, spool=None, signatures=None, sink=None, store=None):
     """
     Scrape articles from all sources
     
+    Articles stream from the scrapers through deduplication into the sinks as
+    they are scraped, so an optional JSONLSink holds every article scraped
+    before a crash.
+    
     Args:
-        articles_per_source: Number of articles to scrape from each source
+        articles_per_source: Number of articles to scrape from each source,
+            unless the source sets its own limit
+        concurrent: Scrape sources in parallel and fetch article pages
+            concurrently, bounded by PER_HOST_CONCURRENCY requests per host
+            and the per-host rate limits of the politeness scheduler
+        max_workers: Maximum number of concurrent page fetches in concurrent mode
+        seen_urls: Optional SeenURLStore; articles reported in earlier runs
+            are skipped without fetching them again. It is only read here; the
+            caller adds the URLs of the articles it reports
+        sources: Optional list of source configurations, defaults to sources.toml
+        spool: Optional TextSpool that keeps full article texts on disk;
+            without it only excerpts are kept
+        signatures: Optional SignatureStore; stories reported in earlier runs
+            are dropped as duplicates. The kept articles' signatures are only
+            staged; the caller commits those of the articles it reports
+        sink: Optional JSONLSink that receives each article as soon as it is kept
+        store: Optional ArticleStore; the kept articles are upserted in one
+            transaction as a new run
         
     Returns:
         Dictionary with articles categorized by type
     """
-    all_articles = []
-    
     # Initialize scrapers
-    scrapers = [
-        MITTechnologyReviewScraper(),
-        DeepMindBlogScraper(),
-        OpenAIBlogScraper(),
-        HuggingFaceBlogScraper(),
-        VentureBeatAIScraper(),
-        RSSFeedScraper("https://www.deeplearning.ai/feed/", "DeepLearning.AI"),
-        RSSFeedScraper("https://aiweekly.co/issues.rss", "AI Weekly"),
-        RSSFeedScraper("https://thegradient.pub/rss/", "The Gradient"),
-        RSSFeedScraper("https://www.topbots.com/feed/", "TopBots"),
-        RSSFeedScraper("https://syncedreview.com/feed/", "Synced Review"),
-        RSSFeedScraper("https://towardsdatascience.com/feed", "Towards Data Science"),
-        RSSFeedScraper("https://www.allenai.org/blog/rss.xml", "Allen AI"),
-        RSSFeedScraper("https://spectrum.ieee.org/feeds/topic/artificial-intelligence.rss", "IEEE Spectrum"),
-        RSSFeedScraper("https://techcrunch.com/tag/artificial-intelligence/feed/", "TechCrunch")
-    ]
+    if sources is None:
+        sources = load_sources()
+    scrapers = build_scrapers(sources)
+    
+    # Syndicated stories appear on several sources; keep one copy of each
+    deduplicator = StreamingDeduplicator(store=signatures)
+    collector = ArticleCollector()
+    sinks = [collector] if sink is None else [collector, sink]
+    
+    if concurrent:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch") as fetch_executor:
+            articles = iter_sources_concurrently(scrapers, articles_per_source, max_workers, seen_urls, spool,
+                                                 executor=fetch_executor)
+            run_pipeline(articles, deduplicator, sinks)
+    else:
+        # Scrape articles from each source; the politeness scheduler paces
+        # requests per host, so no pause is needed between sources
+        articles = (
+            article
+            for scraper in scrapers
+            for article in scraper.iter_articles(limit=scraper.limit or articles_per_source,
+                                                 seen_urls=seen_urls, spool=spool)
+        )
+        run_pipeline(articles, deduplicator, sinks)
+    
+    client = get_client()
+    client.log_connection_stats()
+    client.log_cache_stats()
+    get_breakers().log_stats()
+    if seen_urls is not None:
+        seen_urls.log_stats()
+    log_fetch_stats(scrapers)
+    deduplicator.log_stats()
+    if signatures is not None:
+        signatures.log_stats()
+    
+    # Report sources in configuration order, whatever order they finished in
+    articles = in_source_order(collector.articles(), scrapers)
+    if store is not None:
+        store.upsert_articles(articles)
+    return categorize_articles(articles)
+
+def log_fetch_stats(scrapers):
+    """
+    Log the pages each scraper fetched and the article page fetches it avoided
     
-    # Scrape articles from each source
+    Args:
+        scrapers: List of scraper objects that have run
+    """
+    totals = Counter()
     for scraper in scrapers:
-        articles = scraper.scrape_articles(limit=articles_per_source)
-        all_articles.extend(articles)
-        
-        # Be nice to servers between different sources
-        time.sleep(random.uniform(2, 5))
+        stats = scraper.fetch_stats
+        totals.update(stats)
+        if stats["skipped"] or stats["deprioritized"] or stats["listing_only"]:
+            logger.info(f"{scraper.source_name}: {stats['detail']} article pages fetched, "
+                        f"{stats['skipped']} skipped and {stats['deprioritized']} deprioritized by the preview "
+                        f"filter, {stats['listing_only']} articles taken from the listing")
+    logger.info(f"Fetches this run: {totals['listing']} listing pages and feeds, {totals['detail']} article pages; "
+                f"{totals['skipped']} article pages skipped by the preview filter, "
+                f"{totals['listing_only']} articles taken from listings without fetching their pages")
+
+def in_source_order(articles, scrapers):
+    """Sort articles by the position of their source in scrapers, keeping each source's order"""
+    source_order = {scraper.source_name: i for i, scraper in enumerate(scrapers)}
+    return sorted(articles, key=lambda article: source_order.get(article.source, len(scrapers)))
+
+def iter_sources_concurrently(scrapers, articles_per_source, max_workers=DEFAULT_MAX_WORKERS, seen_urls=None,
+                              spool=None, executor=None, queue_size=DEFAULT_QUEUE_SIZE):
+    """
+    Run scrapers in parallel and yield their articles as they arrive
+    
+    Sources run on their own threads so that a slow source never holds a fetch
+    worker while it waits for its article pages. Articles are handed over
+    through a bounded queue, so sources pause while the consumer is behind.
     
-    # Categorize articles
+    Args:
+        scrapers: List of scraper objects
+        articles_per_source: Number of articles to scrape from each source,
+            unless the source sets its own limit
+        max_workers: Maximum number of sources scraped at once
+        seen_urls: Optional SeenURLStore shared by all scrapers
+        spool: Optional TextSpool shared by all scrapers
+        executor: Executor for article page fetches shared by all scrapers
+        queue_size: Maximum number of articles waiting for the consumer
+        
+    Yields:
+        ArticleInfo objects in arrival order
+    """
+    producers = [
+        (scraper.source_name, partial(scraper.iter_articles, limit=scraper.limit or articles_per_source,
+                                      executor=executor, seen_urls=seen_urls, spool=spool))
+        for scraper in scrapers
+    ]
+    yield from merge_streams(producers, max_workers, queue_size)
+
+def categorize_articles(articles):
+    """
+    Group articles by category
+    
+    Args:
+        articles: List of ArticleInfo objects
+        
+    Returns:
+        Dictionary with articles categorized by type
+    """
     categorized_articles = {
         "general": [],
         "defense_security": [],
         "tools_innovations": []
     }
     
-    for article in all_articles:
+    for article in articles:
         categorized_articles[article.category].append(article.to_dict())
     
     return categorized_articles
 
-def save_articles_to_json(articles, filename="ai_news_articles.json"):
-    """Save articles to a JSON file"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(articles, f, ensure_ascii=False, indent=2)
-    logger.info(f"Saved {sum(len(v) for v in articles.values())} articles to {filename}")
-
 def generate_markdown_report(articles, filename="daily_ai_news_report.md"):
     """
     Generate a markdown report from the scraped articles
@@ -762,45 +958,19 @@ def generate_markdown_report(articles, filename="daily_ai_news_report.md"):
         articles: Dictionary with articles categorized by type
         filename: Output filename for the markdown report
     """
-    today = datetime.now().strftime("%B %d, %Y")
+    # Every article is reported; the daily job caps each section instead
+    report = build_report_data(articles, items_per_section=None)
     
     with open(filename, 'w', encoding='utf-8') as f:
-        # Write header
-        f.write(f"# Daily AI News Report\n\n")
-        f.write(f"## Date: {today}\n\n")
-        
-        # Write general AI news
-        f.write(f"### General AI News\n\n")
-        for i, article in enumerate(articles["general"], 1):
-            f.write(f"{i}. **{article['title']}** - {article['content'][:200]}... (Source: {article['source']}) [Ref{i}]\n\n")
-        
-        # Write defense and security news
-        f.write(f"### AI in Defense and Security\n\n")
-        for i, article in enumerate(articles["defense_security"], 1):
-            f.write(f"{i}. **{article['title']}** - {article['content'][:200]}... (Source: {article['source']}) [Ref{i+len(articles['general'])}]\n\n")
-        
-        # Write tools and innovations news
-        f.write(f"### Important Tools and Innovations\n\n")
-        for i, article in enumerate(articles["tools_innovations"], 1):
-            f.write(f"{i}. **{article['title']}** - {article['content'][:200]}... (Source: {article['source']}) [Ref{i+len(articles['general'])+len(articles['defense_security'])}]\n\n")
-        
-        # Write references
-        f.write(f"## References\n\n")
-        ref_count = 1
-        
-        for category in ["general", "defense_security", "tools_innovations"]:
-            for article in articles[category]:
-                f.write(f"[Ref{ref_count}] {article['url']}\n")
-                ref_count += 1
+        f.write(render_markdown(report))
     
     logger.info(f"Generated markdown report: {filename}")
 
 if __name__ == "__main__":
-    # Scrape articles from all sources
-    articles = scrape_all_sources(articles_per_source=5)
-    
-    # Save articles to JSON
-    save_articles_to_json(articles)
+    # Scrape articles from all sources and keep them in the article store
+    store = ArticleStore()
+    articles = scrape_all_sources(articles_per_source=5, store=store)
+    store.close()
     
     # Generate markdown report
     generate_markdown_report(articles)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Seen URL Store - Persistent index of article URLs reported in earlier runs
+"""
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+logger = logging.getLogger("ai_news_scraper.seen")
+
+DEFAULT_SEEN_PATH = ".seen_urls.sqlite3"
+
+# Query parameters that only track the visitor and never change the article
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "_hsenc", "_hsmi", "ref", "ref_src", "cmpid", "guccounter", "guce_referrer"
+}
+TRACKING_PREFIXES = ("utm_",)
+
+def canonicalize_url(url):
+    """
+    Normalize an article URL so that variants of the same link compare equal
+
+    The scheme is folded to https, the host is lowercased without "www." or a
+    default port, tracking parameters and the fragment are dropped, remaining
+    query parameters are sorted and a trailing slash is removed.
+
+    Args:
+        url: Article URL
+
+    Returns:
+        Canonical URL string
+    """
+    parts = urlsplit(url.strip())
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+class SeenURLStore:
+    """
+    SQLite-backed set of canonical article URLs
+
+    Scrapers only read the set; the daily job adds the URLs of the articles in
+    a report once it is saved, so an article dropped by deduplication or the
+    section cap, or scraped by a run that failed, is scraped again next time.
+    """
+
+    def __init__(self, path=DEFAULT_SEEN_PATH):
+        """
+        Open or create a store
+
+        Args:
+            path: SQLite database file, or ":memory:" for a throwaway store
+        """
+        self.path = path
+        self.skipped = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_urls (
+                url_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                first_seen TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self._conn.commit()
+
+    def __contains__(self, url):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_urls WHERE url_key = ?", (canonicalize_url(url),)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen_urls").fetchone()[0]
+
+    def is_new(self, url):
+        """
+        Check whether a URL was not seen before, counting it as skipped if it was
+
+        Args:
+            url: Article URL
+
+        Returns:
+            True if the URL is new
+        """
+        if url in self:
+            with self._lock:
+                self.skipped += 1
+            return False
+        return True
+
+    def filter_new(self, urls):
+        """
+        Drop URLs that were already seen, counting them as skipped
+
+        Args:
+            urls: Iterable of URLs
+
+        Returns:
+            List of URLs not seen before, in their original order
+        """
+        return [url for url in urls if self.is_new(url)]
+
+    def add(self, url):
+        """Mark a URL as seen"""
+        self.add_many([url])
+
+    def add_many(self, urls):
+        """Mark URLs as seen in one transaction"""
+        first_seen = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_urls (url_key, url, first_seen) VALUES (?, ?, ?)",
+                [(canonicalize_url(url), url, first_seen) for url in urls]
+            )
+            self._conn.commit()
+
+    def log_stats(self):
+        """Log how many already-reported articles were skipped in this run"""
+        logger.info(f"Seen URL store: skipped {self.skipped} already-reported articles, {len(self)} URLs indexed")
+
+    def close(self):
+        """Close the store database"""
+        with self._lock:
+            self._conn.close()
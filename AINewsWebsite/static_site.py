@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Static Site - Pre-rendered, pre-compressed HTML page of the daily report
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+from datetime import datetime
+from html import escape
+
+# Brotli is in requirements.txt; an environment installed without it writes
+# only gzip copies, and build_site warns on every build
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+logger = logging.getLogger("ai_news_generator.static_site")
+
+SITE_DIR = "static"
+STYLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.css")
+# Hex digits of the content hash in asset names, e.g. style.3f2a9c1d0b.css
+ASSET_HASH_LENGTH = 10
+
+# Layout for the standalone page, where the website gets it from Streamlit
+STATIC_PAGE_CSS = """
+body { margin: 0; }
+.main { padding: 2rem 1rem; }
+.page { max-width: 1200px; margin: 0 auto; }
+.control-grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; }
+@media (max-width: 768px) {
+    .control-grid { grid-template-columns: 1fr; }
+}
+"""
+
+CONTROL_CARDS_HTML = """<div class="control-grid">
+<div class="control-card">
+    <h3 class="card-title">📊 Report Status</h3>
+    <div class="card-content"><div class="status-badge">{status}</div></div>
+</div>
+<div class="control-card">
+    <h3 class="card-title">⚙️ Automation</h3>
+    <div class="card-content">
+        <strong>Schedule:</strong> 1:00 AM London time<br>
+        <strong>Sources:</strong> MIT Tech Review, DeepMind, OpenAI, and 20+ more<br>
+        <strong>Status:</strong> <span style="color: #10b981;">Active</span>
+    </div>
+</div>
+<div class="control-card">
+    <h3 class="card-title">📊 Quick Stats</h3>
+    <div class="card-content">
+        <strong>Sources:</strong> 25+ premium AI news outlets<br>
+        <strong>Content:</strong> 10-15 items per section (45 total)<br>
+        <strong>Updates:</strong> <span style="color: #10b981;">Daily at 1 AM</span>
+    </div>
+</div>
+</div>"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Daily AI News Report - {date}</title>
+<link rel="stylesheet" href="{stylesheet}">
+</head>
+<body class="main">
+<div class="page">
+<div class="header-section">
+    <h1 class="main-title">AI Intelligence Brief</h1>
+    <p class="subtitle">Comprehensive daily insights from 25+ premium AI news sources</p>
+    <div class="date-display">📅 {date}</div>
+</div>
+{controls}
+{report}
+<div class="footer-section">
+    <div class="footer-title">🤖 AI Intelligence System</div>
+    <div class="footer-content">
+        Comprehensive coverage • 45 daily news items • 25+ premium sources<br>
+        📧 Newsletter delivery • 🕐 Daily updates at 1 AM • 🔗 Direct article access
+    </div>
+</div>
+</div>
+</body>
+</html>
+"""
+
+def section_icon(section):
+    """Choose icon based on section"""
+    if "General" in section:
+        return "🤖"
+    elif "Defense" in section or "Security" in section:
+        return "🛡️"
+    elif "Tools" in section or "Innovation" in section:
+        return "🔧"
+    return "📰"
+
+def news_item_html(item):
+    """HTML of one clickable news item"""
+    source_text = f"(Source: {item['source']})" if item["source"] else ""
+    if item["ref"] is not None:
+        source_text += f" [Ref{item['ref']}]"
+    return f"""<a href="{escape(item['url'])}" target="_blank" class="news-item">
+    <div class="news-number">{item['number']}</div>
+    <div class="news-title">{escape(item['title'])}</div>
+    <div class="news-content">{escape(item['summary'])}</div>
+    <div class="news-source">{escape(source_text)}</div>
+    <div class="click-hint">🔗 Click to read full article</div>
+</a>"""
+
+def section_html(section):
+    """HTML of a report section with its news items"""
+    items = "\n".join(news_item_html(item) for item in section["items"])
+    return f"""<div class="news-container">
+<div class="section-header">
+    <span class="section-icon">{section_icon(section['title'])}</span>
+    <h2 class="section-title">{escape(section['title'])}</h2>
+</div>
+{items}
+</div>"""
+
+def references_html(references):
+    """HTML of the references section"""
+    links = "\n".join(
+        f'<a href="{escape(reference["url"])}" target="_blank" class="reference-link">'
+        f'<strong>[Ref{reference["ref"]}]</strong> {escape(reference["url"])}</a>'
+        for reference in references
+    )
+    return f"""<div class="news-container">
+<div class="section-header">
+    <span class="section-icon">📚</span>
+    <h2 class="section-title">References</h2>
+</div>
+<div class="references-section">
+{links}
+</div>
+</div>"""
+
+def report_blocks(report):
+    """
+    Render the report as one HTML block per section plus one for the references
+
+    Each block is a complete element, so it can be sent to the browser as a
+    single Streamlit markdown element.
+
+    Args:
+        report: Report dictionary from report_data.build_report_data
+
+    Returns:
+        List of HTML strings
+    """
+    return [section_html(section) for section in report["sections"]] + [references_html(report["references"])]
+
+def render_page(report, stylesheet):
+    """
+    Render the report as a standalone HTML page
+
+    Args:
+        report: Report dictionary from report_data.build_report_data
+        stylesheet: URL of the stylesheet, relative to the page
+
+    Returns:
+        HTML document
+    """
+    if report.get("generated_at"):
+        updated = datetime.fromisoformat(report["generated_at"]).strftime("%B %d, %Y at %I:%M %p")
+        status = f"Last updated: {updated}"
+    else:
+        status = "Report pending"
+    return PAGE_TEMPLATE.format(
+        date=escape(report["date"]),
+        stylesheet=escape(stylesheet),
+        controls=CONTROL_CARDS_HTML.format(status=status),
+        report="\n".join(report_blocks(report)),
+    )
+
+def write_precompressed(path, data):
+    """
+    Write a file with .gz and, when brotli is installed, .br copies beside it
+
+    The gzip copy has no timestamp, so unchanged content gives identical bytes.
+
+    Args:
+        path: Output file
+        data: File contents as bytes
+
+    Returns:
+        List of paths written
+    """
+    written = [path]
+    with open(path, "wb") as f:
+        f.write(data)
+    with open(f"{path}.gz", "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    written.append(f"{path}.gz")
+    if brotli is not None:
+        with open(f"{path}.br", "wb") as f:
+            f.write(brotli.compress(data))
+        written.append(f"{path}.br")
+    elif os.path.exists(f"{path}.br"):
+        # Never leave a stale brotli copy beside new content
+        os.remove(f"{path}.br")
+    return written
+
+def build_site(report, site_dir=SITE_DIR):
+    """
+    Pre-render the report page and its stylesheet into site_dir
+
+    The stylesheet is named after a hash of its content, so it can be cached
+    indefinitely; index.html is rewritten every day and points at the current
+    stylesheet. Stylesheets from earlier builds are removed.
+
+    Args:
+        report: Report dictionary from report_data.build_report_data
+        site_dir: Output directory
+
+    Returns:
+        List of paths written
+    """
+    if brotli is None:
+        logger.warning("brotli is not installed; writing gzip copies only. Install requirements.txt "
+                       "to publish .br copies")
+    os.makedirs(site_dir, exist_ok=True)
+    with open(STYLE_PATH, "r", encoding="utf-8") as f:
+        css = (f.read() + STATIC_PAGE_CSS).encode("utf-8")
+    stylesheet = f"style.{hashlib.sha256(css).hexdigest()[:ASSET_HASH_LENGTH]}.css"
+
+    for name in os.listdir(site_dir):
+        if name.startswith("style.") and not name.startswith(stylesheet):
+            os.remove(os.path.join(site_dir, name))
+
+    written = []
+    if not os.path.exists(os.path.join(site_dir, stylesheet)):
+        written += write_precompressed(os.path.join(site_dir, stylesheet), css)
+    page = render_page(report, stylesheet).encode("utf-8")
+    written += write_precompressed(os.path.join(site_dir, "index.html"), page)
+    logger.info(f"Built static site in {site_dir}: index.html ({len(page) // 1024} KiB) and {stylesheet}")
+    return written
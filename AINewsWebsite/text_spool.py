@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Text Spool - Keeps full article texts on disk instead of in memory
+"""
+
+import logging
+import os
+import tempfile
+import threading
+
+logger = logging.getLogger("ai_news_scraper.spool")
+
+class TextSpool:
+    """
+    Append-only file of UTF-8 texts addressed by (offset, length) spans
+
+    Articles keep only a short excerpt in memory; their full text is written
+    here and read back on demand.
+    """
+
+    def __init__(self, path=None):
+        """
+        Open a spool
+
+        Args:
+            path: File to append texts to, or None for an anonymous temporary
+                file that is deleted when the spool is closed
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        if path is None:
+            self._file = tempfile.TemporaryFile()
+        else:
+            self._file = open(path, "a+b")
+        self._file.seek(0, os.SEEK_END)
+        self._size = self._file.tell()
+
+    def write(self, text):
+        """
+        Append a text
+
+        Args:
+            text: Text to store
+
+        Returns:
+            (offset, length) span to pass to read()
+        """
+        data = text.encode("utf-8")
+        with self._lock:
+            offset = self._size
+            self._file.seek(offset)
+            self._file.write(data)
+            self._size += len(data)
+        return offset, len(data)
+
+    def read(self, span):
+        """
+        Read a text back
+
+        Args:
+            span: (offset, length) span returned by write()
+
+        Returns:
+            The stored text
+        """
+        offset, length = span
+        with self._lock:
+            self._file.flush()
+            self._file.seek(offset)
+            data = self._file.read(length)
+        return data.decode("utf-8")
+
+    def __len__(self):
+        """Return the number of bytes spooled"""
+        return self._size
+
+    def close(self):
+        """Close the spool file"""
+        with self._lock:
+            self._file.close()
+        logger.info(f"Spooled {self._size / 1024:.0f} KiB of article text")